@@ -46,6 +46,26 @@ from .lib import (
     create_write_node,
     link_knobs
 )
+from .scene_index import (
+    SceneIndex,
+    get_scene_index,
+    invalidate_scene_index,
+)
+from .group_index import (
+    GroupIndex,
+    get_instance_group_index,
+    invalidate_instance_group_index,
+)
+from .publish_cache import (
+    PublishCache,
+    get_publish_cache,
+    get_instance_cache_key,
+    release_publish_cache,
+)
+from .render_manifest import (
+    read_render_manifest,
+    write_render_manifest,
+)
 from .utils import (
     colorspace_exists_on_node,
     get_colorspace_list
@@ -98,6 +118,22 @@ __all__ = (
     "create_write_node",
     "link_knobs",
 
+    "SceneIndex",
+    "get_scene_index",
+    "invalidate_scene_index",
+
+    "GroupIndex",
+    "get_instance_group_index",
+    "invalidate_instance_group_index",
+
+    "PublishCache",
+    "get_publish_cache",
+    "get_instance_cache_key",
+    "release_publish_cache",
+
+    "read_render_manifest",
+    "write_render_manifest",
+
     "colorspace_exists_on_node",
     "get_colorspace_list",
 
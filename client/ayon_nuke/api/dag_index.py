@@ -0,0 +1,247 @@
+"""Spatial index of node rectangles in node graph (DAG).
+
+Screen rectangles of nodes are read once and stored in a uniform grid,
+so containment queries like "nodes inside of backdrop" are answered by
+testing only nodes in the grid cells overlapped by the queried
+rectangle instead of all nodes of the script.
+
+Index is a snapshot, it has to be synchronized with `sync` or rebuilt
+when nodes are moved.
+"""
+import collections
+
+import nuke
+
+# grid cell size in DAG units, roughly a few nodes wide
+DEFAULT_CELL_SIZE = 256
+
+
+def get_node_rect(node):
+    """Screen rectangle of a node.
+
+    Args:
+        node (nuke.Node): Node in DAG.
+
+    Returns:
+        tuple[int, int, int, int]: Left, top, right and bottom.
+    """
+    left = node.xpos()
+    top = node.ypos()
+    if node.Class() == "BackdropNode":
+        width = node["bdwidth"].value()
+        height = node["bdheight"].value()
+    else:
+        width = node.screenWidth()
+        height = node.screenHeight()
+    return left, top, left + width, top + height
+
+
+class DagSpatialIndex(object):
+    """Uniform grid of node rectangles.
+
+    Args:
+        nodes (Iterable[nuke.Node]): Indexed nodes.
+        cell_size (Optional[int]): Size of grid cell in DAG units.
+    """
+
+    def __init__(self, nodes, cell_size=DEFAULT_CELL_SIZE):
+        self._cell_size = cell_size
+        self._reset(nodes)
+
+    def _reset(self, nodes):
+        self._nodes = []
+        self._rects = []
+        self._index_by_name = {}
+        self._cells = collections.defaultdict(list)
+        self._backdrop_indexes = set()
+        for node in nodes:
+            self._add_node(node)
+
+    @classmethod
+    def build(cls, group=None, cell_size=DEFAULT_CELL_SIZE):
+        """Index all nodes of a group.
+
+        Args:
+            group (Optional[nuke.Node]): Group node, root when not passed.
+            cell_size (Optional[int]): Size of grid cell in DAG units.
+
+        Returns:
+            DagSpatialIndex: Index of nodes in the group.
+        """
+        if group is None:
+            group = nuke.root()
+        return cls(nuke.allNodes(group=group), cell_size)
+
+    @property
+    def nodes(self):
+        """list[nuke.Node]: Indexed nodes."""
+        return list(self._nodes)
+
+    def _add_node(self, node):
+        index = len(self._nodes)
+        rect = get_node_rect(node)
+        self._nodes.append(node)
+        self._rects.append(rect)
+        self._index_by_name[node.fullName()] = index
+        if node.Class() == "BackdropNode":
+            self._backdrop_indexes.add(index)
+        for cell in self._iter_cells(rect):
+            self._cells[cell].append(index)
+
+    def sync(self, nodes):
+        """Update index to current rectangles of nodes.
+
+        Moved nodes are re-indexed in place, whole index is rebuilt when
+        set of node names differs from indexed nodes.
+
+        Args:
+            nodes (Iterable[nuke.Node]): Nodes which should be indexed.
+        """
+        nodes = list(nodes)
+        names = {node.fullName() for node in nodes}
+        if len(names) != len(nodes) or names != set(self._index_by_name):
+            self._reset(nodes)
+            return
+
+        for node in nodes:
+            index = self._index_by_name[node.fullName()]
+            self._nodes[index] = node
+            rect = get_node_rect(node)
+            old_rect = self._rects[index]
+            if rect == old_rect:
+                continue
+            for cell in self._iter_cells(old_rect):
+                self._cells[cell].remove(index)
+            self._rects[index] = rect
+            for cell in self._iter_cells(rect):
+                self._cells[cell].append(index)
+
+    def _iter_cells(self, rect):
+        left, top, right, bottom = rect
+        size = self._cell_size
+        for cell_x in range(int(left // size), int(right // size) + 1):
+            for cell_y in range(int(top // size), int(bottom // size) + 1):
+                yield cell_x, cell_y
+
+    def _get_candidates(self, rect):
+        indexes = set()
+        for cell in self._iter_cells(rect):
+            indexes.update(self._cells.get(cell, ()))
+        return sorted(indexes)
+
+    def get_rect(self, node):
+        """Indexed rectangle of a node.
+
+        Args:
+            node (nuke.Node): Indexed node.
+
+        Returns:
+            tuple[int, int, int, int]: Left, top, right and bottom.
+        """
+        return self._rects[self._index_by_name[node.fullName()]]
+
+    def get_nodes_in_rect(self, rect, exclude_classes=None):
+        """Nodes which are completely inside of rectangle.
+
+        Node touching the border of the rectangle is not inside of it,
+        so backdrop is never inside of itself.
+
+        Args:
+            rect (tuple[int, int, int, int]): Left, top, right, bottom.
+            exclude_classes (Optional[Iterable[str]]): Skipped classes.
+
+        Returns:
+            list[nuke.Node]: Nodes in order of the index.
+        """
+        exclude_classes = set(exclude_classes or [])
+        left, top, right, bottom = rect
+        nodes = []
+        for index in self._get_candidates(rect):
+            node_left, node_top, node_right, node_bottom = self._rects[index]
+            if not (
+                node_left > left
+                and node_right < right
+                and node_top > top
+                and node_bottom < bottom
+            ):
+                continue
+            node = self._nodes[index]
+            if node.Class() in exclude_classes:
+                continue
+            nodes.append(node)
+        return nodes
+
+    def get_backdrop_nodes(self, backdrop, exclude_classes=("Viewer",)):
+        """Nodes inside of backdrop node, including nested backdrops.
+
+        Args:
+            backdrop (nuke.Node): Backdrop node.
+            exclude_classes (Optional[Iterable[str]]): Skipped classes.
+
+        Returns:
+            list[nuke.Node]: Nodes inside of the backdrop.
+        """
+        return self.get_nodes_in_rect(
+            get_node_rect(backdrop), exclude_classes)
+
+    def get_backdrops_containing(self, node):
+        """Backdrop nodes which are containing the node.
+
+        Args:
+            node (nuke.Node): Node in DAG.
+
+        Returns:
+            list[nuke.Node]: Backdrops from outermost to innermost.
+        """
+        left, top, right, bottom = get_node_rect(node)
+        indexes = []
+        for index in self._get_candidates((left, top, right, bottom)):
+            if index not in self._backdrop_indexes:
+                continue
+            bd_left, bd_top, bd_right, bd_bottom = self._rects[index]
+            if (
+                left > bd_left
+                and right < bd_right
+                and top > bd_top
+                and bottom < bd_bottom
+            ):
+                indexes.append(index)
+
+        # outer backdrops are larger
+        indexes.sort(key=lambda index: -self._get_area(self._rects[index]))
+        return [self._nodes[index] for index in indexes]
+
+    def get_bounds(self, exclude_nodes=None):
+        """Bounding rectangle of indexed nodes.
+
+        Args:
+            exclude_nodes (Optional[Iterable[nuke.Node]]): Nodes which
+                are not included in bounds.
+
+        Returns:
+            Union[tuple[int, int, int, int], None]: Left, top, right and
+                bottom or None if there are no nodes.
+        """
+        exclude_names = {
+            node.fullName() for node in exclude_nodes or []
+        }
+        bounds = None
+        for node, rect in zip(self._nodes, self._rects):
+            if exclude_names and node.fullName() in exclude_names:
+                continue
+            if bounds is None:
+                bounds = list(rect)
+                continue
+            bounds[0] = min(bounds[0], rect[0])
+            bounds[1] = min(bounds[1], rect[1])
+            bounds[2] = max(bounds[2], rect[2])
+            bounds[3] = max(bounds[3], rect[3])
+
+        if bounds is None:
+            return None
+        return tuple(bounds)
+
+    @staticmethod
+    def _get_area(rect):
+        left, top, right, bottom = rect
+        return (right - left) * (bottom - top)
@@ -0,0 +1,231 @@
+"""Occupancy of node graph (DAG) used for placing of new nodes.
+
+Occupancy map of a group keeps node rectangles in a coarse grid, so
+holes big enough for pasted nodes are found with a summed area table
+instead of testing each candidate position against all nodes.
+
+Positions of nodes changed from code do not trigger knob callbacks, so
+the map is built from current node positions for each query and is not
+kept between queries. A query costs one pass over nodes of the group
+plus hole search over grid cells of their bounding box, which is
+skipped for large or sparse grids. Incremental maintenance with
+sub-linear queries is not implemented.
+"""
+import math
+
+import nuke
+
+from .dag_index import get_node_rect
+
+# grid cell size in DAG units
+DEFAULT_CELL_SIZE = 100
+# hole search is skipped for larger grids, nodes are placed next to
+# bounding box of the group in such case
+MAX_HOLE_SEARCH_CELLS = 250000
+# hole search is skipped when grid has more cells per node, sparse
+# graphs are cheaper to extend at bounding box
+MAX_HOLE_SEARCH_CELLS_PER_NODE = 64
+
+
+class DagOccupancyMap(object):
+    """Node rectangles of a group in a coarse grid.
+
+    The map is a snapshot of node positions at the time nodes were
+    added, it is not updated when nodes are moved or deleted.
+
+    Args:
+        nodes (Iterable[nuke.Node]): Nodes of the group.
+        cell_size (Optional[int]): Size of grid cell in DAG units.
+    """
+
+    def __init__(self, nodes=None, cell_size=DEFAULT_CELL_SIZE):
+        self._cell_size = cell_size
+        self._rects = {}
+        self._cells = {}
+        for node in nodes or []:
+            self.add_node(node)
+
+    def _iter_cells(self, rect):
+        left, top, right, bottom = rect
+        size = self._cell_size
+        for cell_x in range(int(left // size), int(right // size) + 1):
+            for cell_y in range(int(top // size), int(bottom // size) + 1):
+                yield cell_x, cell_y
+
+    def add_node(self, node):
+        """Read current rectangle of node and store it.
+
+        Args:
+            node (nuke.Node): Node of the group.
+        """
+        if node.Class() == "Viewer":
+            return
+        node_id = node.fullName()
+        rect = get_node_rect(node)
+        self._rects[node_id] = rect
+        for cell in self._iter_cells(rect):
+            self._cells.setdefault(cell, set()).add(node_id)
+
+    def get_bounds(self, exclude_ids=None):
+        """Bounding rectangle of nodes.
+
+        Args:
+            exclude_ids (Optional[set[str]]): Full names of nodes which
+                are not included in bounds.
+
+        Returns:
+            Union[tuple[int, int, int, int], None]: Left, top, right and
+                bottom or None if there are no nodes.
+        """
+        bounds = None
+        for node_id, rect in self._rects.items():
+            if exclude_ids and node_id in exclude_ids:
+                continue
+            if bounds is None:
+                bounds = rect
+                continue
+            bounds = (
+                min(bounds[0], rect[0]),
+                min(bounds[1], rect[1]),
+                max(bounds[2], rect[2]),
+                max(bounds[3], rect[3]),
+            )
+        return bounds
+
+    def find_free_position(
+        self, width, height, direction="right", offset=300, exclude_ids=None
+    ):
+        """Find position for rectangle of nodes which is not occupied.
+
+        Holes inside of bounding box of nodes are searched first. Grid
+        cells are scanned in `direction`, e.g. for "bottom" row by row
+        from top. When there is no hole big enough the position is next
+        to the bounding box in `direction`.
+
+        Args:
+            width (int): Width of placed rectangle.
+            height (int): Height of placed rectangle.
+            direction (Optional[str]): One of "left", "right", "top" or
+                "bottom".
+            offset (Optional[int]): Minimal distance from other nodes.
+            exclude_ids (Optional[set[str]]): Full names of nodes which
+                are ignored, e.g. the placed nodes.
+
+        Returns:
+            Union[tuple[int, int], None]: Position of top left corner
+                or None if there are no other nodes.
+        """
+        bounds = self.get_bounds(exclude_ids)
+        if bounds is None:
+            return None
+
+        position = self._find_hole(
+            bounds, width, height, direction, abs(offset), exclude_ids)
+        if position is not None:
+            return position
+
+        min_x, min_y, max_x, max_y = bounds
+        if direction in "left":
+            return min_x - abs(width) - abs(offset), min_y
+        if direction in "top":
+            return min_x, min_y - abs(height) - abs(offset)
+        if direction in "bottom":
+            return min_x, max_y + abs(offset)
+        return max_x + abs(offset), min_y
+
+    def _find_hole(
+        self, bounds, width, height, direction, offset, exclude_ids
+    ):
+        size = self._cell_size
+        min_x, min_y, max_x, max_y = bounds
+        first_col = int(min_x // size)
+        first_row = int(min_y // size)
+        cols = int(max_x // size) - first_col + 1
+        rows = int(max_y // size) - first_row + 1
+        need_cols = int(math.ceil((abs(width) + 2 * offset) / float(size)))
+        need_rows = int(math.ceil((abs(height) + 2 * offset) / float(size)))
+        if (
+            need_cols > cols
+            or need_rows > rows
+            or cols * rows > MAX_HOLE_SEARCH_CELLS
+            or cols * rows > (
+                MAX_HOLE_SEARCH_CELLS_PER_NODE * len(self._rects))
+        ):
+            return None
+
+        # summed area table of occupied cells
+        table = [[0] * (cols + 1)]
+        for row in range(rows):
+            previous = table[-1]
+            current = [0]
+            row_sum = 0
+            for col in range(cols):
+                node_ids = self._cells.get(
+                    (first_col + col, first_row + row))
+                if node_ids and (
+                    not exclude_ids or not node_ids <= exclude_ids
+                ):
+                    row_sum += 1
+                current.append(previous[col + 1] + row_sum)
+            table.append(current)
+
+        def _is_free(row, col):
+            bottom = row + need_rows
+            right = col + need_cols
+            return (
+                table[bottom][right]
+                - table[row][right]
+                - table[bottom][col]
+                + table[row][col]
+            ) == 0
+
+        # cells are scanned from the side named by direction, so the
+        # first free hole is the closest one to that side
+        row_range = range(rows - need_rows + 1)
+        col_range = range(cols - need_cols + 1)
+        if direction in "left":
+            candidates = (
+                (row, col)
+                for col in col_range
+                for row in row_range
+            )
+        elif direction in "top":
+            candidates = (
+                (row, col)
+                for row in row_range
+                for col in col_range
+            )
+        elif direction in "bottom":
+            candidates = (
+                (row, col)
+                for row in reversed(row_range)
+                for col in col_range
+            )
+        else:
+            candidates = (
+                (row, col)
+                for col in reversed(col_range)
+                for row in row_range
+            )
+
+        for row, col in candidates:
+            if _is_free(row, col):
+                return (
+                    (first_col + col) * size + offset,
+                    (first_row + row) * size + offset
+                )
+        return None
+
+
+def get_dag_occupancy_map(group=None):
+    """Build occupancy map of a group from current node positions.
+
+    Args:
+        group (Optional[nuke.Node]): Group node, root when not passed.
+
+    Returns:
+        DagOccupancyMap: Occupancy map of the group.
+    """
+    if group is None:
+        group = nuke.root()
+    return DagOccupancyMap(nuke.allNodes(group=group))
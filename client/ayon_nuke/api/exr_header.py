@@ -0,0 +1,200 @@
+"""Pure Python reader of OpenEXR file headers.
+
+Headers and offset tables are read without any image library, so
+truncated or zero-byte frames left by killed renders are detected by
+reading only a few kilobytes of each file.
+"""
+import os
+import struct
+
+EXR_MAGIC = 20000630
+
+# version field flags
+EXR_TILED_FLAG = 0x200
+EXR_NON_IMAGE_FLAG = 0x800
+EXR_MULTIPART_FLAG = 0x1000
+
+# scanlines per chunk by compression
+EXR_SCANLINES_PER_CHUNK = {
+    0: 1,  # NONE
+    1: 1,  # RLE
+    2: 1,  # ZIPS
+    3: 16,  # ZIP
+    4: 32,  # PIZ
+    5: 16,  # PXR24
+    6: 32,  # B44
+    7: 32,  # B44A
+    8: 32,  # DWAA
+    9: 256,  # DWAB
+}
+
+# header attributes required by the file format
+EXR_REQUIRED_ATTRIBUTES = ("channels", "compression", "dataWindow")
+
+
+class ExrHeaderError(ValueError):
+    """Raised when EXR file header is not valid."""
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ExrHeaderError("Unexpected end of file")
+    return data
+
+
+def _read_null_terminated(stream, max_length=255):
+    chars = bytearray()
+    while True:
+        char = _read_exact(stream, 1)
+        if char == b"\0":
+            return chars.decode("utf-8", "replace")
+        chars.extend(char)
+        if len(chars) > max_length:
+            raise ExrHeaderError("Invalid attribute name")
+
+
+def _parse_channels(value):
+    channels = []
+    idx = 0
+    while idx < len(value) and value[idx:idx + 1] != b"\0":
+        end = value.index(b"\0", idx)
+        # pixel type, pLinear, reserved, x and y sampling
+        pixel_type = struct.unpack_from("<i", value, end + 1)[0]
+        if pixel_type not in (0, 1, 2):
+            raise ExrHeaderError("Invalid channel pixel type")
+        channels.append(value[idx:end].decode("utf-8", "replace"))
+        idx = end + 17
+    return channels
+
+
+def _read_header_attributes(stream):
+    attributes = {}
+    while True:
+        name = _read_null_terminated(stream)
+        if not name:
+            return attributes
+        attr_type = _read_null_terminated(stream)
+        size = struct.unpack("<i", _read_exact(stream, 4))[0]
+        if size < 0:
+            raise ExrHeaderError("Invalid size of attribute '{}'".format(
+                name))
+        value = _read_exact(stream, size)
+        if attr_type == "chlist":
+            value = _parse_channels(value)
+        elif attr_type == "box2i":
+            value = struct.unpack("<4i", value)
+        elif attr_type == "compression":
+            value = value[0]
+        elif attr_type == "tiledesc":
+            value = struct.unpack("<2IB", value)
+        elif attr_type == "int":
+            value = struct.unpack("<i", value)[0]
+        attributes[name] = value
+
+
+def _get_chunk_count(attributes, tiled):
+    if "chunkCount" in attributes:
+        return attributes["chunkCount"]
+
+    x_min, y_min, x_max, y_max = attributes["dataWindow"]
+    if tiled:
+        tile_x, tile_y, mode = attributes["tiles"]
+        # only single level tiles are supported
+        if mode & 0x0f:
+            return None
+        width = x_max - x_min + 1
+        height = y_max - y_min + 1
+        return (
+            ((width + tile_x - 1) // tile_x)
+            * ((height + tile_y - 1) // tile_y)
+        )
+
+    lines_per_chunk = EXR_SCANLINES_PER_CHUNK.get(
+        attributes["compression"])
+    if lines_per_chunk is None:
+        return None
+    height = y_max - y_min + 1
+    return (height + lines_per_chunk - 1) // lines_per_chunk
+
+
+def read_exr_header(path, check_offsets=False):
+    """Read and validate header of EXR file.
+
+    Args:
+        path (str): Path to EXR file.
+        check_offsets (bool): Validate also offset tables and that the
+            last chunk of each part is complete.
+
+    Returns:
+        dict: Attributes of the first part. Channels are list of names
+            and data window is tuple of `(x_min, y_min, x_max, y_max)`.
+
+    Raises:
+        ExrHeaderError: When the file is not a valid EXR file.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as stream:
+        magic, version = struct.unpack("<ii", _read_exact(stream, 8))
+        if magic != EXR_MAGIC:
+            raise ExrHeaderError("Invalid magic number")
+
+        tiled = bool(version & EXR_TILED_FLAG)
+        multipart = bool(version & EXR_MULTIPART_FLAG)
+        parts = [_read_header_attributes(stream)]
+        if multipart:
+            while True:
+                attributes = _read_header_attributes(stream)
+                if not attributes:
+                    break
+                parts.append(attributes)
+
+        for attributes in parts:
+            for attr_name in EXR_REQUIRED_ATTRIBUTES:
+                if attr_name not in attributes:
+                    raise ExrHeaderError(
+                        "Missing '{}' attribute".format(attr_name))
+            if not attributes["channels"]:
+                raise ExrHeaderError("Empty channel list")
+            x_min, y_min, x_max, y_max = attributes["dataWindow"]
+            if x_max < x_min or y_max < y_min:
+                raise ExrHeaderError("Invalid data window")
+
+        # deep data chunks have different layout
+        if not check_offsets or version & EXR_NON_IMAGE_FLAG:
+            return parts[0]
+
+        offset_tables = []
+        for attributes in parts:
+            part_tiled = tiled
+            if multipart:
+                part_tiled = "tiles" in attributes
+            chunk_count = _get_chunk_count(attributes, part_tiled)
+            if chunk_count is None:
+                return parts[0]
+            offsets = struct.unpack(
+                "<{}Q".format(chunk_count),
+                _read_exact(stream, chunk_count * 8)
+            )
+            offset_tables.append((part_tiled, offsets))
+
+        table_end = stream.tell()
+        for part_tiled, offsets in offset_tables:
+            for offset in offsets:
+                if offset < table_end or offset >= file_size:
+                    raise ExrHeaderError("Incomplete offset table")
+
+            # part number, tile coordinates or scanline and data size
+            chunk_header_size = 20 if part_tiled else 8
+            if multipart:
+                chunk_header_size += 4
+            last_offset = max(offsets)
+            stream.seek(last_offset + chunk_header_size - 4)
+            data_size = struct.unpack("<i", _read_exact(stream, 4))[0]
+            if (
+                data_size < 0
+                or last_offset + chunk_header_size + data_size > file_size
+            ):
+                raise ExrHeaderError("Truncated pixel data")
+
+    return parts[0]
@@ -0,0 +1,112 @@
+"""Index of nodes inside of publish instance group nodes.
+
+Group content is listed once per publish and indexed by node class, so
+collectors, validators and extractors do not need to iterate over all
+child nodes to find the write node or other nodes of the group. Index
+is kept in the publish cache and has to be invalidated by actions
+which are changing the group content.
+"""
+import collections
+
+from .plugin import get_instance_group_node_childs
+from .publish_cache import get_publish_cache, get_instance_cache_key
+
+GROUP_INDEX_CACHE_SECTION = "groupIndex"
+
+
+class GroupIndex(object):
+    """Nodes of instance group node by their class.
+
+    Args:
+        nodes (Iterable[nuke.Node]): Nodes inside of the group node.
+
+    Attributes:
+        nodes (list[nuke.Node]): All nodes inside of the group node.
+        nodes_by_class (dict[str, list[nuke.Node]]): Nodes by their class.
+        write_node (Union[nuke.Node, None]): Write node of the group.
+        input_nodes (list[nuke.Node]): Input nodes of the group.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        self.nodes_by_class = collections.defaultdict(list)
+        for node in self.nodes:
+            self.nodes_by_class[node.Class()].append(node)
+
+        # last node of the class wins as with previous lookups
+        self.write_node = self.get_node("Write")
+        self.input_nodes = self.get_nodes("Input")
+
+    def get_nodes(self, node_class):
+        """Get nodes of node class.
+
+        Args:
+            node_class (str): Node class name.
+
+        Returns:
+            list[nuke.Node]: Nodes of the class.
+        """
+        return list(self.nodes_by_class.get(node_class, []))
+
+    def get_node(self, node_class):
+        """Get node of node class.
+
+        Args:
+            node_class (str): Node class name.
+
+        Returns:
+            Union[nuke.Node, None]: Last node of the class or None.
+        """
+        nodes = self.nodes_by_class.get(node_class)
+        if nodes:
+            return nodes[-1]
+        return None
+
+    @property
+    def input_node(self):
+        """Union[nuke.Node, None]: Last input node of the group."""
+        if self.input_nodes:
+            return self.input_nodes[-1]
+        return None
+
+
+def get_instance_group_index(instance):
+    """Get index of instance group node content.
+
+    The index is created once per publish. Child nodes are also stored
+    to instance transient data as 'childNodes'.
+
+    Args:
+        instance (pyblish.api.Instance): Publish instance.
+
+    Returns:
+        GroupIndex: Index of group node content.
+    """
+    def _create_index():
+        child_nodes = get_instance_group_node_childs(instance)
+        if child_nodes is None:
+            child_nodes = list(instance)
+        group_index = GroupIndex(child_nodes)
+        instance.data["transientData"]["childNodes"] = group_index.nodes
+        return group_index
+
+    return get_publish_cache(instance.context).get_or_compute(
+        GROUP_INDEX_CACHE_SECTION,
+        get_instance_cache_key(instance),
+        _create_index
+    )
+
+
+def invalidate_instance_group_index(instance):
+    """Invalidate index of instance group node content.
+
+    Should be called after group content of the instance was changed.
+
+    Args:
+        instance (pyblish.api.Instance): Publish instance.
+    """
+    cache = get_publish_cache(instance.context)
+    cache_key = get_instance_cache_key(instance)
+    cache.evict(GROUP_INDEX_CACHE_SECTION, cache_key)
+    cache.evict("childNodes", cache_key)
+    instance.data["transientData"].pop("childNodes", None)
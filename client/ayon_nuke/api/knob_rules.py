@@ -0,0 +1,243 @@
+"""Compiled knob rules used by knob validators.
+
+Settings of expected knob values are compiled once into an index of
+knob name to rules, so nodes can be audited by looking up only knobs
+which have a rule instead of iterating over all knobs of each node
+for each publish instance.
+"""
+import json
+
+import nuke
+
+from .lib import color_gui_to_int
+
+
+class KnobRule(object):
+    """Expected values of a knob.
+
+    Args:
+        name (str): Knob name.
+        expected_values (list[Any]): Allowed values of the knob.
+        owners (Optional[list[str]]): Names of publish instances which
+            defined the rule.
+        fix_types (Optional[bool]): Convert expected values to type of
+            the knob value before comparison, values from imageio
+            settings are stored as strings or color lists.
+    """
+
+    def __init__(self, name, expected_values, owners=None, fix_types=False):
+        self.name = name
+        self.expected_values = list(expected_values)
+        self.owners = list(owners or [])
+        self.fix_types = fix_types
+
+    @property
+    def expected(self):
+        """Any: First expected value."""
+        return self.expected_values[0]
+
+    def get_expected_values(self, node_value):
+        """Expected values comparable with the value of knob.
+
+        Args:
+            node_value (Any): Current value of the knob.
+
+        Returns:
+            tuple[list[Any], Any]: Expected values and knob value.
+        """
+        if not self.fix_types:
+            return self.expected_values, node_value
+
+        fixed_values = []
+        for value in self.expected_values:
+            if type(node_value) in (int, float):
+                try:
+                    if isinstance(value, list):
+                        value = color_gui_to_int(value)
+                    else:
+                        value = float(value)
+                        node_value = float(node_value)
+                except ValueError:
+                    value = str(value)
+            else:
+                value = str(value)
+                node_value = str(node_value)
+
+            fixed_values.append(value)
+        return fixed_values, node_value
+
+    def audit(self, node, knob):
+        """Compare knob value with expected values.
+
+        Args:
+            node (nuke.Node): Node of the knob.
+            knob (nuke.Knob): Audited knob.
+
+        Returns:
+            Union[dict[str, Any], None]: Violation data or None if knob
+                value is matching.
+        """
+        current = knob.value()
+        expected_values, node_value = self.get_expected_values(current)
+        if node_value in expected_values:
+            return None
+
+        if self.fix_types:
+            expected = expected_values
+        else:
+            expected = self.expected
+        return {
+            "node": node,
+            "node_name": node.name(),
+            "knob": knob,
+            "name": knob.name(),
+            "label": knob.label(),
+            "expected": expected,
+            "current": current,
+            "instances": list(self.owners),
+        }
+
+
+class KnobRuleSet(object):
+    """Index of knob rules by knob name."""
+
+    def __init__(self):
+        self._rules_by_name = {}
+
+    def add_rule(self, rule):
+        """Add rule to index.
+
+        Args:
+            rule (KnobRule): Knob rule.
+        """
+        self._rules_by_name.setdefault(rule.name, []).append(rule)
+
+    @property
+    def knob_names(self):
+        """set[str]: Names of knobs with rules."""
+        return set(self._rules_by_name)
+
+    @classmethod
+    def from_family_settings(cls, settings_knobs, instances):
+        """Compile 'ValidateKnobs' settings for publish instances.
+
+        Instances with same resulting knob values are sharing one rule,
+        so each knob value is compared once for all of them.
+
+        Args:
+            settings_knobs (dict[str, dict[str, Any]]): Expected knob
+                values by family.
+            instances (Iterable[pyblish.api.Instance]): Publish instances.
+
+        Returns:
+            KnobRuleSet: Compiled rules.
+        """
+        owners_by_value = {}
+        for instance in instances:
+            families = [instance.data["productType"]]
+            families += instance.data.get("families", [])
+
+            knobs = {}
+            for family in families:
+                # check if dot in family
+                if "." in family:
+                    family = family.split(".")[0]
+
+                # avoid families not in settings
+                if family not in settings_knobs:
+                    continue
+
+                knobs.update(settings_knobs[family])
+
+            for knob_name, expected in knobs.items():
+                key = (knob_name, json.dumps(expected, sort_keys=True))
+                owners = owners_by_value.setdefault(key, (expected, []))[1]
+                owners.append(instance.data["name"])
+
+        rule_set = cls()
+        for (knob_name, _), (expected, owners) in owners_by_value.items():
+            rule_set.add_rule(KnobRule(knob_name, [expected], owners))
+        return rule_set
+
+    @classmethod
+    def from_imageio_knobs(cls, knobs_settings, ignored_knob_names=None):
+        """Compile knobs of imageio node settings.
+
+        Multiple items of one knob name are alternative allowed values.
+
+        Args:
+            knobs_settings (list[dict[str, Any]]): Knob items of imageio
+                node settings.
+            ignored_knob_names (Optional[Iterable[str]]): Knobs which
+                are not validated.
+
+        Returns:
+            KnobRuleSet: Compiled rules.
+        """
+        ignored_knob_names = set(ignored_knob_names or [])
+        values_by_name = {}
+        for knob_data in knobs_settings:
+            knob_name = knob_data["name"]
+            if knob_name in ignored_knob_names:
+                continue
+            knob_type = knob_data["type"]
+            values_by_name.setdefault(knob_name, []).append(
+                knob_data[knob_type])
+
+        rule_set = cls()
+        for knob_name, values in values_by_name.items():
+            rule_set.add_rule(KnobRule(knob_name, values, fix_types=True))
+        return rule_set
+
+    def audit_node(self, node):
+        """Audit knobs of a node.
+
+        Args:
+            node (nuke.Node): Audited node.
+
+        Returns:
+            list[dict[str, Any]]: Violations of rules.
+        """
+        violations = []
+        knobs = node.knobs()
+        for knob_name, rules in self._rules_by_name.items():
+            knob = knobs.get(knob_name)
+            if knob is None:
+                continue
+            for rule in rules:
+                violation = rule.audit(node, knob)
+                if violation is not None:
+                    violations.append(violation)
+        return violations
+
+    def audit_nodes(self, nodes):
+        """Audit knobs of nodes.
+
+        Args:
+            nodes (Iterable[nuke.Node]): Audited nodes.
+
+        Returns:
+            list[dict[str, Any]]: Violations of rules.
+        """
+        violations = []
+        if not self._rules_by_name:
+            return violations
+        for node in nodes:
+            violations.extend(self.audit_node(node))
+        return violations
+
+    def __bool__(self):
+        return bool(self._rules_by_name)
+
+
+def iter_audited_nodes():
+    """Nodes of the script and nodes of root level groups.
+
+    Yields:
+        nuke.Node: Nodes to audit.
+    """
+    for node in nuke.allNodes():
+        yield node
+        if node.Class() == "Group":
+            for child_node in nuke.allNodes(group=node):
+                yield child_node
@@ -2,12 +2,14 @@ import os
 import re
 import json
 import six
+import time
 import functools
+import threading
 import warnings
 import platform
 import tempfile
 import contextlib
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
 import nuke
 from qtpy import QtCore, QtWidgets
@@ -56,7 +58,9 @@ from .constants import (
 )
 
 from .workio import save_file
-from .utils import get_node_outputs
+from .dag_occupancy import get_dag_occupancy_map
+from .node_graph import NodeGraph
+from .sequence import PathTemplate
 
 log = Logger.get_logger(__name__)
 
@@ -68,6 +72,15 @@ EXCLUDED_KNOB_TYPE_ON_READ = (
     26,  # Text Knob (But for backward compatibility, still be read
          #  if value is not an empty string.)
 )
+# Knob classes matching `EXCLUDED_KNOB_TYPE_ON_READ` types
+EXCLUDED_KNOB_CLASS_ON_READ = (
+    "Tab_Knob",
+    "Text_Knob",
+)
+AVALON_KNOB_PREFIXES = ("avalon:", "ak:")
+# suffix of knob starting group of imprinted avalon knobs, e.g.
+#   'AyonDataGroup' or legacy 'OpenpypeDataGroup'
+AVALON_DATA_GROUP_SUFFIX = "DataGroup"
 JSON_PREFIX = "JSON:::"
 ROOT_DATA_KNOB = "publish_context"
 INSTANCE_DATA_KNOB = "publish_instance"
@@ -168,11 +181,16 @@ def set_node_data(node, knobname, data):
     knob.setValue(knob_value)
     knob.setFlag(nuke.INVISIBLE)
     node.addKnob(knob)
+    NodeDataCache.invalidate(node, knobname)
+    _invalidate_scene_index()
 
 
 def get_node_data(node, knobname):
     """Read data from node.
 
+    Decoded data are cached by raw knob value, returned dictionaries are
+    copied on write so they can be safely modified by callers.
+
     Args:
         node (nuke.Node): node object
         knobname (str): knob name
@@ -180,18 +198,27 @@ def get_node_data(node, knobname):
     Returns:
         dict: data stored in knob
     """
-    if knobname not in node.knobs():
+    knob = node.knob(knobname)
+    if knob is None:
         return
 
-    rawdata = node[knobname].getValue()
+    rawdata = knob.getValue()
     if (
-        isinstance(rawdata, six.string_types)
-        and rawdata.startswith(JSON_PREFIX)
+        not isinstance(rawdata, six.string_types)
+        or not rawdata.startswith(JSON_PREFIX)
     ):
+        return
+
+    cache_key = (node.fullName(), knobname)
+    data = NodeDataCache.get(cache_key, rawdata)
+    if data is None:
         try:
-            return json.loads(rawdata[len(JSON_PREFIX):])
+            data = json.loads(rawdata[len(JSON_PREFIX):])
         except json.JSONDecodeError:
             return
+        NodeDataCache.set(cache_key, rawdata, data)
+
+    return _copy_on_write(data)
 
 
 def update_node_data(node, knobname, data):
@@ -207,6 +234,135 @@ def update_node_data(node, knobname, data):
     node_data.update(data)
     knob_value = JSON_PREFIX + json.dumps(node_data)
     knob.setValue(knob_value)
+    NodeDataCache.invalidate(node, knobname)
+    _invalidate_scene_index()
+
+
+class NodeDataCache:
+    """LRU cache of decoded node data knobs.
+
+    Items are stored by node full name and knob name together with raw
+    knob value they were decoded from, so a changed knob value is never
+    served from cache.
+    """
+    max_items = 512
+    _items = OrderedDict()
+
+    @classmethod
+    def get(cls, key, rawdata):
+        item = cls._items.get(key)
+        if item is None or item[0] != rawdata:
+            return None
+        cls._items.move_to_end(key)
+        return item[1]
+
+    @classmethod
+    def set(cls, key, rawdata, data):
+        cls._items[key] = (rawdata, data)
+        cls._items.move_to_end(key)
+        while len(cls._items) > cls.max_items:
+            cls._items.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, node, knobname):
+        cls._items.pop((node.fullName(), knobname), None)
+
+    @classmethod
+    def clear(cls):
+        cls._items.clear()
+
+
+def _copy_on_write(value):
+    """Wrap cached value so it is copied on modification."""
+    if isinstance(value, dict):
+        return CopyOnWriteDict(value)
+    if isinstance(value, list):
+        return [_copy_on_write(item) for item in value]
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """Dictionary sharing nested values with cached data.
+
+    Only top level is copied on creation. Nested dictionaries and lists
+    are copied on first access, so cached data are never modified
+    through the returned object.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CopyOnWriteDict, self).__init__(*args, **kwargs)
+        self._owned_keys = set()
+
+    def _own(self, key):
+        if key in self._owned_keys or not dict.__contains__(self, key):
+            return
+        self._owned_keys.add(key)
+        value = dict.__getitem__(self, key)
+        if isinstance(value, (dict, list)):
+            dict.__setitem__(self, key, _copy_on_write(value))
+
+    def _own_all(self):
+        for key in list(dict.keys(self)):
+            self._own(key)
+
+    def __getitem__(self, key):
+        self._own(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._owned_keys.add(key)
+
+    def __iter__(self):
+        # Custom iterator makes sure 'dict(obj)' or 'other.update(obj)'
+        #   are reading values through '__getitem__'
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        self._own(key)
+        return dict.get(self, key, default)
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        dict.update(self, other)
+        self._owned_keys.update(other)
+
+    def setdefault(self, key, default=None):
+        self._own(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        self._own(key)
+        self._owned_keys.discard(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._own_all()
+        key, value = dict.popitem(self)
+        self._owned_keys.discard(key)
+        return key, value
+
+    def items(self):
+        self._own_all()
+        return dict.items(self)
+
+    def values(self):
+        self._own_all()
+        return dict.values(self)
+
+    def copy(self):
+        return CopyOnWriteDict(self)
+
+
+def _invalidate_scene_index():
+    """Invalidate scene index after pipeline data on a node changed.
+
+    Changes of knob values from code are not triggering `knobChanged`
+    callbacks so the index has to be invalidated explicitly.
+    """
+    from .scene_index import invalidate_scene_index
+
+    invalidate_scene_index()
 
 
 class Knobby(object):
@@ -397,6 +553,7 @@ def imprint(node, data, tab=None):
             node[knob.name()].setValue(knob.value())
         else:
             node.addKnob(knob)
+    _invalidate_scene_index()
 
 
 @deprecated
@@ -559,54 +716,64 @@ def add_write_node(name, file_path, knobs, **kwarg):
     return w
 
 
+def has_avalon_data(node):
+    """Check if node has imprinted avalon data.
+
+    Data imprinted by `set_avalon_knob_data` always contain `id` key so
+    only one knob lookup is needed to skip nodes without the data.
+
+    Args:
+        node (nuke.Node): Nuke node object
+
+    Returns:
+        bool: True if node has avalon `id` knob.
+    """
+    return any(
+        node.knob(prefix + "id") is not None
+        for prefix in AVALON_KNOB_PREFIXES
+    )
+
+
 def read_avalon_data(node):
     """Return user-defined knobs from given `node`
 
+    Avalon knobs are always added as user knobs, so they are found by
+    their prefix without TCL evaluation. Knobs are read from the end of
+    the knob list and reading stops at the knob starting the data group,
+    all avalon knobs are imprinted after it.
+
     Args:
         node (nuke.Node): Nuke node object
 
     Returns:
-        list: A list of nuke.Knob object
+        dict: Avalon knob values by their name without prefix.
 
     """
-    def compat_prefixed(knob_name):
-        if knob_name.startswith("avalon:"):
-            return knob_name[len("avalon:"):]
-        elif knob_name.startswith("ak:"):
-            return knob_name[len("ak:"):]
-
     data = dict()
 
-    pattern = ("(?<=addUserKnob {)"
-               "([0-9]*) (\\S*)"  # Matching knob type and knob name
-               "(?=[ |}])")
-    tcl_script = node.writeKnobs(nuke.WRITE_USER_KNOB_DEFS)
-    result = re.search(pattern, tcl_script)
-
-    if result:
-        first_user_knob = result.group(2)
-        # Collect user knobs from the end of the knob list
-        for knob in reversed(node.allKnobs()):
-            knob_name = knob.name()
-            if not knob_name:
-                # Ignore unnamed knob
-                continue
-
-            knob_type = nuke.knob(knob.fullyQualifiedName(), type=True)
-            value = knob.value()
-
-            if (
-                knob_type not in EXCLUDED_KNOB_TYPE_ON_READ or
-                # For compating read-only string data that imprinted
-                # by `nuke.Text_Knob`.
-                (knob_type == 26 and value)
-            ):
-                key = compat_prefixed(knob_name)
-                if key is not None:
-                    data[key] = value
+    # Collect knobs from the end of the knob list, values are overridden
+    #   so knob earlier in the list wins in case of duplicated names,
+    #   e.g. 'avalon:id' and 'ak:id'
+    for knob in reversed(node.allKnobs()):
+        knob_name = knob.name()
+        if knob_name.endswith(AVALON_DATA_GROUP_SUFFIX):
+            break
 
-            if knob_name == first_user_knob:
+        for prefix in AVALON_KNOB_PREFIXES:
+            if knob_name.startswith(prefix):
                 break
+        else:
+            continue
+
+        value = knob.value()
+        knob_class = knob.Class()
+        if (
+            knob_class not in EXCLUDED_KNOB_CLASS_ON_READ
+            # For compating read-only string data that imprinted
+            # by `nuke.Text_Knob`.
+            or (knob_class == "Text_Knob" and value)
+        ):
+            data[knob_name[len(prefix):]] = value
 
     return data
 
@@ -806,24 +973,226 @@ def on_script_load():
         nuke.tcl('load movWriter')
 
 
+class InventoryVersionsCache:
+    """Cache of version status of loaded representations.
+
+    Statuses are `latest`, `outdated`, `invalid` or `not_found` and are
+    stored by project name and representation id. They expire after
+    `ttl` seconds or when `refresh` is called.
+    """
+    ttl = 300
+    _statuses = {}
+
+    @classmethod
+    def get(cls, project_name, representation_id):
+        item = cls._statuses.get((project_name, representation_id))
+        if item is None:
+            return None
+        status, timestamp = item
+        if time.time() - timestamp > cls.ttl:
+            return None
+        return status
+
+    @classmethod
+    def set(cls, project_name, representation_id, status):
+        cls._statuses[(project_name, representation_id)] = (
+            status, time.time()
+        )
+
+    @classmethod
+    def refresh(cls):
+        cls._statuses.clear()
+
+
 def check_inventory_versions():
     """Update loaded container nodes' colors based on version state.
 
     This will group containers by their version to outdated, not found,
     invalid or latest and colorize the nodes based on the category.
+
+    Cached statuses are dropped so all containers are checked against
+    the server.
+    """
+    InventoryVersionsCache.refresh()
+    update_inventory_versions()
+
+
+def update_inventory_versions():
+    """Update loaded container nodes' colors from cached version states.
+
+    Only statuses missing in `InventoryVersionsCache` are requested from
+    the server, with one bulk query per project. Tile color is changed
+    only on nodes where it differs from the status color.
+    """
+    for project_name, containers in _get_containers_by_project().items():
+        statuses = {}
+        missing_containers = {}
+        for container in containers:
+            repre_id = container["representation"]
+            status = InventoryVersionsCache.get(project_name, repre_id)
+            if status is None:
+                missing_containers.setdefault(repre_id, container)
+            else:
+                statuses[repre_id] = status
+
+        if missing_containers:
+            statuses.update(_fetch_inventory_statuses(
+                project_name, list(missing_containers.values())
+            ))
+
+        for container in containers:
+            status = statuses.get(container["representation"])
+            _set_container_status_color(container["node"], status)
+
+
+def check_inventory_versions_async():
+    """Same as `check_inventory_versions` but not blocking the UI.
+
+    Cached statuses are dropped and all containers are checked against
+    the server in a background thread.
     """
+    InventoryVersionsCache.refresh()
+    update_inventory_versions_async()
+
+
+def update_inventory_versions_async():
+    """Same as `update_inventory_versions` but not blocking the UI.
+
+    Cached statuses are applied right away. Missing statuses are requested
+    from the server in a background thread and applied in main thread once
+    available. Results for nodes which were meanwhile deleted, renamed or
+    switched to other representation are dropped.
+    """
+    worker = _InventoryVersionsWorker.thread
+    if worker is not None and worker.is_alive():
+        log.debug("Inventory versions check is already running.")
+        return
+
+    missing_by_project = {}
+    for project_name, containers in _get_containers_by_project().items():
+        missing_containers = {}
+        node_names_by_repre_id = defaultdict(list)
+        for container in containers:
+            repre_id = container["representation"]
+            status = InventoryVersionsCache.get(project_name, repre_id)
+            if status is not None:
+                _set_container_status_color(container["node"], status)
+                continue
+
+            # node objects must not be touched outside of main thread
+            missing_containers.setdefault(repre_id, {
+                key: value
+                for key, value in container.items()
+                if key != "node"
+            })
+            node_names_by_repre_id[repre_id].append(container["objectName"])
+
+        if missing_containers:
+            missing_by_project[project_name] = (
+                list(missing_containers.values()),
+                node_names_by_repre_id
+            )
+
+    if not missing_by_project:
+        return
+
+    worker = threading.Thread(
+        target=_inventory_versions_worker,
+        args=(nuke.root().name(), missing_by_project),
+        daemon=True
+    )
+    _InventoryVersionsWorker.thread = worker
+    worker.start()
+
+
+class _InventoryVersionsWorker:
+    thread = None
+
+
+def _inventory_versions_worker(script_name, missing_by_project):
+    results = []
+    for project_name, (containers, node_names_by_repre_id) in (
+        missing_by_project.items()
+    ):
+        try:
+            statuses = _fetch_inventory_statuses(project_name, containers)
+        except Exception:
+            log.warning(
+                "Failed to check versions of loaded containers.",
+                exc_info=True
+            )
+            continue
+
+        for repre_id, status in statuses.items():
+            for node_name in node_names_by_repre_id[repre_id]:
+                results.append((node_name, repre_id, status))
+
+    if results:
+        nuke.executeInMainThread(
+            _apply_inventory_statuses, args=(script_name, results)
+        )
+
+
+def _apply_inventory_statuses(script_name, results):
+    root_node = nuke.root()
+    # script was closed or switched while waiting for results
+    if root_node.name() != script_name:
+        return
+
+    with root_node:
+        for node_name, repre_id, status in results:
+            node = nuke.toNode(node_name)
+            if node is None:
+                continue
+
+            for prefix in AVALON_KNOB_PREFIXES:
+                repre_knob = node.knob(prefix + "representation")
+                if repre_knob is not None:
+                    break
+
+            if repre_knob is None or repre_knob.value() != repre_id:
+                continue
+
+            _set_container_status_color(node, status)
+
+
+def _get_containers_by_project():
     host = registered_host()
-    containers = host.get_containers()
-    project_name = get_current_project_name()
+    current_project_name = get_current_project_name()
+
+    containers_by_project = defaultdict(list)
+    for container in host.get_containers():
+        project_name = container.get("project_name") or current_project_name
+        containers_by_project[project_name].append(container)
+    return containers_by_project
 
+
+def _fetch_inventory_statuses(project_name, containers):
+    """Request version statuses of containers from server.
+
+    Received statuses are stored to `InventoryVersionsCache`.
+
+    Returns:
+        dict[str, str]: Statuses by representation id.
+    """
+    statuses = {}
     filtered_containers = filter_containers(containers, project_name)
-    for category, containers in filtered_containers._asdict().items():
-        if category not in LOADER_CATEGORY_COLORS:
-            continue
-        color = LOADER_CATEGORY_COLORS[category]
-        color = int(color, 16)  # convert hex to nuke tile color int
-        for container in containers:
-            container["node"]["tile_color"].setValue(color)
+    for status, status_containers in filtered_containers._asdict().items():
+        for container in status_containers:
+            repre_id = container["representation"]
+            statuses[repre_id] = status
+            InventoryVersionsCache.set(project_name, repre_id, status)
+    return statuses
+
+
+def _set_container_status_color(node, status):
+    if status not in LOADER_CATEGORY_COLORS:
+        return
+    color = LOADER_CATEGORY_COLORS[status]
+    color = int(color, 16)  # convert hex to nuke tile color int
+    tile_color_knob = node["tile_color"]
+    if int(tile_color_knob.value()) != color:
+        tile_color_knob.setValue(color)
 
 
 def writes_version_sync():
@@ -1312,6 +1681,193 @@ def convert_knob_value_to_correct_type(knob_type, knob_value):
     return knob_value
 
 
+def get_animation_curves_script(keys, default_values=None):
+    """Convert animation keys to knob script with curve per channel.
+
+    Frames following previous key of a channel are written without
+    explicit frame number, same as Nuke writes baked curves.
+
+    Args:
+        keys (Iterable[tuple[float, Union[float, Sequence[float]]]]):
+            Pairs of frame and value. Value is either single value used
+            for all channels or sequence of values per channel.
+        default_values (Optional[Sequence[float]]): Values of channels
+            without any key, by default `0.0`.
+
+    Returns:
+        str: Script which can be applied with `knob.fromScript()`.
+    """
+    channel_keys = defaultdict(list)
+    for frame, value in keys:
+        if isinstance(value, (list, tuple)):
+            for channel, channel_value in enumerate(value):
+                channel_keys[channel].append((frame, channel_value))
+        else:
+            channel_keys[-1].append((frame, value))
+
+    # single value for all channels
+    if list(channel_keys) == [-1]:
+        channels = [channel_keys[-1]]
+    else:
+        single_keys = channel_keys.pop(-1, [])
+        channels_count = max(channel_keys) + 1 if channel_keys else 0
+        channels = []
+        for channel in range(channels_count):
+            channels.append(
+                sorted(channel_keys.get(channel, []) + single_keys)
+            )
+
+    curves = []
+    for channel, frame_values in enumerate(channels):
+        if not frame_values:
+            default_value = 0.0
+            if default_values and channel < len(default_values):
+                default_value = default_values[channel]
+            curves.append(repr(float(default_value)))
+            continue
+
+        items = []
+        previous_frame = None
+        for frame, value in frame_values:
+            if previous_frame is None or frame != previous_frame + 1:
+                items.append("x{}".format(frame))
+            items.append(repr(float(value)))
+            previous_frame = frame
+        curves.append("{{curve {}}}".format(" ".join(items)))
+
+    return " ".join(curves)
+
+
+def set_knob_animation(knob, keys):
+    """Set all animation keys of a knob with single call.
+
+    Replaces calling `knob.setValueAt()` for each key and channel.
+
+    Args:
+        knob (nuke.Knob): Animatable knob.
+        keys (Iterable[tuple[float, Union[float, Sequence[float]]]]):
+            Pairs of frame and value. Value is either single value used
+            for all channels or sequence of values per channel.
+    """
+    default_values = None
+    if isinstance(knob, nuke.Array_Knob):
+        default_values = [
+            knob.value(channel) for channel in range(knob.arraySize())
+        ]
+    knob.fromScript(get_animation_curves_script(keys, default_values))
+
+
+def get_knob_script_value(value):
+    """Convert python value to value used for knob in nuke script.
+
+    Args:
+        value (Any): Bool, number, string or list of them.
+
+    Returns:
+        str: Value which can be used in nuke script.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    if isinstance(value, (list, tuple)):
+        return "{{{}}}".format(
+            " ".join(get_knob_script_value(item) for item in value)
+        )
+
+    value = str(value)
+    for char in ("\\", "\"", "[", "]", "{", "}", "$"):
+        value = value.replace(char, "\\" + char)
+    return "\"{}\"".format(value.replace("\n", "\\n"))
+
+
+class _EffectKnobNamesCache:
+    knob_names_by_class = {}
+
+
+def get_node_class_knob_names(node_class):
+    """Names of knobs available on nodes of a class.
+
+    Knobs are read once per session from temporary node created in root,
+    so node groups receiving effects do not get extra nodes created and
+    deleted in them.
+
+    Args:
+        node_class (str): Node class name.
+
+    Returns:
+        set[str]: Knob names.
+    """
+    knob_names = _EffectKnobNamesCache.knob_names_by_class.get(node_class)
+    if knob_names is None:
+        with nuke.root():
+            temp_node = getattr(nuke.nodes, node_class)()
+            knob_names = set(temp_node.knobs())
+            nuke.delete(temp_node)
+        _EffectKnobNamesCache.knob_names_by_class[node_class] = knob_names
+    return knob_names
+
+
+def create_effect_nodes(effects, first_frame, ignore_knobs=None):
+    """Create chain of effect nodes in current group with single paste.
+
+    Nodes are written into nuke script in between `Input` and `Output`
+    nodes and pasted at once instead of creating each node with its
+    knobs separately.
+
+    Lists longer than 4 values are animation values per frame starting
+    at `first_frame`.
+
+    Args:
+        effects (Iterable[dict]): Effects with node `class` and `node`
+            knob values.
+        first_frame (int): Frame of first animation value.
+        ignore_knobs (Optional[Iterable[str]]): Knob names to skip.
+
+    Returns:
+        list[nuke.Node]: Pasted nodes.
+    """
+    ignore_knobs = set(ignore_knobs or [])
+
+    lines = ["Input {", " inputs 0", " name rgb", "}"]
+    for effect in effects:
+        node_class = effect["class"]
+        knob_names = get_node_class_knob_names(node_class)
+
+        lines.append("{} {{".format(node_class))
+        for knob_name, value in effect["node"].items():
+            if knob_name in ignore_knobs:
+                continue
+
+            if knob_name not in knob_names:
+                log.warning("Knob '{}' does not exist on '{}'".format(
+                    knob_name, node_class))
+                continue
+
+            if isinstance(value, list) and len(value) > 4:
+                script_value = "{{{}}}".format(get_animation_curves_script(
+                    (first_frame + idx, item)
+                    for idx, item in enumerate(value)
+                ))
+            else:
+                script_value = get_knob_script_value(value)
+            lines.append(" {} {}".format(knob_name, script_value))
+        lines.append("}")
+    lines.extend(["Output {", " name Output1", "}"])
+
+    reset_selection()
+    with node_tempfile() as filepath:
+        with open(filepath, "w") as stream:
+            stream.write("\n".join(lines))
+        nuke.nodePaste(filepath)
+
+    nodes = nuke.selectedNodes()
+    reset_selection()
+    return nodes
+
+
 def color_gui_to_int(color_gui):
     # Append alpha channel if not present
     if len(color_gui) == 3:
@@ -1759,7 +2315,9 @@ Reopening Nuke should synchronize these paths and resolve any discrepancies.
         ''' Adds correct colorspace to write node dict
 
         '''
-        for node in nuke.allNodes(filter="Group", group=self._root_node):
+        from .scene_index import get_scene_index
+
+        for node in get_scene_index().write_groups:
             log.info("Setting colorspace to `{}`".format(node.name()))
 
             # get data from avalon knob
@@ -2114,41 +2672,25 @@ def get_write_node_template_attr(node):
     )
 
 
-def get_dependent_nodes(nodes):
+def get_dependent_nodes(nodes, node_graph=None):
     """Get all dependent nodes connected to the list of nodes.
 
     Looking for connections outside of the nodes in incoming argument.
 
     Arguments:
         nodes (list): list of nuke.Node objects
+        node_graph (NodeGraph, optional): snapshot of connections to reuse,
+            snapshot of current group is created if not passed
 
     Returns:
         connections_in: dictionary of nodes and its dependencies
-        connections_out: dictionary of nodes and its dependency
+            as list of (input index, node)
+        connections_out: dictionary of nodes and its dependent nodes
+            as list of (input index on dependent node, dependent node)
     """
-
-    connections_in = dict()
-    connections_out = dict()
-    node_names = [n.name() for n in nodes]
-    for node in nodes:
-        inputs = node.dependencies()
-        outputs = node.dependent()
-        # collect all inputs outside
-        test_in = [(i, n) for i, n in enumerate(inputs)
-                   if n.name() not in node_names]
-        if test_in:
-            connections_in.update({
-                node: test_in
-            })
-        # collect all outputs outside
-        test_out = [i for i in outputs if i.name() not in node_names]
-        if test_out:
-            # only one dependent node is allowed
-            connections_out.update({
-                node: test_out[-1]
-            })
-
-    return connections_in, connections_out
+    if node_graph is None:
+        node_graph = NodeGraph.build()
+    return node_graph.get_boundary_connections(nodes)
 
 
 def update_node_graph():
@@ -2174,6 +2716,9 @@ def find_free_space_to_paste_nodes(
     """
     For getting coordinates in DAG (node graph) for placing new nodes
 
+    Free holes between existing nodes are preferred, otherwise the
+    position is next to all nodes of the `group` in `direction`.
+
     Arguments:
         nodes (list): list of nuke.Node objects
         group (nuke.Node) [optional]: object in which context it is
@@ -2188,49 +2733,23 @@ def find_free_space_to_paste_nodes(
     if len(nodes) == 0:
         return 0, 0
 
-    group_xpos = list()
-    group_ypos = list()
-
-    # get local coordinates of all nodes
-    nodes_xpos = [n.xpos() for n in nodes] + \
-                 [n.xpos() + n.screenWidth() for n in nodes]
-
-    nodes_ypos = [n.ypos() for n in nodes] + \
-                 [n.ypos() + n.screenHeight() for n in nodes]
-
     # get complete screen size of all nodes to be placed in
-    nodes_screen_width = max(nodes_xpos) - min(nodes_xpos)
-    nodes_screen_heigth = max(nodes_ypos) - min(nodes_ypos)
-
-    # get screen size (r,l,t,b) of all nodes in `group`
-    with group:
-        group_xpos = [n.xpos() for n in nuke.allNodes() if n not in nodes] + \
-                     [n.xpos() + n.screenWidth() for n in nuke.allNodes()
-                      if n not in nodes]
-        group_ypos = [n.ypos() for n in nuke.allNodes() if n not in nodes] + \
-                     [n.ypos() + n.screenHeight() for n in nuke.allNodes()
-                      if n not in nodes]
-
-        # calc output left
-        if direction in "left":
-            xpos = min(group_xpos) - abs(nodes_screen_width) - abs(offset)
-            ypos = min(group_ypos)
-            return xpos, ypos
-        # calc output right
-        if direction in "right":
-            xpos = max(group_xpos) + abs(offset)
-            ypos = min(group_ypos)
-            return xpos, ypos
-        # calc output top
-        if direction in "top":
-            xpos = min(group_xpos)
-            ypos = min(group_ypos) - abs(nodes_screen_heigth) - abs(offset)
-            return xpos, ypos
-        # calc output bottom
-        if direction in "bottom":
-            xpos = min(group_xpos)
-            ypos = max(group_ypos) + abs(offset)
-            return xpos, ypos
+    min_x, min_y, max_x, max_y = get_extreme_positions(nodes)
+    nodes_screen_width = max_x - min_x
+    nodes_screen_heigth = max_y - min_y
+
+    # occupancy of all other nodes in `group`
+    occupancy_map = get_dag_occupancy_map(group)
+    position = occupancy_map.find_free_position(
+        nodes_screen_width,
+        nodes_screen_heigth,
+        direction=direction,
+        offset=offset,
+        exclude_ids={node.fullName() for node in nodes}
+    )
+    if position is None:
+        return 0, 0
+    return position
 
 
 @contextlib.contextmanager
@@ -2268,7 +2787,7 @@ def maintained_selection(exclude_nodes=None):
 
 
 @contextlib.contextmanager
-def swap_node_with_dependency(old_node, new_node):
+def swap_node_with_dependency(old_node, new_node, node_graph=None):
     """ Swap node with dependency
 
     Swap node with dependency and reconnect all inputs and outputs.
@@ -2277,6 +2796,8 @@ def swap_node_with_dependency(old_node, new_node):
     Arguments:
         old_node (nuke.Node): node to be replaced
         new_node (nuke.Node): node to replace with
+        node_graph (NodeGraph, optional): snapshot of connections to reuse,
+            snapshot of current group is created if not passed
 
     Example:
         >>> old_node_name = old_node["name"].value()
@@ -2290,8 +2811,10 @@ def swap_node_with_dependency(old_node, new_node):
     # preserve position
     xpos, ypos = old_node.xpos(), old_node.ypos()
     # preserve selection after all is done
-    outputs = get_node_outputs(old_node)
-    inputs = old_node.dependencies()
+    if node_graph is None:
+        node_graph = NodeGraph.build()
+    outputs = node_graph.get_outputs(old_node)
+    inputs = node_graph.get_inputs(old_node)
     node_name = old_node["name"].value()
 
     try:
@@ -2301,13 +2824,11 @@ def swap_node_with_dependency(old_node, new_node):
     finally:
 
         # Reconnect inputs
-        for i, node in enumerate(inputs):
+        for i, node in inputs:
             new_node.setInput(i, node)
         # Reconnect outputs
-        if outputs:
-            for n, pipes in outputs.items():
-                for i in pipes:
-                    n.setInput(i, new_node)
+        for i, node in outputs:
+            node.setInput(i, new_node)
         # return to original position
         new_node.setXYpos(xpos, ypos)
 
@@ -2858,16 +3379,15 @@ def get_filenames_without_hash(filename, frame_start, frame_end):
     Returns:
         list: filename per frame of the sequence
     """
-    filenames = []
-    for frame in range(int(frame_start), (int(frame_end) + 1)):
-        if "#" in filename:
-            # use regex to convert #### to {:0>4}
-            def replace(match):
-                return "{{:0>{}}}".format(len(match.group()))
-            filename_without_hashes = re.sub("#+", replace, filename)
-            new_filename = filename_without_hashes.format(frame)
-            filenames.append(new_filename)
-    return filenames
+    if "#" not in filename:
+        return []
+
+    template = PathTemplate.parse(filename)
+    if template is None:
+        return []
+    return list(template.iter_paths(
+        range(int(frame_start), int(frame_end) + 1)
+    ))
 
 
 def create_camera_node_by_version():
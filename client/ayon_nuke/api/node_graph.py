@@ -0,0 +1,124 @@
+"""Snapshot of input and output connections of nodes.
+
+Inputs of all nodes of a group are read once and inverted to outputs,
+so boundary connections of large node selections are found with set
+lookups instead of calling `dependencies()` and `dependent()` on every
+node. Nodes are identified by their full name.
+
+Snapshot is not updated when connections are changed.
+"""
+import nuke
+
+
+class NodeGraph(object):
+    """Input and output adjacency of nodes.
+
+    Args:
+        nodes (Iterable[nuke.Node]): Nodes of the graph.
+    """
+
+    def __init__(self, nodes):
+        self._nodes_by_id = {}
+        self._inputs_by_id = {}
+        self._outputs_by_id = {}
+        for node in nodes:
+            self._add_node(node)
+
+    @classmethod
+    def build(cls, group=None):
+        """Snapshot connections of all nodes in a group.
+
+        Args:
+            group (Optional[nuke.Node]): Group node, current context
+                group when not passed.
+
+        Returns:
+            NodeGraph: Snapshot of the group.
+        """
+        if group is None:
+            return cls(nuke.allNodes())
+        return cls(nuke.allNodes(group=group))
+
+    @staticmethod
+    def get_node_id(node):
+        """Identifier of node in graph.
+
+        Args:
+            node (nuke.Node): Node.
+
+        Returns:
+            str: Full name of the node.
+        """
+        return node.fullName()
+
+    def _add_node(self, node):
+        node_id = self.get_node_id(node)
+        self._nodes_by_id[node_id] = node
+        inputs = []
+        for index in range(node.inputs()):
+            input_node = node.input(index)
+            if input_node is None:
+                continue
+            inputs.append((index, input_node))
+            self._outputs_by_id.setdefault(
+                self.get_node_id(input_node), []
+            ).append((index, node))
+        self._inputs_by_id[node_id] = inputs
+
+    def get_inputs(self, node):
+        """Connected inputs of node.
+
+        Args:
+            node (nuke.Node): Node in the graph.
+
+        Returns:
+            list[tuple[int, nuke.Node]]: Input index with input node.
+        """
+        return list(self._inputs_by_id.get(self.get_node_id(node), []))
+
+    def get_outputs(self, node):
+        """Nodes connected to output of node.
+
+        Args:
+            node (nuke.Node): Node in the graph.
+
+        Returns:
+            list[tuple[int, nuke.Node]]: Input index on the output node
+                with the output node.
+        """
+        return list(self._outputs_by_id.get(self.get_node_id(node), []))
+
+    def get_boundary_connections(self, nodes):
+        """Connections crossing boundary of the nodes.
+
+        Arguments:
+            nodes (Iterable[nuke.Node]): Nodes inside of the boundary.
+
+        Returns:
+            tuple[dict, dict]: Connections from nodes outside to inputs
+                of nodes, and connections from nodes to inputs of nodes
+                outside. Both are dictionaries of node with list of
+                `(input index, outside node)`.
+        """
+        nodes = list(nodes)
+        node_ids = {self.get_node_id(node) for node in nodes}
+        connections_in = {}
+        connections_out = {}
+        for node in nodes:
+            outside_inputs = [
+                (index, input_node)
+                for index, input_node in self.get_inputs(node)
+                if self.get_node_id(input_node) not in node_ids
+            ]
+            if outside_inputs:
+                connections_in[node] = outside_inputs
+
+            outside_outputs = [
+                (index, output_node)
+                for index, output_node in self.get_outputs(node)
+                if self.get_node_id(output_node) not in node_ids
+            ]
+            if outside_outputs:
+                connections_out[node] = outside_outputs
+
+        return connections_in, connections_out
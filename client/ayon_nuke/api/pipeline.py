@@ -40,7 +40,11 @@ from .lib import (
     start_workfile_template_builder,
     launch_workfiles_app,
     check_inventory_versions,
+    check_inventory_versions_async,
+    update_inventory_versions,
+    update_inventory_versions_async,
     set_avalon_knob_data,
+    has_avalon_data,
     read_avalon_data,
     on_script_load,
     dirmap_file_name_filter,
@@ -56,6 +60,12 @@ from .workfile_template_builder import (
     update_placeholder,
     NukeTemplateBuilder,
 )
+from .scene_index import (
+    get_scene_index,
+    invalidate_scene_index,
+    on_knob_changed,
+)
+from .render_manifest import on_after_render
 from .workio import (
     open_file,
     save_file,
@@ -119,8 +129,6 @@ class NukeHost(
         register_inventory_action_path(INVENTORY_PATH)
         register_workfile_build_plugin_path(WORKFILE_BUILD_PATH)
 
-        # Register AYON event for workfiles loading.
-        register_event_callback("workio.open_file", check_inventory_versions)
         register_event_callback("taskChanged", change_context_label)
 
         _install_menu()
@@ -158,12 +166,30 @@ def add_nuke_callbacks():
     # template builder callbacks
     nuke.addOnCreate(start_workfile_template_builder, nodeClass="Root")
 
+    # keep scene index in sync with node graph changes
+    nuke.addOnCreate(invalidate_scene_index)
+    nuke.addOnDestroy(invalidate_scene_index)
+    nuke.addKnobChanged(on_knob_changed)
+
+    # store manifest of rendered frames next to instance write outputs
+    nuke.addAfterRender(on_after_render, nodeClass="Write")
+
     # fix ffmpeg settings on script
     nuke.addOnScriptLoad(on_script_load)
 
     # set checker for last versions on loaded containers
-    nuke.addOnScriptLoad(check_inventory_versions)
-    nuke.addOnScriptSave(check_inventory_versions)
+    # - script save is using cached version statuses
+    if nuke_settings["general"].get("async_inventory_check"):
+        on_load_inventory_check = check_inventory_versions_async
+        on_save_inventory_check = update_inventory_versions_async
+    else:
+        on_load_inventory_check = check_inventory_versions
+        on_save_inventory_check = update_inventory_versions
+
+    # Register AYON event for workfiles loading.
+    register_event_callback("workio.open_file", on_load_inventory_check)
+    nuke.addOnScriptLoad(on_load_inventory_check)
+    nuke.addOnScriptSave(on_save_inventory_check)
 
     # set apply all workfile settings on script load and save
     nuke.addOnScriptLoad(WorkfileSettings().set_context_settings)
@@ -450,14 +476,29 @@ def parse_container(node):
         dict: The container schema data for this container node.
 
     """
-    data = read_avalon_data(node)
+    if not has_avalon_data(node):
+        return
+    return _get_container_data(node, read_avalon_data(node))
+
+
+def _get_container_data(node, avalon_data):
+    """Returns container data from avalon knob data of a node
+
+    Arguments:
+        node (nuke.Node): Nuke's node object with imprinted data
+        avalon_data (dict): Data read from the node's avalon knobs
 
+    Returns:
+        dict: The container schema data for this container node.
+
+    """
     # If not all required data return the empty container
     required = ["schema", "id", "name",
                 "namespace", "loader", "representation"]
-    if not all(key in data for key in required):
+    if not all(key in avalon_data for key in required):
         return
 
+    data = dict(avalon_data)
     # Store the node's name
     data.update({
         "objectName": node.fullName(),
@@ -500,12 +541,8 @@ def ls():
     need to implement a for-loop that then *yields* one Container at
     a time.
     """
-    all_nodes = nuke.allNodes(recurseGroups=False)
-
-    nodes = [n for n in all_nodes]
-
-    for n in nodes:
-        container = parse_container(n)
+    for node, avalon_data in get_scene_index().containers:
+        container = _get_container_data(node, avalon_data)
         if container:
             yield container
 
@@ -525,7 +562,7 @@ def list_instances(creator_id=None):
     product_instances = []
     instance_ids = set()
 
-    for node in nuke.allNodes(recurseGroups=True):
+    for node, instance_data in get_scene_index().instances:
 
         if node.Class() in ["Viewer", "Dot"]:
             continue
@@ -537,12 +574,9 @@ def list_instances(creator_id=None):
             # pass if disable knob doesn't exist
             pass
 
-        # get data from avalon knob
-        instance_data = get_node_data(
-            node, INSTANCE_DATA_KNOB)
-
-        if not instance_data:
-            continue
+        # index data are shared so make sure they are not modified
+        # - node data are copied on write so the copy is cheap
+        instance_data = instance_data.copy()
 
         if instance_data["id"] not in {
             AYON_INSTANCE_ID, AVALON_INSTANCE_ID
@@ -40,13 +40,19 @@ from .lib import (
     set_node_data,
     get_node_data,
     get_view_process_node,
-    get_filenames_without_hash,
     link_knobs
 )
 from .pipeline import (
     list_instances,
     remove_instance
 )
+from .publish_cache import (
+    TEMP_NODES_CACHE_SECTION,
+    get_publish_cache,
+    get_instance_cache_key,
+)
+from .scene_index import get_scene_index
+from .sequence import FrameRanges, PathTemplate, SequenceFiles
 from ayon_nuke.api.lib import get_work_default_directory
 
 
@@ -93,16 +99,7 @@ class NukeCreator(NewCreator):
             product_name (str): Product name
         """
 
-        for node in nuke.allNodes(recurseGroups=True):
-            # make sure testing node is having instance knob
-            if INSTANCE_DATA_KNOB not in node.knobs().keys():
-                continue
-            node_data = get_node_data(node, INSTANCE_DATA_KNOB)
-
-            if not node_data:
-                # a node has no instance data
-                continue
-
+        for _node, node_data in get_scene_index().instances:
             # test if product name is matching
             if node_data.get("productType") == product_name:
                 raise NukeCreatorError(
@@ -450,14 +447,12 @@ def get_instance_group_node_childs(instance):
     if node.Class() != "Group":
         return
 
-    # collect child nodes
-    child_nodes = []
-    # iterate all nodes
-    for node in nuke.allNodes(group=node):
-        # add contained nodes to instance's node list
-        child_nodes.append(node)
-
-    return child_nodes
+    # children are listed once per publish
+    return get_publish_cache(instance.context).get_or_compute(
+        "childNodes",
+        get_instance_cache_key(instance),
+        lambda: list(nuke.allNodes(group=node))
+    )
 
 
 def get_colorspace_from_node(node):
@@ -575,6 +570,50 @@ class ExporterReview(object):
         self.staging_dir = self.instance.data["stagingDir"]
         self.collection = self.instance.data.get("collection", None)
         self.data = {"representations": []}
+        self._temp_node_keys = set()
+
+    def get_temp_nodes(self, key):
+        """Temporary nodes created for review data of the instance.
+
+        Nodes are kept in publish cache until they are deleted by
+        `delete_temp_nodes` or `delete_all_temp_nodes`.
+
+        Args:
+            key (str): Key of temporary nodes in the instance.
+
+        Returns:
+            list[nuke.Node]: Temporary nodes.
+        """
+        self._temp_node_keys.add(key)
+        return get_publish_cache(self.instance.context).get_or_compute(
+            TEMP_NODES_CACHE_SECTION,
+            (get_instance_cache_key(self.instance), key),
+            list
+        )
+
+    def delete_temp_nodes(self, key):
+        """Delete temporary nodes and release them from publish cache.
+
+        Args:
+            key (str): Key of temporary nodes in the instance.
+        """
+        nodes = get_publish_cache(self.instance.context).pop(
+            TEMP_NODES_CACHE_SECTION,
+            (get_instance_cache_key(self.instance), key),
+            []
+        )
+        for node in nodes:
+            nuke.delete(node)
+
+    def delete_all_temp_nodes(self):
+        """Delete temporary nodes of all keys used by the exporter.
+
+        Should be called by extractors in `finally` block, so temporary
+        nodes are not left in the script after failed extraction.
+        """
+        for key in self._temp_node_keys:
+            self.delete_temp_nodes(key)
+        self._temp_node_keys.clear()
 
     def get_file_info(self):
         if self.collection:
@@ -645,9 +684,15 @@ class ExporterReview(object):
                 "frameEnd": self.last_frame,
             })
         if ".{}".format(self.ext) not in VIDEO_EXTENSIONS:
-            filenames = get_filenames_without_hash(
-                self.file, self.first_frame, self.last_frame)
-            repre["files"] = filenames
+            template = PathTemplate.parse(self.file)
+            if template is not None:
+                # lazy filenames are expanded by `ExpandSequenceFiles`
+                repre["files"] = SequenceFiles.from_template(
+                    template,
+                    FrameRanges([(self.first_frame, self.last_frame)])
+                )
+            else:
+                repre["files"] = []
 
         if self.multiple_presets:
             repre["outputName"] = self.name
@@ -690,7 +735,6 @@ class ExporterReviewLut(ExporterReview):
 
 
     """
-    _temp_nodes = []
 
     def __init__(self,
                  klass,
@@ -726,10 +770,12 @@ class ExporterReviewLut(ExporterReview):
         self.path = os.path.join(
             self.staging_dir, self.file).replace("\\", "/")
 
+    @property
+    def _temp_nodes(self):
+        return self.get_temp_nodes(self.name)
+
     def clean_nodes(self):
-        for node in self._temp_nodes:
-            nuke.delete(node)
-        self._temp_nodes = []
+        self.delete_temp_nodes(self.name)
         self.log.info("Deleted nodes...")
 
     def generate_lut(self, **kwargs):
@@ -805,7 +851,6 @@ class ExporterReviewMov(ExporterReview):
         instance (pyblish.instance): instance of pyblish context
 
     """
-    _temp_nodes = {}
 
     def __init__(self,
                  klass,
@@ -852,9 +897,7 @@ class ExporterReviewMov(ExporterReview):
             self.staging_dir, self.file).replace("\\", "/")
 
     def clean_nodes(self, node_name):
-        for node in self._temp_nodes[node_name]:
-            nuke.delete(node)
-        self._temp_nodes[node_name] = []
+        self.delete_temp_nodes(node_name)
         self.log.info("Deleted nodes...")
 
     def render(self, render_node_name):
@@ -912,7 +955,6 @@ class ExporterReviewMov(ExporterReview):
         self.log.info(f"__ add_custom_tags: `{add_custom_tags}`")
 
         product_name = self.instance.data["productName"]
-        self._temp_nodes[product_name] = []
 
         # Read node
         r_node = nuke.createNode("Read")
@@ -1050,8 +1092,8 @@ class ExporterReviewMov(ExporterReview):
 
         # connect
         write_node.setInput(0, self.previous_node)
-        self._temp_nodes[product_name].append(write_node)
-        self.log.debug(f"Write...   `{self._temp_nodes[product_name]}`")
+        self.get_temp_nodes(product_name).append(write_node)
+        self.log.debug(f"Write...   `{self.get_temp_nodes(product_name)}`")
         # ---------- end nodes creation
 
         # ---------- render or save to nk
@@ -1087,9 +1129,9 @@ class ExporterReviewMov(ExporterReview):
         return self.data
 
     def _shift_to_previous_node_and_temp(self, product_name, node, message):
-        self._temp_nodes[product_name].append(node)
+        self.get_temp_nodes(product_name).append(node)
         self.previous_node = node
-        self.log.debug(message.format(self._temp_nodes[product_name]))
+        self.log.debug(message.format(self.get_temp_nodes(product_name)))
 
     def _connect_to_above_nodes(self, node, product_name, message):
         node.setInput(0, self.previous_node)
@@ -0,0 +1,179 @@
+"""Cache of values computed during a single publish.
+
+The cache is stored in publish context data, so it lives only as long
+as the context of one publish. Values are grouped in sections (e.g.
+"childNodes", "groupIndex", "frameRange") and keyed by instance id, so
+renamed instances never receive values of other nodes. Plugins sharing
+values should read them with `get_or_compute` and release sections
+with `evict` once they are not needed anymore. Whatever is left is
+released by `release_publish_cache` at the end of successful publish,
+cache of failed publish is released together with its context.
+"""
+import nuke
+
+PUBLISH_CACHE_KEY = "ayonNukePublishCache"
+# section of nodes which are deleted when the cache is released
+TEMP_NODES_CACHE_SECTION = "temporaryNodes"
+
+_MISSING = object()
+
+
+class PublishCache(object):
+    """Values shared by publish plugins grouped by section and key."""
+
+    def __init__(self):
+        self._sections = {}
+
+    def get(self, section, key, default=None):
+        """Get cached value.
+
+        Args:
+            section (str): Section name.
+            key (Hashable): Key of value in section.
+            default (Any): Value returned when key is not cached.
+
+        Returns:
+            Any: Cached value or default.
+        """
+        return self._sections.get(section, {}).get(key, default)
+
+    def set(self, section, key, value):
+        """Store value in cache.
+
+        Args:
+            section (str): Section name.
+            key (Hashable): Key of value in section.
+            value (Any): Value to store.
+        """
+        self._sections.setdefault(section, {})[key] = value
+
+    def get_or_compute(self, section, key, func):
+        """Get cached value or compute and store it.
+
+        Args:
+            section (str): Section name.
+            key (Hashable): Key of value in section.
+            func (Callable[[], Any]): Function computing the value.
+
+        Returns:
+            Any: Cached or computed value.
+        """
+        values = self._sections.setdefault(section, {})
+        value = values.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            values[key] = value
+        return value
+
+    def pop(self, section, key, default=None):
+        """Remove value from cache and return it.
+
+        Args:
+            section (str): Section name.
+            key (Hashable): Key of value in section.
+            default (Any): Value returned when key is not cached.
+
+        Returns:
+            Any: Removed value or default.
+        """
+        values = self._sections.get(section)
+        if values is None:
+            return default
+        value = values.pop(key, default)
+        if not values:
+            self._sections.pop(section)
+        return value
+
+    def evict(self, section, key=_MISSING):
+        """Release cached values.
+
+        Args:
+            section (str): Section name.
+            key (Optional[Hashable]): Key of value in section. Whole
+                section is released when not passed.
+        """
+        if key is _MISSING:
+            self._sections.pop(section, None)
+        else:
+            self.pop(section, key)
+
+    def clear(self):
+        """Release all cached values."""
+        self._sections.clear()
+
+    def sections(self):
+        """Names of sections with cached values.
+
+        Returns:
+            list[str]: Section names.
+        """
+        return list(self._sections)
+
+    def items(self, section):
+        """Cached values of section.
+
+        Args:
+            section (str): Section name.
+
+        Returns:
+            list[tuple[Hashable, Any]]: Keys with values.
+        """
+        return list(self._sections.get(section, {}).items())
+
+    def __contains__(self, section):
+        return section in self._sections
+
+
+def get_publish_cache(context):
+    """Get cache of publish context, create it when missing.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        PublishCache: Cache stored in the context data.
+    """
+    cache = context.data.get(PUBLISH_CACHE_KEY)
+    if cache is None:
+        cache = PublishCache()
+        context.data[PUBLISH_CACHE_KEY] = cache
+    return cache
+
+
+def get_instance_cache_key(instance):
+    """Key of instance values in publish cache.
+
+    Instance id is preferred over name, which can change between
+    publishes when the node is renamed.
+
+    Args:
+        instance (pyblish.api.Instance): Publish instance.
+
+    Returns:
+        str: Cache key of instance.
+    """
+    return instance.data.get("instance_id") or instance.data["name"]
+
+
+def release_publish_cache(context):
+    """Release all values cached during publish.
+
+    Called only at the end of successful publish. Temporary nodes are
+    deleted by extractors in `finally` blocks, nodes still left in the
+    cache are deleted from the script.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+    """
+    cache = context.data.pop(PUBLISH_CACHE_KEY, None)
+    if cache is None:
+        return
+
+    for _, nodes in cache.items(TEMP_NODES_CACHE_SECTION):
+        for node in nodes:
+            try:
+                nuke.delete(node)
+            except ValueError:
+                # node was already deleted
+                pass
+    cache.clear()
@@ -0,0 +1,187 @@
+"""Manifest of rendered frames stored next to write node outputs.
+
+Manifest is written after local render of publish instance, by render
+extractor or by 'Render Local' button of write groups, and holds frame
+filenames together with hash of the write node settings. Collectors can
+trust the manifest instead of listing the output directory as long as
+the directory was not modified after the manifest was written.
+
+Reading the manifest costs two stat calls regardless of frame count.
+Frames overwritten in place, which does not change modification time
+of the directory, are not detected.
+"""
+import os
+import json
+import hashlib
+import logging
+import contextlib
+
+import nuke
+
+from .lib import INSTANCE_DATA_KNOB
+from .sequence import PathTemplate
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".ayon_rendered_frames.json"
+MANIFEST_VERSION = 2
+
+# knobs of write node affecting rendered files
+HASHED_KNOB_NAMES = (
+    "file",
+    "file_type",
+    "channels",
+    "colorspace",
+    "datatype",
+    "compression",
+    "views",
+)
+
+
+def get_write_node_hash(write_node):
+    """Hash of write node settings which are affecting rendered files.
+
+    Args:
+        write_node (nuke.Node): Write node.
+
+    Returns:
+        str: Hash of write node settings.
+    """
+    hashed_values = [nuke.filename(write_node)]
+    for knob_name in HASHED_KNOB_NAMES:
+        knob = write_node.knob(knob_name)
+        if knob is not None:
+            hashed_values.append(
+                "{}={}".format(knob_name, knob.toScript()))
+    return hashlib.md5(
+        "\n".join(hashed_values).encode("utf-8")
+    ).hexdigest()
+
+
+def write_render_manifest(write_node):
+    """Write manifest of rendered frames into output directory of node.
+
+    Args:
+        write_node (nuke.Node): Write node.
+
+    Returns:
+        Union[str, None]: Path to written manifest or None if output path
+            of the node is not a sequence.
+    """
+    write_file_path = nuke.filename(write_node)
+    output_dir, filename = os.path.split(write_file_path)
+    template = PathTemplate.parse(write_file_path)
+    if template is None or not os.path.isdir(output_dir):
+        return None
+
+    frames = {
+        str(frame): entry.name
+        for frame, entry in template.iter_directory()
+    }
+
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    # manifest is written as the last file so directory modification
+    # time is not newer than the manifest unless files were changed
+    with open(manifest_path, "w") as stream:
+        json.dump(
+            {
+                "version": MANIFEST_VERSION,
+                "filename": filename,
+                "writeNodeHash": get_write_node_hash(write_node),
+                "frames": frames,
+            },
+            stream
+        )
+    return manifest_path
+
+
+def read_render_manifest(write_node):
+    """Read rendered frames from manifest in output directory of node.
+
+    Manifest is ignored when output directory was modified after the
+    manifest was written or when write node settings changed.
+
+    Args:
+        write_node (nuke.Node): Write node.
+
+    Returns:
+        Union[dict[int, str], None]: Filenames by frame or None if there
+            is no valid manifest.
+    """
+    output_dir, filename = os.path.split(nuke.filename(write_node))
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    try:
+        manifest_mtime = os.path.getmtime(manifest_path)
+        dir_mtime = os.path.getmtime(output_dir)
+    except OSError:
+        return None
+
+    if dir_mtime > manifest_mtime:
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            manifest = json.load(stream)
+    except (OSError, ValueError):
+        log.debug(
+            "Failed to read render manifest '{}'".format(manifest_path),
+            exc_info=True
+        )
+        return None
+
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("filename") != filename
+        or manifest.get("writeNodeHash") != get_write_node_hash(write_node)
+    ):
+        return None
+
+    return {
+        int(frame): frame_filename
+        for frame, frame_filename in manifest["frames"].items()
+    }
+
+
+class _RenderManifestState:
+    deferred = 0
+
+
+@contextlib.contextmanager
+def deferred_render_manifest():
+    """Skip writing of manifest by render callback in the context.
+
+    Used by callers rendering in multiple steps which write the manifest
+    once after all frames are rendered.
+    """
+    _RenderManifestState.deferred += 1
+    try:
+        yield
+    finally:
+        _RenderManifestState.deferred -= 1
+
+
+def on_after_render():
+    """Nuke callback writing manifest after render of instance write node.
+
+    Covers 'Render Local' button of write groups, only write nodes inside
+    of publish instance groups are handled.
+    """
+    if _RenderManifestState.deferred:
+        return
+
+    write_node = nuke.thisNode()
+    full_name = write_node.fullName()
+    if "." not in full_name:
+        return
+
+    group_node = nuke.toNode(full_name.rsplit(".", 1)[0])
+    if group_node is None or group_node.knob(INSTANCE_DATA_KNOB) is None:
+        return
+
+    try:
+        write_render_manifest(write_node)
+    except Exception:
+        log.warning(
+            "Failed to write render manifest for '{}'".format(full_name),
+            exc_info=True
+        )
@@ -0,0 +1,241 @@
+"""Prefetch of representation paths for loading of many representations.
+
+Paths of representations are resolved and colorspace file rules are
+matched in a thread pool before any node is created. Loaders running
+while a prefetch is active reuse the results, so nodes are created on
+the main thread without resolving paths or matching the imageio
+settings for each representation again.
+
+Prefetched data is only a cache, loaders resolve anything missing in
+the same way as without prefetch.
+"""
+import contextlib
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+
+from ayon_core.lib import Logger
+from ayon_core.pipeline import (
+    Anatomy,
+    get_current_project_name,
+    get_representation_path,
+)
+from ayon_core.pipeline.colorspace import (
+    get_imageio_file_rules_colorspace_from_filepath,
+    get_current_context_imageio_config_preset,
+)
+
+from .lib import get_imageio_input_colorspace
+
+DEFAULT_WORKERS = 8
+
+log = Logger.get_logger(__name__)
+
+
+def get_representation_with_hashed_frame(repre_entity):
+    """Convert frame key value of representation to padded hash.
+
+    Args:
+        repre_entity (dict): Representation entity.
+
+    Returns:
+        dict: Copy of representation with hashed frame in context.
+    """
+    new_repre_entity = deepcopy(repre_entity)
+    context = new_repre_entity["context"]
+
+    # Get the frame from the context and hash it
+    frame = context["frame"]
+    hashed_frame = "#" * len(str(frame))
+
+    # Replace the frame with the hash in the originalBasename
+    if (
+        "{originalBasename}" in new_repre_entity["attrib"]["template"]
+    ):
+        origin_basename = context["originalBasename"]
+        context["originalBasename"] = origin_basename.replace(
+            frame, hashed_frame
+        )
+
+    # Replace the frame with the hash in the frame
+    new_repre_entity["context"]["frame"] = hashed_frame
+    return new_repre_entity
+
+
+def get_representation_load_path(repre_entity, root=None):
+    """Path of representation as it is set to read nodes.
+
+    Frame of sequences is replaced with hash pattern.
+
+    Args:
+        repre_entity (dict): Representation entity.
+        root (Optional[dict]): Roots of representation project.
+
+    Returns:
+        str: Path with forward slashes.
+    """
+    if len(repre_entity["files"]) > 1:
+        repre_entity = get_representation_with_hashed_frame(repre_entity)
+    path = get_representation_path(repre_entity, root)
+    return path.replace("\\", "/")
+
+
+class ColorspaceRules(object):
+    """Colorspace file rules resolved once for many files.
+
+    OCIO config preset is resolved on creation and colorspace of each
+    file path is cached.
+
+    Args:
+        project_name (str): Project name.
+        config_data (Optional[dict]): OCIO config preset of current
+            context, resolved when not passed.
+    """
+
+    def __init__(self, project_name, config_data=None):
+        if config_data is None:
+            config_data = get_current_context_imageio_config_preset()
+        self.project_name = project_name
+        self.config_data = config_data
+        self._colorspace_by_path = {}
+
+    def get_colorspace(self, filepath):
+        """Colorspace of a file by file rules.
+
+        Rules of imageio file rules are preferred over `regex_inputs`
+        of nuke imageio settings.
+
+        Args:
+            filepath (str): Path to file.
+
+        Returns:
+            Union[str, None]: Colorspace name or None if no rule matches.
+        """
+        filepath = filepath.replace("\\", "/")
+        if filepath in self._colorspace_by_path:
+            return self._colorspace_by_path[filepath]
+
+        colorspace = get_imageio_file_rules_colorspace_from_filepath(
+            filepath, "nuke", self.project_name, config_data=self.config_data
+        )
+        log.debug(f"Colorspace new filerules: {colorspace}")
+        if not colorspace:
+            # colorspace from `project_settings/nuke/imageio/regexInputs`
+            colorspace = get_imageio_input_colorspace(filepath)
+            log.debug(f"Colorspace old filerules: {colorspace}")
+
+        self._colorspace_by_path[filepath] = colorspace
+        return colorspace
+
+
+class RepresentationPrefetch(object):
+    """Prefetched paths and colorspace rules of representations.
+
+    Args:
+        project_name (str): Project name.
+        workers (Optional[int]): Number of threads resolving paths.
+    """
+
+    def __init__(self, project_name, workers=DEFAULT_WORKERS):
+        self.project_name = project_name
+        self.workers = workers
+        self.colorspace_rules = ColorspaceRules(project_name)
+        self._root = None
+        if project_name != get_current_project_name():
+            self._root = Anatomy(project_name).roots
+        self._path_by_repre_id = {}
+
+    def _resolve_path(self, repre_entity):
+        repre_id = repre_entity["id"]
+        try:
+            path = get_representation_load_path(repre_entity, self._root)
+        except Exception:
+            log.debug(
+                "Path of representation '{}' was not resolved.".format(
+                    repre_id),
+                exc_info=True
+            )
+            return repre_id, None
+
+        if path:
+            self.colorspace_rules.get_colorspace(path)
+        return repre_id, path
+
+    def prefetch(self, repre_entities):
+        """Resolve paths of representations in thread pool.
+
+        Args:
+            repre_entities (Iterable[dict[str, Any]]): Representation
+                entities.
+        """
+        repre_entities = [
+            repre_entity
+            for repre_entity in repre_entities
+            if repre_entity["id"] not in self._path_by_repre_id
+        ]
+        if not repre_entities:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+            for repre_id, path in executor.map(
+                self._resolve_path, repre_entities
+            ):
+                if path:
+                    self._path_by_repre_id[repre_id] = path
+
+    def get_path(self, repre_id):
+        """Prefetched path of representation.
+
+        Args:
+            repre_id (str): Representation id.
+
+        Returns:
+            Union[str, None]: Path with hash frame pattern for sequences
+                or None if path of representation was not prefetched.
+        """
+        return self._path_by_repre_id.get(repre_id)
+
+
+class _RepresentationPrefetchCache:
+    prefetch = None
+
+
+@contextlib.contextmanager
+def representation_prefetch(project_name, workers=DEFAULT_WORKERS):
+    """Keep representation prefetch active in the context.
+
+    Nested contexts reuse the outer prefetch of the same project.
+
+    Args:
+        project_name (str): Project name.
+        workers (Optional[int]): Number of threads resolving paths.
+
+    Yields:
+        RepresentationPrefetch: Active prefetch.
+    """
+    prefetch = _RepresentationPrefetchCache.prefetch
+    if prefetch is not None and prefetch.project_name == project_name:
+        yield prefetch
+        return
+
+    _RepresentationPrefetchCache.prefetch = RepresentationPrefetch(
+        project_name, workers
+    )
+    try:
+        yield _RepresentationPrefetchCache.prefetch
+    finally:
+        _RepresentationPrefetchCache.prefetch = prefetch
+
+
+def get_representation_prefetch(project_name):
+    """Active representation prefetch of a project.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        Union[RepresentationPrefetch, None]: Active prefetch or None.
+    """
+    prefetch = _RepresentationPrefetchCache.prefetch
+    if prefetch is not None and prefetch.project_name == project_name:
+        return prefetch
+    return None
@@ -0,0 +1,137 @@
+"""Single-pass index of pipeline related nodes in current script.
+
+Containers, publish instances, workfile template placeholders and write
+groups are gathered in one recursive traversal of the node graph. The
+index is kept until any node is created, destroyed or changed, so the
+publisher, the scene inventory and workfile settings reuse the same walk.
+"""
+import collections
+
+import nuke
+
+from .lib import (
+    INSTANCE_DATA_KNOB,
+    get_node_data,
+    has_avalon_data,
+    read_avalon_data,
+)
+
+# Knobs which are changing often and are not affecting the index content.
+IGNORED_KNOB_NAMES = {
+    "selected",
+    "xpos",
+    "ypos",
+    "showPanel",
+    "hidePanel",
+    "inputChange",
+}
+
+
+class SceneIndex(object):
+    """Pipeline related nodes of current script.
+
+    Nodes are only collected during the traversal, any values which
+    can change without triggering invalidation (e.g. `disable` knob)
+    should be tested by consumers.
+
+    Attributes:
+        containers (list[tuple[nuke.Node, dict]]): Root level nodes with
+            their avalon knob data.
+        instances (list[tuple[nuke.Node, dict]]): Nodes with publish
+            instance data.
+        placeholders (dict[str, nuke.Node]): Nodes with placeholder knob
+            by their full name.
+        write_groups (list[nuke.Node]): Root level group nodes with
+            publish instance or avalon data.
+    """
+
+    def __init__(self):
+        self.containers = []
+        self.instances = []
+        self.placeholders = {}
+        self.write_groups = []
+
+    @classmethod
+    def build(cls):
+        """Traverse all nodes from root recursively and index them.
+
+        Returns:
+            SceneIndex: Index of current script.
+        """
+        index = cls()
+        groups = collections.deque()
+        groups.append((nuke.root(), True))
+        while groups:
+            group, is_root = groups.popleft()
+            for node in group.nodes():
+                is_group = isinstance(node, nuke.Group)
+                if is_group:
+                    groups.append((node, False))
+                index._add_node(node, is_root, is_group)
+        return index
+
+    def _add_node(self, node, is_root, is_group):
+        # single knob lookups are much cheaper than building `knobs()` dict
+        if node.knob("is_placeholder") is not None:
+            self.placeholders[node.fullName()] = node
+
+        has_instance_data = node.knob(INSTANCE_DATA_KNOB) is not None
+        if has_instance_data:
+            instance_data = get_node_data(node, INSTANCE_DATA_KNOB)
+            if instance_data:
+                self.instances.append((node, instance_data))
+
+        if not is_root:
+            return
+
+        avalon_data = None
+        if has_avalon_data(node):
+            avalon_data = read_avalon_data(node)
+            self.containers.append((node, avalon_data))
+
+        if is_group and (has_instance_data or avalon_data):
+            self.write_groups.append(node)
+
+
+class _SceneIndexCache:
+    index = None
+    generation = 0
+
+
+def get_scene_index():
+    """Return index of current script.
+
+    The index is built on first request and reused until invalidated.
+
+    Returns:
+        SceneIndex: Index of current script.
+    """
+    if _SceneIndexCache.index is None:
+        _SceneIndexCache.index = SceneIndex.build()
+    return _SceneIndexCache.index
+
+
+def invalidate_scene_index():
+    """Drop cached index so it is rebuilt on next request."""
+    _SceneIndexCache.index = None
+    _SceneIndexCache.generation += 1
+
+
+def get_scene_generation():
+    """Counter of changes invalidating the scene index.
+
+    Data derived from the scene can be stored with the counter and
+    considered valid while the counter did not change.
+
+    Returns:
+        int: Number of scene index invalidations.
+    """
+    return _SceneIndexCache.generation
+
+
+def on_knob_changed():
+    """Nuke callback invalidating index on relevant knob changes."""
+    knob = nuke.thisKnob()
+    if knob is not None and knob.name() in IGNORED_KNOB_NAMES:
+        return
+    invalidate_scene_index()
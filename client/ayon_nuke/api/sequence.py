@@ -0,0 +1,492 @@
+"""Frame sequence helpers shared by loaders, collectors and extractors.
+
+Paths with single frame pattern are compiled into `PathTemplate` and sets
+of frames are kept as sorted inclusive ranges in `FrameRanges`, so long
+sequences are never expanded into lists unless a consumer asks for it.
+"""
+import os
+import re
+import bisect
+
+# frame number pattern in path, e.g. `%04d`, `%d` or `####`
+FRAME_PATTERN_REGEX = re.compile(r"%(?:0?(\d+))?d|#+")
+# view patterns in path
+VIEW_PATTERN_REGEX = re.compile(r"%[vV]")
+# last number in filename used as frame number in evaluated paths
+FRAME_NUMBER_REGEX = re.compile(r"(-?\d+)(?=\D*$)")
+
+
+class FrameRanges(object):
+    """Set of frames stored as sorted non-overlapping inclusive ranges.
+
+    Args:
+        ranges (Optional[Iterable[tuple[int, int]]]): Inclusive frame
+            ranges, can overlap or be unsorted.
+    """
+
+    def __init__(self, ranges=None):
+        merged = []
+        for start, end in sorted(
+            (int(start), int(end)) for start, end in ranges or []
+        ):
+            if end < start:
+                start, end = end, start
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        self._ranges = [tuple(frame_range) for frame_range in merged]
+        self._starts = [frame_range[0] for frame_range in self._ranges]
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Create ranges from frame numbers.
+
+        Args:
+            frames (Iterable[int]): Frame numbers in any order.
+
+        Returns:
+            FrameRanges: Ranges of frames.
+        """
+        ranges = []
+        for frame in sorted(set(frames)):
+            if ranges and ranges[-1][1] + 1 == frame:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+        return cls(ranges)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse frames string, e.g. `frames_to_fix` value.
+
+        Args:
+            text (str): Frames and ranges separated by comma,
+                e.g. `1001,1005-1010`.
+
+        Returns:
+            FrameRanges: Ranges of frames.
+
+        Raises:
+            ValueError: When string has wrong format.
+        """
+        ranges = []
+        for item in text.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            # negative frames are not supported in ranges
+            parts = [part.strip() for part in item.split("-")]
+            if len(parts) > 2 or not all(part.isdigit() for part in parts):
+                raise ValueError(
+                    "Wrong format of frames {}".format(text))
+            ranges.append((int(parts[0]), int(parts[-1])))
+        return cls(ranges)
+
+    @property
+    def ranges(self):
+        """list[tuple[int, int]]: Sorted inclusive frame ranges."""
+        return list(self._ranges)
+
+    @property
+    def first(self):
+        """Union[int, None]: First frame."""
+        return self._ranges[0][0] if self._ranges else None
+
+    @property
+    def last(self):
+        """Union[int, None]: Last frame."""
+        return self._ranges[-1][1] if self._ranges else None
+
+    def contains_range(self, start, end):
+        """Check if all frames of the range are in the set.
+
+        Args:
+            start (int): First frame of the range.
+            end (int): Last frame of the range.
+
+        Returns:
+            bool: All frames are available.
+        """
+        idx = bisect.bisect_right(self._starts, start) - 1
+        if idx < 0:
+            return False
+        range_start, range_end = self._ranges[idx]
+        return range_start <= start and end <= range_end
+
+    def missing(self, start, end):
+        """Frames of the range which are not in the set.
+
+        Args:
+            start (int): First frame of the range.
+            end (int): Last frame of the range.
+
+        Returns:
+            FrameRanges: Missing frames.
+        """
+        missing = []
+        current = start
+        for range_start, range_end in self._ranges:
+            if range_end < current:
+                continue
+            if range_start > end:
+                break
+            if range_start > current:
+                missing.append((current, range_start - 1))
+            current = range_end + 1
+        if current <= end:
+            missing.append((current, end))
+        return FrameRanges(missing)
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_right(self._starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __iter__(self):
+        for start, end in self._ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self._ranges)
+
+    def __bool__(self):
+        return bool(self._ranges)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrameRanges):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    def __str__(self):
+        return ",".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in self._ranges
+        )
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self)
+
+
+class PathTemplate(object):
+    """Path of a sequence with single frame number.
+
+    Args:
+        head (str): Path part before frame number.
+        padding (int): Frame number padding.
+        tail (str): Path part after frame number.
+    """
+
+    def __init__(self, head, padding, tail):
+        self.head = head
+        self.padding = padding
+        self.tail = tail
+        self._filename_regex = None
+
+    @classmethod
+    def parse(cls, path):
+        """Compile path with hash or printf frame pattern.
+
+        Args:
+            path (str): Path with single frame pattern, e.g.
+                `/path/file.%04d.exr`, `/path/file.%d.exr` or
+                `/path/file.####.exr`.
+
+        Returns:
+            Union[PathTemplate, None]: Template or None if path has no or
+                multiple frame patterns, or has view pattern.
+        """
+        matches = list(FRAME_PATTERN_REGEX.finditer(path))
+        if len(matches) != 1 or VIEW_PATTERN_REGEX.search(path):
+            return None
+
+        match = matches[0]
+        if match.group(0).startswith("#"):
+            padding = len(match.group(0))
+        else:
+            padding = int(match.group(1) or 0)
+        return cls(path[:match.start()], padding, path[match.end():])
+
+    @classmethod
+    def from_frame_path(cls, path):
+        """Compile path of a single frame file of a sequence.
+
+        Last number in filename is considered to be frame number.
+
+        Args:
+            path (str): Path to a file, e.g. `/path/file.1001.exr`.
+
+        Returns:
+            Union[PathTemplate, None]: Template or None if filename does
+                not contain any number.
+        """
+        filename = os.path.basename(path)
+        match = FRAME_NUMBER_REGEX.search(filename)
+        if match is None:
+            return None
+        offset = len(path) - len(filename)
+        return cls(
+            path[:offset + match.start()],
+            len(match.group(1).lstrip("-")),
+            filename[match.end():]
+        )
+
+    @property
+    def dirname(self):
+        """str: Directory of the sequence."""
+        return os.path.dirname(self.head)
+
+    @property
+    def printf_path(self):
+        """str: Path with printf frame pattern, e.g. `file.%04d.exr`."""
+        return "{}%0{}d{}".format(self.head, self.padding, self.tail)
+
+    @property
+    def hash_path(self):
+        """str: Path with hash frame pattern, e.g. `file.####.exr`."""
+        return "{}{}{}".format(
+            self.head, "#" * max(self.padding, 1), self.tail)
+
+    def format(self, frame):
+        """Path of a frame.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            str: Path to frame file.
+        """
+        return "{}{:0{}d}{}".format(
+            self.head, int(frame), self.padding, self.tail)
+
+    def iter_paths(self, frames):
+        """Lazily iterate paths of frames.
+
+        Args:
+            frames (Iterable[int]): Frame numbers, e.g. `FrameRanges`.
+
+        Yields:
+            str: Path to frame file.
+        """
+        for frame in frames:
+            yield self.format(frame)
+
+    def match_filename(self, filename):
+        """Frame number of a filename matching the template.
+
+        Args:
+            filename (str): Filename without directory.
+
+        Returns:
+            Union[int, None]: Frame number or None if filename does not
+                match the template or has different padding.
+        """
+        if self._filename_regex is None:
+            self._filename_regex = re.compile("^{}(-?\\d+){}$".format(
+                re.escape(os.path.basename(self.head)),
+                re.escape(self.tail)
+            ))
+        result = self._filename_regex.match(filename)
+        if result is None:
+            return None
+        frame_str = result.group(1)
+        frame = int(frame_str)
+        if frame_str != "{:0{}d}".format(frame, self.padding):
+            return None
+        return frame
+
+    def iter_directory(self, dirname=None):
+        """Iterate files of the sequence in single directory scan.
+
+        Args:
+            dirname (Optional[str]): Directory to scan, by default
+                directory of the template.
+
+        Yields:
+            tuple[int, os.DirEntry]: Frame number and directory entry.
+        """
+        dirname = dirname or self.dirname
+        if not os.path.isdir(dirname):
+            return
+
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                frame = self.match_filename(entry.name)
+                if frame is not None:
+                    yield frame, entry
+
+    def scan_frames(self, dirname=None):
+        """Frames of the sequence existing on disk.
+
+        Args:
+            dirname (Optional[str]): Directory to scan, by default
+                directory of the template.
+
+        Returns:
+            FrameRanges: Existing frames.
+        """
+        return FrameRanges.from_frames(
+            frame for frame, _ in self.iter_directory(dirname)
+        )
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.printf_path)
+
+
+class SequenceFiles(object):
+    """Compact lazy list of sequence filenames for representation files.
+
+    Only head, padding, tail and frame ranges are stored, filenames are
+    generated on demand. Use `expand_sequence_files` to convert it to
+    plain list where a list is required.
+
+    Args:
+        head (str): Filename part before frame number.
+        padding (int): Frame number padding.
+        tail (str): Filename part after frame number.
+        frames (FrameRanges): Frames of the sequence.
+    """
+
+    def __init__(self, head, padding, tail, frames):
+        self._head = head
+        self._padding = padding
+        self._tail = tail
+        self._frames = frames
+
+    @property
+    def head(self):
+        """str: Filename part before frame number."""
+        return self._head
+
+    @property
+    def padding(self):
+        """int: Frame number padding."""
+        return self._padding
+
+    @property
+    def tail(self):
+        """str: Filename part after frame number."""
+        return self._tail
+
+    @property
+    def frames(self):
+        """FrameRanges: Frames of the sequence."""
+        return self._frames
+
+    @classmethod
+    def from_template(cls, template, frames):
+        """Create filenames of a path template.
+
+        Args:
+            template (PathTemplate): Path template of the sequence.
+            frames (FrameRanges): Frames of the sequence.
+
+        Returns:
+            SequenceFiles: Lazy list of filenames.
+        """
+        return cls(
+            os.path.basename(template.head),
+            template.padding,
+            template.tail,
+            frames
+        )
+
+    def format(self, frame):
+        """Filename of a frame.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            str: Filename.
+        """
+        return "{}{:0{}d}{}".format(
+            self.head, int(frame), self.padding, self.tail)
+
+    def to_list(self):
+        """Expand to plain list of filenames.
+
+        Returns:
+            list[str]: Filenames sorted by frame.
+        """
+        return list(self)
+
+    def __iter__(self):
+        for frame in self.frames:
+            yield self.format(frame)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __bool__(self):
+        return bool(self.frames)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            return self.to_list()[index]
+        if index < 0:
+            index += len(self)
+        for start, end in self.frames.ranges:
+            length = end - start + 1
+            if 0 <= index < length:
+                return self.format(start + index)
+            index -= length
+        raise IndexError("SequenceFiles index out of range")
+
+    def __contains__(self, filename):
+        if not (
+            filename.startswith(self.head)
+            and filename.endswith(self.tail)
+        ):
+            return False
+        frame_str = filename[len(self.head):len(filename) - len(self.tail)]
+        try:
+            frame = int(frame_str)
+        except ValueError:
+            return False
+        return (
+            frame_str == "{:0{}d}".format(frame, self.padding)
+            and frame in self.frames
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, SequenceFiles):
+            return (
+                (self.head, self.padding, self.tail, self.frames)
+                == (other.head, other.padding, other.tail, other.frames)
+            )
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    # attributes are read-only and frame ranges immutable, copies can
+    #   share the descriptor
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "<{} {}%0{}d{} [{}]>".format(
+            self.__class__.__name__,
+            self.head,
+            self.padding,
+            self.tail,
+            self.frames
+        )
+
+
+def expand_sequence_files(files):
+    """Convert lazy sequence files to plain list.
+
+    Args:
+        files (Union[str, list[str], SequenceFiles]): Representation files.
+
+    Returns:
+        Union[str, list[str]]: Files with `SequenceFiles` expanded.
+    """
+    if isinstance(files, SequenceFiles):
+        return files.to_list()
+    return files
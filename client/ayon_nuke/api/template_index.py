@@ -0,0 +1,201 @@
+"""Pre-parsed placeholders of workfile template files.
+
+Placeholders of a pasted template are indexed once per version of the
+template file, with knob values of placeholder nodes. Next imports of
+the same template file resolve placeholders by their names, so the
+scene does not have to be traversed and knobs of placeholder nodes do
+not have to be read again.
+
+Version of template file is identified by modification time and hash
+of its content, hash is computed only when modification time changed.
+Indexes of the most recently used template files are kept.
+"""
+import collections
+import hashlib
+import os
+
+import nuke
+
+# number of template files kept in cache, least recently used are dropped
+MAX_CACHED_TEMPLATES = 16
+# knobs of placeholder nodes which are always indexed
+PLACEHOLDER_KNOB_NAMES = {
+    "is_placeholder",
+    "empty",
+    "plugin_identifier",
+    "nb_children",
+    "siblings",
+}
+# knobs with list of values, other knobs are read with `getValue`
+LIST_KNOB_NAMES = {"siblings"}
+
+
+def read_placeholder_knob_values(node, knob_names):
+    """Read values of placeholder knobs of a node.
+
+    Args:
+        node (nuke.Node): Placeholder node.
+        knob_names (Iterable[str]): Names of read knobs.
+
+    Returns:
+        dict[str, Any]: Values by knob name, missing knobs are skipped.
+    """
+    knob_values = {}
+    for knob_name in knob_names:
+        # single knob lookups are much cheaper than building `knobs()` dict
+        knob = node.knob(knob_name)
+        if knob is None:
+            continue
+        if knob_name in LIST_KNOB_NAMES:
+            knob_values[knob_name] = knob.values()
+        else:
+            knob_values[knob_name] = knob.getValue()
+    return knob_values
+
+
+class TemplatePlaceholder(object):
+    """Placeholder node of a template.
+
+    Args:
+        name (str): Full name of node in pasted template.
+        knob_values (dict[str, Any]): Values of placeholder knobs.
+    """
+
+    def __init__(self, name, knob_values):
+        self.name = name
+        self.knob_values = knob_values
+
+
+class TemplateIndex(object):
+    """Placeholders of a template file.
+
+    Args:
+        root_names (Iterable[str]): Names of pasted root nodes.
+        placeholders (Iterable[TemplatePlaceholder]): Placeholders.
+        knob_names (Iterable[str]): Names of indexed knobs.
+    """
+
+    def __init__(self, root_names, placeholders, knob_names):
+        self.root_names = set(root_names)
+        self.placeholders = list(placeholders)
+        self.knob_names = set(knob_names)
+
+    @classmethod
+    def build(cls, nodes, knob_names):
+        """Index placeholders of pasted template nodes.
+
+        Args:
+            nodes (list[nuke.Node]): Pasted root nodes of template.
+            knob_names (Iterable[str]): Names of placeholder knobs to
+                index.
+
+        Returns:
+            TemplateIndex: Index of the template.
+        """
+        knob_names = set(knob_names) | PLACEHOLDER_KNOB_NAMES
+        placeholders = []
+        queue = collections.deque(nodes)
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, nuke.Group):
+                queue.extend(node.nodes())
+
+            if node.knob("is_placeholder") is None:
+                continue
+            placeholders.append(TemplatePlaceholder(
+                node.fullName(),
+                read_placeholder_knob_values(node, knob_names),
+            ))
+
+        return cls(
+            (node.name() for node in nodes), placeholders, knob_names
+        )
+
+    def resolve(self, nodes):
+        """Find placeholder nodes of pasted template.
+
+        Args:
+            nodes (list[nuke.Node]): Pasted root nodes of template.
+
+        Returns:
+            Union[dict[str, tuple[nuke.Node, TemplatePlaceholder]], None]:
+                Placeholder nodes with their placeholders by full name
+                or None if pasted nodes were renamed.
+        """
+        if {node.name() for node in nodes} != self.root_names:
+            return None
+
+        output = {}
+        for placeholder in self.placeholders:
+            node = nuke.toNode(placeholder.name)
+            if node is None:
+                return None
+            output[placeholder.name] = (node, placeholder)
+        return output
+
+
+def _get_file_hash(path):
+    file_hash = hashlib.sha1()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class _TemplateIndexCache:
+    entries = collections.OrderedDict()
+
+
+def get_cached_template_index(path):
+    """Index of template file if the file did not change.
+
+    Args:
+        path (str): Path to template file.
+
+    Returns:
+        Union[TemplateIndex, None]: Cached index or None.
+    """
+    path = os.path.normpath(path)
+    entry = _TemplateIndexCache.entries.get(path)
+    if entry is None:
+        return None
+
+    try:
+        mtime = os.path.getmtime(path)
+        changed = (
+            mtime != entry["mtime"]
+            and _get_file_hash(path) != entry["hash"]
+        )
+    except OSError:
+        changed = True
+
+    if changed:
+        _TemplateIndexCache.entries.pop(path, None)
+        return None
+
+    # file was touched but content is same
+    entry["mtime"] = mtime
+    _TemplateIndexCache.entries.move_to_end(path)
+    return entry["index"]
+
+
+def cache_template_index(path, template_index):
+    """Store index of template file for current version of the file.
+
+    Args:
+        path (str): Path to template file.
+        template_index (TemplateIndex): Index of the template.
+    """
+    path = os.path.normpath(path)
+    try:
+        entry = {
+            "mtime": os.path.getmtime(path),
+            "hash": _get_file_hash(path),
+            "index": template_index,
+        }
+    except OSError:
+        return
+    _TemplateIndexCache.entries[path] = entry
+    _TemplateIndexCache.entries.move_to_end(path)
+    while len(_TemplateIndexCache.entries) > MAX_CACHED_TEMPLATES:
+        _TemplateIndexCache.entries.popitem(last=False)
@@ -1,10 +1,15 @@
-import collections
+import json
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
 import nuke
+import ayon_api
 
 from ayon_core.pipeline import registered_host
 from ayon_core.pipeline.workfile.workfile_template_builder import (
     AbstractTemplateBuilder,
     PlaceholderPlugin,
+    PlaceholderLoadMixin,
 )
 from ayon_core.tools.workfile_template_build import (
     WorkfileBuildPlaceholderDialog,
@@ -15,13 +20,283 @@ from .lib import (
     get_main_window,
     WorkfileSettings,
 )
+from .dag_index import DagSpatialIndex
+from .scene_index import (
+    get_scene_index,
+    get_scene_generation,
+)
+from .template_index import (
+    PLACEHOLDER_KNOB_NAMES,
+    TemplateIndex,
+    get_cached_template_index,
+    cache_template_index,
+    read_placeholder_knob_values,
+)
+from .representation_prefetch import (
+    DEFAULT_WORKERS,
+    representation_prefetch,
+)
 
 PLACEHOLDER_SET = "PLACEHOLDERS_SET"
 
 
+class NodeCreationJournal(object):
+    """Record nodes created in a group while the journal is recording.
+
+    Nodes are recorded by `onCreate` callback, so nodes created by
+    a placeholder population are known without comparing all nodes of
+    the script before and after the population.
+
+    Args:
+        group (Optional[nuke.Node]): Group in which created nodes are
+            recorded, current context group when not passed.
+    """
+
+    def __init__(self, group=None):
+        if group is None:
+            group = nuke.thisGroup()
+        self._group_name = (
+            "" if group.Class() == "Root" else group.fullName()
+        )
+        self._nodes = []
+        self._recording = False
+
+    def _on_create(self):
+        self._nodes.append(nuke.thisNode())
+
+    def start(self):
+        """Start recording of created nodes."""
+        if self._recording:
+            return
+        self._recording = True
+        nuke.addOnCreate(self._on_create)
+
+    def stop(self):
+        """Stop recording of created nodes."""
+        if not self._recording:
+            return
+        self._recording = False
+        nuke.removeOnCreate(self._on_create)
+
+    def pop_nodes(self):
+        """Get recorded nodes which still exist and clear the journal.
+
+        Returns:
+            list[nuke.Node]: Created nodes directly in the journal group,
+                in order of creation.
+        """
+        nodes = []
+        node_names = set()
+        for node in self._nodes:
+            try:
+                full_name = node.fullName()
+            except ValueError:
+                # node was deleted after creation
+                continue
+            if full_name.rpartition(".")[0] != self._group_name:
+                continue
+            if full_name in node_names:
+                continue
+            node_names.add(full_name)
+            nodes.append(node)
+        self._nodes = []
+        return nodes
+
+
+def get_placeholder_representations_query(plugin):
+    """Method of load placeholder plugin querying its representations.
+
+    Uses private `PlaceholderLoadMixin._get_representations` of
+    ayon-core, the only method returning representations of a placeholder
+    without loading them.
+
+    Args:
+        plugin (PlaceholderLoadMixin): Load placeholder plugin.
+
+    Returns:
+        Union[Callable[[PlaceholderItem], list[dict]], None]: Bound method
+            or None if ayon-core does not provide the method with expected
+            signature.
+    """
+    method = getattr(plugin, "_get_representations", None)
+    if method is None:
+        return None
+    try:
+        inspect.signature(method).bind(None)
+    except (TypeError, ValueError):
+        return None
+    return method
+
+
 class NukeTemplateBuilder(AbstractTemplateBuilder):
     """Concrete implementation of AbstractTemplateBuilder for nuke"""
 
+    prefetch_workers = DEFAULT_WORKERS
+
+    def __init__(self, *args, **kwargs):
+        super(NukeTemplateBuilder, self).__init__(*args, **kwargs)
+        self._prefetched_representations = {}
+        self._template_placeholders = None
+
+    def populate_scene_placeholders(self, *args, **kwargs):
+        """Populate placeholders with prefetched representations.
+
+        Representations of all load placeholders found in the scene are
+        queried and their files resolved before population. Placeholders
+        created by the population are queried during their population.
+        """
+        with representation_prefetch(
+            self.project_name, self.prefetch_workers
+        ) as prefetch:
+            self.prefetch_representations(self.get_placeholders(), prefetch)
+            try:
+                return super(
+                    NukeTemplateBuilder, self
+                ).populate_scene_placeholders(*args, **kwargs)
+            finally:
+                self._prefetched_representations = {}
+
+    def prefetch_representations(self, placeholders, prefetch):
+        """Query representations of load placeholders concurrently.
+
+        Placeholders with same load options share one query. Files of
+        last versions of queried representations are resolved by
+        the prefetch in thread pool.
+
+        Args:
+            placeholders (list[PlaceholderItem]): Placeholders.
+            prefetch (RepresentationPrefetch): Active prefetch.
+        """
+        placeholders_by_key = {}
+        skipped_identifiers = set()
+        for placeholder in placeholders:
+            plugin = placeholder.plugin
+            if not isinstance(plugin, PlaceholderLoadMixin):
+                continue
+            if get_placeholder_representations_query(plugin) is None:
+                skipped_identifiers.add(plugin.identifier)
+                continue
+            query_data = {
+                key: placeholder.data.get(key)
+                for key in plugin.get_placeholder_keys()
+            }
+            query_data["plugin_identifier"] = plugin.identifier
+            key = json.dumps(query_data, sort_keys=True, default=str)
+            placeholders_by_key.setdefault(key, []).append(placeholder)
+
+        for identifier in sorted(skipped_identifiers):
+            self.log.warning(
+                "Representations of placeholders of '{}' are not"
+                " prefetched, ayon-core does not provide"
+                " '_get_representations'.".format(identifier)
+            )
+
+        if not placeholders_by_key:
+            return
+
+        self._cache_context_entities()
+
+        def _query(key):
+            placeholder = placeholders_by_key[key][0]
+            query = get_placeholder_representations_query(placeholder.plugin)
+            try:
+                return key, query(placeholder)
+            except Exception:
+                self.log.warning(
+                    "Prefetch of representations of placeholder '{}'"
+                    " failed.".format(placeholder.scene_identifier),
+                    exc_info=True
+                )
+                return key, None
+
+        repre_entities_by_id = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.prefetch_workers)
+        ) as executor:
+            for key, repre_entities in executor.map(
+                _query, placeholders_by_key
+            ):
+                if repre_entities is None:
+                    continue
+                repre_entities = list(repre_entities)
+                for placeholder in placeholders_by_key[key]:
+                    self._prefetched_representations[
+                        placeholder.scene_identifier
+                    ] = repre_entities
+                for repre_entity in repre_entities:
+                    repre_entities_by_id[repre_entity["id"]] = repre_entity
+
+        prefetch.prefetch(
+            self._filter_last_version_representations(
+                list(repre_entities_by_id.values())
+            )
+        )
+
+    def _cache_context_entities(self):
+        """Query context entities cached by builder on main thread.
+
+        Representation queries of placeholders are using the entities,
+        querying them before the queries are running in parallel avoids
+        duplicated queries and access to host context from threads.
+        """
+        _ = self.current_folder_entity
+        _ = self.current_task_entity
+        _ = self.linked_folder_entities
+
+    def _filter_last_version_representations(self, repre_entities):
+        """Keep only representations of last versions of products.
+
+        Args:
+            repre_entities (list[dict[str, Any]]): Representation
+                entities.
+
+        Returns:
+            list[dict[str, Any]]: Representations of last versions.
+        """
+        version_ids = {
+            repre_entity["versionId"] for repre_entity in repre_entities
+        }
+        if not version_ids:
+            return []
+
+        last_version_by_product_id = {}
+        for version_entity in ayon_api.get_versions(
+            self.project_name,
+            version_ids=version_ids,
+            fields={"id", "version", "productId"},
+        ):
+            product_id = version_entity["productId"]
+            last_version = last_version_by_product_id.get(product_id)
+            if (
+                last_version is None
+                or version_entity["version"] > last_version["version"]
+            ):
+                last_version_by_product_id[product_id] = version_entity
+
+        last_version_ids = {
+            version_entity["id"]
+            for version_entity in last_version_by_product_id.values()
+        }
+        return [
+            repre_entity
+            for repre_entity in repre_entities
+            if repre_entity["versionId"] in last_version_ids
+        ]
+
+    def get_prefetched_representations(self, placeholder):
+        """Representations of placeholder queried by prefetch.
+
+        Args:
+            placeholder (PlaceholderItem): Load placeholder.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Representation entities or
+                None if placeholder was not prefetched.
+        """
+        return self._prefetched_representations.get(
+            placeholder.scene_identifier
+        )
+
     def import_template(self, path):
         """Import template into current scene.
         Block if a template is already loaded.
@@ -36,11 +311,92 @@ class NukeTemplateBuilder(AbstractTemplateBuilder):
 
         # TODO check if the template is already imported
 
+        self._template_placeholders = None
+        is_root = nuke.thisGroup().Class() == "Root"
+        scene_placeholders = {}
+        if is_root:
+            scene_placeholders = dict(get_scene_index().placeholders)
+
+        reset_selection()
         nuke.nodePaste(path)
+        if is_root:
+            self._index_template_placeholders(
+                path, nuke.selectedNodes(), scene_placeholders
+            )
         reset_selection()
 
         return True
 
+    def _index_template_placeholders(
+        self, path, pasted_nodes, scene_placeholders
+    ):
+        """Store placeholders of pasted template for their collection.
+
+        Index of template file is reused when the template file did not
+        change since last import.
+
+        Args:
+            path (str): Path to template file.
+            pasted_nodes (list[nuke.Node]): Pasted root nodes.
+            scene_placeholders (dict[str, nuke.Node]): Placeholder nodes
+                which were in the scene before the template was pasted.
+        """
+        knob_names = self.get_placeholder_knob_names()
+        template_index = get_cached_template_index(path)
+        resolved = None
+        if (
+            template_index is not None
+            and knob_names <= template_index.knob_names
+        ):
+            resolved = template_index.resolve(pasted_nodes)
+
+        if resolved is None:
+            template_index = TemplateIndex.build(pasted_nodes, knob_names)
+            cache_template_index(path, template_index)
+            resolved = template_index.resolve(pasted_nodes)
+            if resolved is None:
+                return
+
+        placeholder_nodes = dict(scene_placeholders)
+        knob_values_by_name = {}
+        for node_name, (node, placeholder) in resolved.items():
+            placeholder_nodes[node_name] = node
+            knob_values_by_name[node_name] = placeholder.knob_values
+
+        self._template_placeholders = (
+            get_scene_generation(), placeholder_nodes, knob_values_by_name
+        )
+
+    def get_template_placeholders(self):
+        """Placeholders of imported template if scene did not change.
+
+        Returns:
+            Union[tuple[dict[str, nuke.Node], dict[str, dict]], None]:
+                Placeholder nodes by full name with indexed knob values
+                of template placeholders, or None if the scene changed
+                after import.
+        """
+        if self._template_placeholders is None:
+            return None
+        generation, placeholder_nodes, knob_values_by_name = (
+            self._template_placeholders
+        )
+        if generation != get_scene_generation():
+            self._template_placeholders = None
+            return None
+        return placeholder_nodes, knob_values_by_name
+
+    def get_placeholder_knob_names(self):
+        """Names of knobs read from placeholder nodes.
+
+        Returns:
+            set[str]: Knob names of all placeholder plugins.
+        """
+        knob_names = set(PLACEHOLDER_KNOB_NAMES)
+        for plugin in self.placeholder_plugins.values():
+            knob_names |= set(plugin.get_placeholder_keys())
+        return knob_names
+
 
 class NukePlaceholderPlugin(PlaceholderPlugin):
     node_color = 4278190335
@@ -52,31 +408,59 @@ class NukePlaceholderPlugin(PlaceholderPlugin):
         )
         if placeholder_nodes is None:
             placeholder_nodes = {}
-            all_groups = collections.deque()
-            all_groups.append(nuke.thisGroup())
-            while all_groups:
-                group = all_groups.popleft()
-                for node in group.nodes():
-                    if isinstance(node, nuke.Group):
-                        all_groups.append(node)
-
-                    node_knobs = node.knobs()
-                    if (
-                        "is_placeholder" not in node_knobs
-                        or not node.knob("is_placeholder").value()
-                    ):
-                        continue
-
-                    if "empty" in node_knobs and node.knob("empty").value():
-                        continue
-
-                    placeholder_nodes[node.fullName()] = node
+            knob_values_by_name = {}
+            template_placeholders = self.builder.get_template_placeholders()
+            if template_placeholders is not None:
+                scene_placeholders, indexed_knob_values = (
+                    template_placeholders
+                )
+            else:
+                scene_placeholders = get_scene_index().placeholders
+                indexed_knob_values = {}
+
+            knob_names = self.builder.get_placeholder_knob_names()
+            for node_name, node in scene_placeholders.items():
+                knob_values = indexed_knob_values.get(node_name)
+                if knob_values is None:
+                    knob_values = read_placeholder_knob_values(
+                        node, knob_names
+                    )
+                if not knob_values.get("is_placeholder"):
+                    continue
+
+                if knob_values.get("empty"):
+                    continue
+
+                placeholder_nodes[node_name] = node
+                knob_values_by_name[node_name] = knob_values
 
             self.builder.set_shared_populate_data(
                 "placeholder_nodes", placeholder_nodes
             )
+            self.builder.set_shared_populate_data(
+                "placeholder_knob_values", knob_values_by_name
+            )
         return placeholder_nodes
 
+    def _get_placeholder_knob_values(self, node):
+        """Values of placeholder knobs of collected placeholder node.
+
+        Args:
+            node (nuke.Node): Placeholder node.
+
+        Returns:
+            dict[str, Any]: Values by knob name.
+        """
+        knob_values_by_name = self.builder.get_shared_populate_data(
+            "placeholder_knob_values"
+        ) or {}
+        knob_values = knob_values_by_name.get(node.fullName())
+        if knob_values is None:
+            knob_values = read_placeholder_knob_values(
+                node, self.builder.get_placeholder_knob_names()
+            )
+        return knob_values
+
     def create_placeholder(self, placeholder_data):
         placeholder_data["plugin_identifier"] = self.identifier
 
@@ -93,15 +477,96 @@ class NukePlaceholderPlugin(PlaceholderPlugin):
         imprint(node, placeholder_data)
 
     def _parse_placeholder_node_data(self, node):
+        knob_values = self._get_placeholder_knob_values(node)
         placeholder_data = {}
         for key in self.get_placeholder_keys():
-            knob = node.knob(key)
-            value = None
-            if knob is not None:
-                value = knob.getValue()
-            placeholder_data[key] = value
+            placeholder_data[key] = knob_values.get(key)
         return placeholder_data
 
+    def _start_node_journal(self, placeholder):
+        """Start recording of nodes created by placeholder population."""
+        journal = NodeCreationJournal()
+        journal.start()
+        placeholder.data["node_journal"] = journal
+
+    def _stop_node_journal(self, placeholder):
+        """Stop recording of nodes if population did not stop it.
+
+        Should be called in `finally` after population, so the callback
+        is not left registered when population fails.
+        """
+        journal = placeholder.data.pop("node_journal", None)
+        if journal is not None:
+            journal.stop()
+
+    def _pop_journal_nodes(self, placeholder):
+        """Stop recording and return nodes created by population.
+
+        Returns:
+            list[nuke.Node]: Created nodes.
+        """
+        journal = placeholder.data.pop("node_journal", None)
+        if journal is None:
+            return []
+        journal.stop()
+        return journal.pop_nodes()
+
+    def _get_backdrop_index(self, group_name):
+        """Spatial index of backdrops of a group shared by populate pass.
+
+        Index is built once per populate pass and synchronized with
+        current backdrops of the group on each request, population moves
+        and resizes backdrops.
+
+        Args:
+            group_name (str): Full name of group node, empty for root.
+
+        Returns:
+            DagSpatialIndex: Index of backdrop nodes of the group.
+        """
+        backdrop_indexes = self.builder.get_shared_populate_data(
+            "backdrop_indexes"
+        )
+        if backdrop_indexes is None:
+            backdrop_indexes = {}
+            self.builder.set_shared_populate_data(
+                "backdrop_indexes", backdrop_indexes
+            )
+
+        group = nuke.toNode(group_name) if group_name else nuke.root()
+        backdrops = nuke.allNodes("BackdropNode", group=group)
+        dag_index = backdrop_indexes.get(group_name)
+        if dag_index is None:
+            dag_index = DagSpatialIndex(backdrops)
+            backdrop_indexes[group_name] = dag_index
+        else:
+            dag_index.sync(backdrops)
+        return dag_index
+
+    def _get_enclosing_backdrop_names(self, nodes, group_name=""):
+        """Names of backdrops containing all the nodes.
+
+        Args:
+            nodes (Iterable[nuke.Node]): Nodes in DAG.
+            group_name (Optional[str]): Full name of group of the nodes,
+                root when empty.
+
+        Returns:
+            set[str]: Backdrop names.
+        """
+        dag_index = self._get_backdrop_index(group_name)
+        enclosing_backdrops = None
+        for node in nodes:
+            backdrops = {
+                backdrop.name()
+                for backdrop in dag_index.get_backdrops_containing(node)
+            }
+            if enclosing_backdrops is None:
+                enclosing_backdrops = backdrops
+            else:
+                enclosing_backdrops &= backdrops
+        return enclosing_backdrops or set()
+
     def delete_placeholder(self, placeholder):
         """Remove placeholder if building was successful"""
         placeholder_node = nuke.toNode(placeholder.scene_identifier)
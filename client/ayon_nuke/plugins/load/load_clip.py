@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 import nuke
 import qargparse
 import ayon_api
@@ -8,13 +6,11 @@ from ayon_core.lib import Logger
 from ayon_core.pipeline import (
     get_representation_path,
 )
-from ayon_core.pipeline.colorspace import (
-    get_imageio_file_rules_colorspace_from_filepath,
-    get_current_context_imageio_config_preset,
-)
+from ayon_core.pipeline.load import ProductLoaderPlugin
 from ayon_nuke.api.lib import (
-    get_imageio_input_colorspace,
-    maintained_selection
+    find_free_space_to_paste_nodes,
+    maintained_selection,
+    set_knob_animation,
 )
 from ayon_nuke.api import (
     containerise,
@@ -27,6 +23,12 @@ from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS
 )
 from ayon_nuke.api import plugin
+from ayon_nuke.api.representation_prefetch import (
+    ColorspaceRules,
+    get_representation_prefetch,
+    get_representation_with_hashed_frame,
+    representation_prefetch,
+)
 
 
 class LoadClip(plugin.NukeLoader):
@@ -69,6 +71,9 @@ class LoadClip(plugin.NukeLoader):
 
     node_name_template = "{class_name}_{ext}"
 
+    # horizontal space between read nodes placed by `load_many`
+    layout_spacing = 40
+
     @classmethod
     def get_options(cls, *args):
         return [
@@ -95,14 +100,103 @@ class LoadClip(plugin.NukeLoader):
 
     def load(self, context, name, namespace, options):
         """Load asset via database."""
-        project_name = context["project"]["name"]
+        # reset container id so it is always unique for each instance
+        self.reset_container_id()
+
+        load_data = self._get_load_data(context, namespace, options)
+        if load_data is None:
+            return
+
+        # Create the Loader with the filename path set
+        read_node = nuke.createNode(
+            load_data["node_class"],
+            "name {}".format(load_data["read_name"]),
+            inpanel=False
+        )
+
+        # to avoid multiple undo steps for rest of process
+        # we will switch off undo-ing
+        with viewer_update_and_undo_stop():
+            container = self._setup_read_node(read_node, name, load_data)
+
+        self._finalize_read_node(read_node, load_data)
+
+        return container
+
+    def load_many(self, contexts, name=None, namespace=None, options=None):
+        """Load many representations at once.
+
+        Colorspace config and file rules are resolved once, files of all
+        representations are resolved in thread pool and frame ranges are
+        computed before any node is created. Read nodes are created
+        without autoplace in one undo block and placed next to each
+        other into free space of node graph.
+
+        Args:
+            contexts (list[dict[str, Any]]): Representation contexts.
+            name (Optional[str]): Container name, product name of each
+                context is used when not passed.
+            namespace (Optional[str]): Container namespace, folder name
+                of each context is used when not passed.
+            options (Optional[dict[str, Any]]): Loader options.
+
+        Returns:
+            list[dict[str, Any]]: Containers of loaded representations.
+        """
+        if not contexts:
+            return []
+
+        options = options or {}
+        project_name = contexts[0]["project"]["name"]
+        containers = []
+        with representation_prefetch(project_name) as prefetch:
+            prefetch.prefetch(
+                context["representation"] for context in contexts
+            )
+
+            load_data_items = []
+            for context in contexts:
+                load_data = self._get_load_data(context, namespace, options)
+                if load_data is not None:
+                    load_data_items.append(load_data)
+
+            with viewer_update_and_undo_stop():
+                read_nodes = []
+                for load_data in load_data_items:
+                    self.reset_container_id()
+                    load_data["container_id"] = self.container_id
+
+                    read_node = getattr(nuke.nodes, load_data["node_class"])()
+                    read_node.setName(load_data["read_name"], uniquify=True)
+                    product_name = load_data["context"]["product"]["name"]
+                    containers.append(self._setup_read_node(
+                        read_node, name or product_name, load_data
+                    ))
+                    read_nodes.append(read_node)
+
+                self._layout_read_nodes(read_nodes)
+
+                for read_node, load_data in zip(read_nodes, load_data_items):
+                    self.container_id = load_data["container_id"]
+                    self._finalize_read_node(read_node, load_data)
+
+        return containers
+
+    def _get_load_data(self, context, namespace, options):
+        """Prepare data for loading of a representation.
+
+        Args:
+            context (dict[str, Any]): Representation context.
+            namespace (Union[str, None]): Container namespace.
+            options (dict[str, Any]): Loader options.
+
+        Returns:
+            Union[dict[str, Any], None]: Load data or None if path of
+                representation is not available.
+        """
         repre_entity = context["representation"]
         version_entity = context["version"]
         version_attributes = version_entity["attrib"]
-        version_data = version_entity["data"]
-
-        # reset container id so it is always unique for each instance
-        self.reset_container_id()
 
         is_sequence = len(repre_entity["files"]) > 1
 
@@ -111,8 +205,15 @@ class LoadClip(plugin.NukeLoader):
                 self._representation_with_hash_in_frame(repre_entity)
             )
 
-        filepath = self.filepath_from_context(context)
-        filepath = filepath.replace("\\", "/")
+        # path resolved by active prefetch
+        filepath = None
+        prefetch = get_representation_prefetch(context["project"]["name"])
+        if prefetch is not None:
+            filepath = prefetch.get_path(repre_entity["id"])
+
+        if filepath is None:
+            filepath = self.filepath_from_context(context)
+            filepath = filepath.replace("\\", "/")
         self.log.debug("_ filepath: {}".format(filepath))
 
         start_at_workfile = options.get(
@@ -129,13 +230,13 @@ class LoadClip(plugin.NukeLoader):
         self.log.debug(
             "Representation id `{}` ".format(repre_id))
 
-        self.handle_start = version_attributes.get("handleStart", 0)
-        self.handle_end = version_attributes.get("handleEnd", 0)
+        handle_start = version_attributes.get("handleStart", 0)
+        handle_end = version_attributes.get("handleEnd", 0)
 
         first = version_attributes.get("frameStart")
         last = version_attributes.get("frameEnd")
-        first -= self.handle_start
-        last += self.handle_end
+        first -= handle_start
+        last += handle_end
 
         if not is_sequence:
             duration = last - first
@@ -161,24 +262,42 @@ class LoadClip(plugin.NukeLoader):
         if not filepath:
             self.log.warning(
                 "Representation id `{}` is failing to load".format(repre_id))
-            return
+            return None
+
+        return {
+            "context": context,
+            "project_name": context["project"]["name"],
+            "version_entity": version_entity,
+            "repre_entity": repre_entity,
+            "filepath": filepath,
+            "namespace": namespace,
+            "read_name": self._get_node_name(context),
+            "node_class": "DeepRead" if deep_exr else "Read",
+            "first": first,
+            "last": last,
+            "handle_start": handle_start,
+            "handle_end": handle_end,
+            "slate_frames": slate_frames,
+            "start_at_workfile": start_at_workfile,
+            "add_retime": add_retime,
+        }
 
-        read_name = self._get_node_name(context)
-        read_node = None
-        if deep_exr:
-            # Create the Loader with the filename path set
-            read_node = nuke.createNode(
-                "DeepRead",
-                "name {}".format(read_name),
-                inpanel=False
-            )
-        else:
-            # Create the Loader with the filename path set
-            read_node = nuke.createNode(
-                "Read",
-                "name {}".format(read_name),
-                inpanel=False
-            )
+    def _setup_read_node(self, read_node, name, load_data):
+        """Set loaded file to read node and containerise it.
+
+        Args:
+            read_node (nuke.Node): Created read node.
+            name (str): Container name.
+            load_data (dict[str, Any]): Data from `_get_load_data`.
+
+        Returns:
+            dict[str, Any]: Container data.
+        """
+        filepath = load_data["filepath"]
+        version_entity = load_data["version_entity"]
+        repre_entity = load_data["repre_entity"]
+        version_attributes = version_entity["attrib"]
+        version_data = version_entity["data"]
 
         # get colorspace
         colorspace = (
@@ -186,65 +305,98 @@ class LoadClip(plugin.NukeLoader):
             or version_attributes.get("colorSpace")
         )
 
-        # to avoid multiple undo steps for rest of process
-        # we will switch off undo-ing
-        with viewer_update_and_undo_stop():
-            read_node["file"].setValue(filepath)
-            if read_node.Class() == "Read":
-                self.set_colorspace_to_node(
-                    read_node,
-                    filepath,
-                    project_name,
-                    version_entity,
-                    repre_entity
-                )
-
-            self._set_range_to_node(
-                read_node, first, last, start_at_workfile, slate_frames
+        read_node["file"].setValue(filepath)
+        if read_node.Class() == "Read":
+            self.set_colorspace_to_node(
+                read_node,
+                filepath,
+                load_data["project_name"],
+                version_entity,
+                repre_entity
             )
 
-            version_name = version_entity["version"]
-            if version_name < 0:
-                version_name = "hero"
+        self._set_range_to_node(
+            read_node,
+            load_data["first"],
+            load_data["last"],
+            load_data["start_at_workfile"],
+            load_data["slate_frames"]
+        )
 
-            data_imprint = {
-                "version": version_name,
-                "db_colorspace": colorspace
-            }
+        version_name = version_entity["version"]
+        if version_name < 0:
+            version_name = "hero"
 
-            # add attributes from the version to imprint metadata knob
-            for key in [
-                "frameStart",
-                "frameEnd",
-                "source",
-                "fps",
-                "handleStart",
-                "handleEnd",
-            ]:
-                value = version_attributes.get(key, str(None))
-                if isinstance(value, str):
-                    value = value.replace("\\", "/")
-                data_imprint[key] = value
-
-            if add_retime and version_data.get("retime"):
-                data_imprint["addRetime"] = True
-
-            read_node["tile_color"].setValue(int("0x4ecd25ff", 16))
-
-            container = containerise(
-                read_node,
-                name=name,
-                namespace=namespace,
-                context=context,
-                loader=self.__class__.__name__,
-                data=data_imprint)
+        data_imprint = {
+            "version": version_name,
+            "db_colorspace": colorspace
+        }
 
-        if add_retime and version_data.get("retime"):
+        # add attributes from the version to imprint metadata knob
+        for key in [
+            "frameStart",
+            "frameEnd",
+            "source",
+            "fps",
+            "handleStart",
+            "handleEnd",
+        ]:
+            value = version_attributes.get(key, str(None))
+            if isinstance(value, str):
+                value = value.replace("\\", "/")
+            data_imprint[key] = value
+
+        if load_data["add_retime"] and version_data.get("retime"):
+            data_imprint["addRetime"] = True
+
+        read_node["tile_color"].setValue(int("0x4ecd25ff", 16))
+
+        return containerise(
+            read_node,
+            name=name,
+            namespace=load_data["namespace"],
+            context=load_data["context"],
+            loader=self.__class__.__name__,
+            data=data_imprint)
+
+    def _finalize_read_node(self, read_node, load_data):
+        """Create retime nodes and store container id on read node.
+
+        Args:
+            read_node (nuke.Node): Containerised read node.
+            load_data (dict[str, Any]): Data from `_get_load_data`.
+        """
+        self.handle_start = load_data["handle_start"]
+        self.handle_end = load_data["handle_end"]
+
+        version_data = load_data["version_entity"]["data"]
+        if load_data["add_retime"] and version_data.get("retime"):
             self._make_retimes(read_node, version_data)
 
         self.set_as_member(read_node)
 
-        return container
+    def _layout_read_nodes(self, read_nodes):
+        """Place read nodes in a row into free space of node graph.
+
+        Args:
+            read_nodes (list[nuke.Node]): Created read nodes.
+        """
+        if not read_nodes:
+            return
+
+        xpos = 0
+        for read_node in read_nodes:
+            read_node.setXYpos(xpos, 0)
+            xpos += read_node.screenWidth() + self.layout_spacing
+
+        xpointer, ypointer = find_free_space_to_paste_nodes(
+            read_nodes, group=nuke.thisGroup(), direction="bottom"
+        )
+        for read_node in read_nodes:
+            read_node.setXYpos(
+                read_node.xpos() + xpointer,
+                read_node.ypos() + ypointer
+            )
 
     def switch(self, container, context):
         self.update(container, context)
@@ -259,25 +411,7 @@ class LoadClip(plugin.NukeLoader):
             dict: altered representation data
 
         """
-        new_repre_entity = deepcopy(repre_entity)
-        context = new_repre_entity["context"]
-
-        # Get the frame from the context and hash it
-        frame = context["frame"]
-        hashed_frame = "#" * len(str(frame))
-
-        # Replace the frame with the hash in the originalBasename
-        if (
-            "{originalBasename}" in new_repre_entity["attrib"]["template"]
-        ):
-            origin_basename = context["originalBasename"]
-            context["originalBasename"] = origin_basename.replace(
-                frame, hashed_frame
-            )
-
-        # Replace the frame with the hash in the frame
-        new_repre_entity["context"]["frame"] = hashed_frame
-        return new_repre_entity
+        return get_representation_with_hashed_frame(repre_entity)
 
     def update(self, container, context):
         """Update the Loader's path
@@ -489,11 +623,10 @@ class LoadClip(plugin.NukeLoader):
                     )
                     if isinstance(timewarp["lookup"], list):
                         # if array for animation
-                        twn["lookup"].setAnimated()
-                        for i, value in enumerate(timewarp["lookup"]):
-                            twn["lookup"].setValueAt(
-                                (start_anim + i) + value,
-                                (start_anim + i))
+                        set_knob_animation(twn["lookup"], [
+                            (start_anim + i, (start_anim + i) + value)
+                            for i, value in enumerate(timewarp["lookup"])
+                        ])
                     else:
                         # if static value `int`
                         twn["lookup"].setValue(timewarp["lookup"])
@@ -566,19 +699,104 @@ class LoadClip(plugin.NukeLoader):
                 f"Colorspace from representation colorspaceData: {colorspace}"
             )
 
-        config_data = get_current_context_imageio_config_preset()
-        # check if any filerules are not applicable
-        new_parsed_colorspace = get_imageio_file_rules_colorspace_from_filepath( # noqa
-            filepath, "nuke", project_name, config_data=config_data
-        )
-        self.log.debug(f"Colorspace new filerules: {new_parsed_colorspace}")
+        # check if any filerules are not applicable, rules of active
+        # prefetch are already resolved for prefetched representations
+        prefetch = get_representation_prefetch(project_name)
+        if prefetch is not None:
+            colorspace_rules = prefetch.colorspace_rules
+        else:
+            colorspace_rules = ColorspaceRules(project_name)
+        parsed_colorspace = colorspace_rules.get_colorspace(filepath)
+
+        return parsed_colorspace or colorspace
+
+
+class LoadClips(ProductLoaderPlugin):
+    """Load clips of all selected products at once
+
+    Representations of all selected versions are queried together and
+    loaded by `LoadClip.load_many` in a single undo block.
+    """
+
+    product_types = LoadClip.product_types
+    representations = {"*"}
+
+    settings_category = "nuke"
+
+    label = "Load Clips (batch)"
+    order = -19
+    icon = "file-video-o"
+    color = "white"
+
+    is_multiple_contexts_compatible = True
 
-        # colorspace from `project_settings/nuke/imageio/regexInputs`
-        old_parsed_colorspace = get_imageio_input_colorspace(filepath)
-        self.log.debug(f"Colorspace old filerules: {old_parsed_colorspace}")
+    @classmethod
+    def get_options(cls, *args):
+        return LoadClip.get_options(*args)
 
-        return (
-            new_parsed_colorspace
-            or old_parsed_colorspace
-            or colorspace
+    def load(self, context, name=None, namespace=None, options=None):
+        contexts = context if isinstance(context, list) else [context]
+        if not contexts:
+            return []
+
+        loader = LoadClip()
+        repre_contexts = self._get_repre_contexts(contexts, loader)
+        return loader.load_many(
+            repre_contexts, name, namespace, options
         )
+
+    def _get_repre_contexts(self, contexts, loader):
+        """Representation contexts of versions loadable by LoadClip.
+
+        Image sequences are preferred over video files.
+
+        Args:
+            contexts (list[dict[str, Any]]): Version contexts.
+            loader (LoadClip): Clip loader.
+
+        Returns:
+            list[dict[str, Any]]: Representation contexts.
+        """
+        project_name = contexts[0]["project"]["name"]
+        repre_names = set(loader.get_representations())
+        repre_entities_by_version_id = {}
+        for repre_entity in ayon_api.get_representations(
+            project_name,
+            version_ids={
+                context["version"]["id"] for context in contexts
+            },
+        ):
+            ext = "." + repre_entity["context"].get("ext", "")
+            if ext not in IMAGE_EXTENSIONS and ext not in VIDEO_EXTENSIONS:
+                continue
+            if "*" not in repre_names and (
+                repre_entity["name"] not in repre_names
+            ):
+                continue
+            repre_entities_by_version_id.setdefault(
+                repre_entity["versionId"], []
+            ).append(repre_entity)
+
+        repre_contexts = []
+        for context in contexts:
+            repre_entities = repre_entities_by_version_id.get(
+                context["version"]["id"]
+            )
+            if not repre_entities:
+                self.log.warning(
+                    "No clip representation of product `{}`".format(
+                        context["product"]["name"])
+                )
+                continue
+
+            repre_entity = sorted(
+                repre_entities,
+                key=lambda repre: (
+                    "." + repre["context"]["ext"] not in IMAGE_EXTENSIONS,
+                    repre["name"]
+                )
+            )[0]
+            repre_context = dict(context)
+            repre_context["representation"] = repre_entity
+            repre_contexts.append(repre_context)
+        return repre_contexts
@@ -98,42 +98,11 @@ class LoadEffectsInputProcess(load.LoaderPlugin):
 
         # adding content to the group node
         with GN:
-            pre_node = nuke.createNode("Input")
-            pre_node["name"].setValue("rgb")
-
-            for _, ef_val in nodes_order.items():
-                node = nuke.createNode(ef_val["class"])
-                for k, v in ef_val["node"].items():
-                    if k in self.ignore_attr:
-                        continue
-
-                    try:
-                        node[k].value()
-                    except NameError as e:
-                        self.log.warning(e)
-                        continue
-
-                    if isinstance(v, list) and len(v) > 4:
-                        node[k].setAnimated()
-                        for i, value in enumerate(v):
-                            if isinstance(value, list):
-                                for ci, cv in enumerate(value):
-                                    node[k].setValueAt(
-                                        cv,
-                                        (workfile_first_frame + i),
-                                        ci)
-                            else:
-                                node[k].setValueAt(
-                                    value,
-                                    (workfile_first_frame + i))
-                    else:
-                        node[k].setValue(v)
-
-                node.setInput(0, pre_node)
-                pre_node = node
-
-            output = nuke.createNode("Output")
-            output.setInput(0, pre_node)
+            lib.create_effect_nodes(
+                nodes_order.values(),
+                workfile_first_frame,
+                self.ignore_attr
+            )
 
         # try to place it under Viewer1
         if not self.connect_active_viewer(GN):
@@ -220,43 +189,12 @@ class LoadEffectsInputProcess(load.LoaderPlugin):
             # first remove all nodes
             [nuke.delete(n) for n in nuke.allNodes()]
 
-            # create input node
-            pre_node = nuke.createNode("Input")
-            pre_node["name"].setValue("rgb")
-
-            for _, ef_val in nodes_order.items():
-                node = nuke.createNode(ef_val["class"])
-                for k, v in ef_val["node"].items():
-                    if k in self.ignore_attr:
-                        continue
-
-                    try:
-                        node[k].value()
-                    except NameError as e:
-                        self.log.warning(e)
-                        continue
-
-                    if isinstance(v, list) and len(v) > 4:
-                        node[k].setAnimated()
-                        for i, value in enumerate(v):
-                            if isinstance(value, list):
-                                for ci, cv in enumerate(value):
-                                    node[k].setValueAt(
-                                        cv,
-                                        (workfile_first_frame + i),
-                                        ci)
-                            else:
-                                node[k].setValueAt(
-                                    value,
-                                    (workfile_first_frame + i))
-                    else:
-                        node[k].setValue(v)
-                node.setInput(0, pre_node)
-                pre_node = node
-
-            # create output node
-            output = nuke.createNode("Output")
-            output.setInput(0, pre_node)
+            # create effect nodes in between input and output
+            lib.create_effect_nodes(
+                nodes_order.values(),
+                workfile_first_frame,
+                self.ignore_attr
+            )
 
         # get all versions in list
         last_version_entity = ayon_api.get_last_version_by_product_id(
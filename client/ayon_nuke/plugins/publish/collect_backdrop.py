@@ -1,6 +1,9 @@
 from pprint import pformat
 import pyblish.api
+from ayon_nuke import api as napi
 from ayon_nuke.api import lib as pnlib
+from ayon_nuke.api.dag_index import DagSpatialIndex
+from ayon_nuke.api.node_graph import NodeGraph
 import nuke
 
 
@@ -20,32 +23,21 @@ class CollectBackdrops(pyblish.api.InstancePlugin):
 
         bckn = instance.data["transientData"]["node"]
 
-        # define size of the backdrop
-        left = bckn.xpos()
-        top = bckn.ypos()
-        right = left + bckn['bdwidth'].value()
-        bottom = top + bckn['bdheight'].value()
+        # nodes of the script are indexed once per publish
+        cache = napi.get_publish_cache(instance.context)
+        dag_index = cache.get_or_compute(
+            "dagIndex", "root", DagSpatialIndex.build)
+        node_graph = cache.get_or_compute(
+            "nodeGraph", "root", lambda: NodeGraph.build(nuke.root()))
 
-        instance.data["transientData"]["childNodes"] = []
-        # iterate all nodes
-        for node in nuke.allNodes():
-
-            # exclude viewer
-            if node.Class() == "Viewer":
-                continue
-
-            # find all related nodes
-            if (node.xpos() > left) \
-                and (node.xpos() + node.screenWidth() < right) \
-                    and (node.ypos() > top) \
-                    and (node.ypos() + node.screenHeight() < bottom):
-
-                # add contained nodes to instance's node list
-                instance.data["transientData"]["childNodes"].append(node)
+        # find all related nodes inside of the backdrop rectangle
+        instance.data["transientData"]["childNodes"] = (
+            dag_index.get_backdrop_nodes(bckn, exclude_classes=["Viewer"]))
 
         # get all connections from outside of backdrop
         nodes = instance.data["transientData"]["childNodes"]
-        connections_in, connections_out = pnlib.get_dependent_nodes(nodes)
+        connections_in, connections_out = pnlib.get_dependent_nodes(
+            nodes, node_graph)
         instance.data["transientData"]["nodeConnectionsIn"] = connections_in
         instance.data["transientData"]["nodeConnectionsOut"] = connections_out
 
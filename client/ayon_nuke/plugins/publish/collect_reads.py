@@ -1,7 +1,7 @@
 import os
-import re
 import nuke
 import pyblish.api
+from ayon_nuke.api.sequence import PathTemplate
 
 
 class CollectNukeReads(pyblish.api.InstancePlugin):
@@ -41,30 +41,22 @@ class CollectNukeReads(pyblish.api.InstancePlugin):
         if "default" in colorspace:
             colorspace = colorspace.replace("default (", "").replace(")", "")
 
-        # # Easier way to sequence - Not tested
-        # isSequence = True
-        # if first_frame == last_frame:
-        #     isSequence = False
-
-        isSequence = False
-        if len(items) > 1:
-            sequence = items[-2]
-            hash_regex = re.compile(r'([#*])')
-            seq_regex = re.compile(r'[%0-9*d]')
-            hash_match = re.match(hash_regex, sequence)
-            seq_match = re.match(seq_regex, sequence)
-            if hash_match or seq_match:
-                isSequence = True
-
         # get source path
         path = nuke.filename(node)
         source_dir = os.path.dirname(path)
         self.log.debug('source dir: {}'.format(source_dir))
 
-        if isSequence:
-            source_files = [f for f in os.listdir(source_dir)
-                            if ext in f
-                            if items[0] in f]
+        template = PathTemplate.parse(path)
+        if template is not None:
+            # files of the sequence in frame range of the read node
+            source_files = [
+                entry.name
+                for frame, entry in sorted(
+                    template.iter_directory(),
+                    key=lambda item: item[0]
+                )
+                if first_frame <= frame <= last_frame
+            ]
         else:
             source_files = file_name
 
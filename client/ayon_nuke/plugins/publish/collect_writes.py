@@ -2,6 +2,11 @@ import os
 import nuke
 import pyblish.api
 from ayon_nuke import api as napi
+from ayon_nuke.api.sequence import (
+    FrameRanges,
+    PathTemplate,
+    SequenceFiles,
+)
 from ayon_core.pipeline import publish
 
 
@@ -16,10 +21,6 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
 
     settings_category = "nuke"
 
-    # cache
-    _write_nodes = {}
-    _frame_ranges = {}
-
     def process(self, instance):
 
         group_node = instance.data["transientData"]["node"]
@@ -108,12 +109,14 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
             tuple: first_frame, last_frame
         """
 
-        instance_name = instance.data["name"]
-
-        if self._frame_ranges.get(instance_name):
-            # return cashed write node
-            return self._frame_ranges[instance_name]
+        cache = napi.get_publish_cache(instance.context)
+        return cache.get_or_compute(
+            "frameRange",
+            napi.get_instance_cache_key(instance),
+            lambda: self._get_write_node_frame_range(instance)
+        )
 
+    def _get_write_node_frame_range(self, instance):
         write_node = self._write_node_helper(instance)
 
         # Get frame range from workfile
@@ -125,9 +128,6 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
             first_frame = int(write_node["first"].getValue())
             last_frame = int(write_node["last"].getValue())
 
-        # add to cache
-        self._frame_ranges[instance_name] = (first_frame, last_frame)
-
         return first_frame, last_frame
 
     def _set_additional_instance_data(
@@ -217,30 +217,14 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
         Returns:
             nuke.Node: write node
         """
-        instance_name = instance.data["name"]
-
-        if self._write_nodes.get(instance_name):
-            # return cashed write node
-            return self._write_nodes[instance_name]
-
-        # get all child nodes from group node
-        child_nodes = napi.get_instance_group_node_childs(instance)
-
-        # set child nodes to instance transient data
-        instance.data["transientData"]["childNodes"] = child_nodes
-
-        write_node = None
-        for node_ in child_nodes:
-            if node_.Class() == "Write":
-                write_node = node_
+        # child nodes are indexed once and shared with other plugins
+        write_node = napi.get_instance_group_index(instance).write_node
 
         if write_node:
             # for slate frame extraction
             instance.data["transientData"]["writeNode"] = write_node
-            # add to cache
-            self._write_nodes[instance_name] = write_node
 
-            return self._write_nodes[instance_name]
+            return write_node
 
     def _get_existing_frames_representation(
         self,
@@ -283,8 +267,9 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
         )
 
         if len(collected_frames) == 1:
-            representation['files'] = collected_frames.pop()
+            representation['files'] = collected_frames[0]
         else:
+            # lazy files are expanded by `ExpandSequenceFiles`
             representation['files'] = collected_frames
 
         return representation
@@ -327,6 +312,22 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
 
         # this will only run if slate frame is not already
         # rendered from previews publishes
+        if (
+            "slate" in instance.data["families"]
+            and frame_length == len(collected_frames)
+            and isinstance(collected_frames, SequenceFiles)
+        ):
+            slate_frame = first_frame - 1
+            return SequenceFiles(
+                collected_frames.head,
+                collected_frames.padding,
+                collected_frames.tail,
+                FrameRanges(
+                    collected_frames.frames.ranges
+                    + [(slate_frame, slate_frame)]
+                )
+            )
+
         if (
             "slate" in instance.data["families"]
             and frame_length == len(collected_frames)
@@ -375,8 +376,95 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
 
         write_node = self._write_node_helper(instance)
 
-        write_file_path = nuke.filename(write_node)
-        output_dir = os.path.dirname(write_file_path)
+        frame_scan = self._scan_frames(write_node, first_frame, last_frame)
+        if frame_scan is None:
+            return self._get_evaluated_frames(
+                write_node, first_frame, last_frame)
+
+        if frame_scan["missingRanges"]:
+            self.log.debug("Missing frames: {}".format(
+                ",".join(
+                    "{}-{}".format(*frame_range)
+                    for frame_range in frame_scan["missingRanges"]
+                )
+            ))
+
+        # used by `ValidateRenderedFrames` instead of assembling files
+        instance.data["frameScan"] = frame_scan
+
+        return SequenceFiles(
+            frame_scan["head"],
+            frame_scan["padding"],
+            frame_scan["tail"],
+            frame_scan["frames"]
+        )
+
+    def _scan_frames(self, write_node, first_frame, last_frame):
+        """Scan output directory for frames of write node path.
+
+        Frame number pattern is resolved only once from the path and
+        output directory is listed in single pass. Valid manifest of
+        rendered frames is used instead of listing the directory.
+
+        Args:
+            write_node (nuke.Node): write node
+            first_frame (int): First expected frame.
+            last_frame (int): Last expected frame.
+
+        Returns:
+            Union[dict, None]: Scanned frames data or None if path is not
+                a simple sequence (e.g. has views or multiple patterns).
+        """
+        template = PathTemplate.parse(nuke.filename(write_node))
+        if template is None:
+            return None
+
+        all_files_by_frame = napi.read_render_manifest(write_node)
+        if all_files_by_frame is not None:
+            self.log.debug("Using manifest of rendered frames")
+        else:
+            all_files_by_frame = {
+                frame: entry.name
+                for frame, entry in template.iter_directory()
+            }
+
+        frame_length = last_frame - first_frame + 1
+        bitmap = bytearray(frame_length)
+        files_by_frame = {}
+        for frame, filename in all_files_by_frame.items():
+            if first_frame <= frame <= last_frame:
+                bitmap[frame - first_frame] = 1
+                files_by_frame[frame] = filename
+
+        existing_frames = FrameRanges.from_frames(files_by_frame)
+        missing_ranges = existing_frames.missing(
+            first_frame, last_frame).ranges
+
+        return {
+            "head": os.path.basename(template.head),
+            "tail": template.tail,
+            "padding": template.padding,
+            "frameStart": first_frame,
+            "frameEnd": last_frame,
+            "bitmap": bitmap,
+            "missingRanges": missing_ranges,
+            "frames": existing_frames,
+        }
+
+    def _get_evaluated_frames(self, write_node, first_frame, last_frame):
+        """Get existing files by evaluating write node path per frame.
+
+        Fallback for paths which are not simple sequences.
+
+        Args:
+            write_node (nuke.Node): write node
+            first_frame (int): first frame
+            last_frame (int): last frame
+
+        Returns:
+            list: collected frames
+        """
+        output_dir = os.path.dirname(nuke.filename(write_node))
 
         # get file path knob
         node_file_knob = write_node["file"]
@@ -56,11 +56,10 @@ class ExtractBackdropNode(publish.Extractor):
             reset_selection()
 
             # connect output node
-            for n, output in connections_out.items():
+            for n, outputs in connections_out.items():
                 opn = nuke.createNode("Output")
-                output.setInput(
-                    next((i for i, d in enumerate(output.dependencies())
-                          if d.name() in n.name()), 0), opn)
+                for i, output in outputs:
+                    output.setInput(i, opn)
                 opn.setInput(0, n)
                 opn.autoplace()
                 child_nodes.append(opn)
@@ -85,10 +84,9 @@ class ExtractBackdropNode(publish.Extractor):
                     n.setInput(i, input)
 
             # reconnect output node
-            for n, output in connections_out.items():
-                output.setInput(
-                    next((i for i, d in enumerate(output.dependencies())
-                          if d.name() in n.name()), 0), n)
+            for n, outputs in connections_out.items():
+                for i, output in outputs:
+                    output.setInput(i, n)
 
         if "representations" not in instance.data:
             instance.data["representations"] = []
@@ -1,12 +1,17 @@
 import os
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import nuke
 
 import pyblish.api
 
 from ayon_core.pipeline import publish
-from ayon_nuke.api.lib import maintained_selection
+from ayon_nuke.api.lib import maintained_selection, set_knob_animation
 from ayon_nuke.api.plugin import get_publish_config
 
 
@@ -180,7 +185,80 @@ def bakeCameraWithAxeses(camera_node, output_range):
     new_cam_n['win_translate'].setValue(camera_node['win_translate'].value())
     new_cam_n['win_scale'].setValue(camera_node['win_scale'].value())
 
-    for x in nuke.FrameRange(output_range):
+    frames = list(nuke.FrameRange(output_range))
+    if numpy is None:
+        _bake_camera_per_frame(
+            new_cam_n, camera_matrix, frames,
+            old_focal if bakeFocal else None,
+            old_haperture if bakeHaperture else None,
+            old_vaperture if bakeVaperture else None,
+        )
+        return new_cam_n
+
+    # sample whole world matrix once per frame into (N, 4, 4) array
+    matrices = numpy.array(
+        [camera_matrix.getValueAt(frame) for frame in frames],
+        dtype=float
+    ).reshape(-1, 4, 4)
+
+    rotations = numpy.degrees(_get_rotations_zxy(matrices))
+    translations = matrices[:, :3, 3]
+
+    set_knob_animation(
+        new_cam_n['rotate'], zip(frames, rotations.tolist()))
+    set_knob_animation(
+        new_cam_n['translate'], zip(frames, translations.tolist()))
+
+    for bake, old_knob in (
+        (bakeFocal, old_focal),
+        (bakeHaperture, old_haperture),
+        (bakeVaperture, old_vaperture),
+    ):
+        if bake:
+            set_knob_animation(new_cam_n[old_knob.name()], [
+                (frame, old_knob.getValueAt(frame)) for frame in frames
+            ])
+
+    return new_cam_n
+
+
+def _get_rotations_zxy(matrices):
+    """Decompose rotations of matrices in ZXY rotation order.
+
+    Same as `nuke.math.Matrix4.rotationOnly()` followed by
+    `rotationsZXY()` for each matrix.
+
+    Args:
+        matrices (numpy.ndarray): Array of (N, 4, 4) matrices.
+
+    Returns:
+        numpy.ndarray: Array of (N, 3) X, Y and Z rotations in radians.
+    """
+    # remove scale from rotation part
+    rotation = matrices[:, :3, :3]
+    rotation = rotation / numpy.linalg.norm(rotation, axis=1, keepdims=True)
+
+    rot_x = numpy.arcsin(numpy.clip(-rotation[:, 1, 2], -1.0, 1.0))
+    # rotations around Y and Z are ambiguous in gimbal lock
+    gimbal_lock = numpy.abs(numpy.cos(rot_x)) < 1e-6
+    rot_y = numpy.where(
+        gimbal_lock,
+        numpy.arctan2(-rotation[:, 2, 0], rotation[:, 0, 0]),
+        numpy.arctan2(rotation[:, 0, 2], rotation[:, 2, 2])
+    )
+    rot_z = numpy.where(
+        gimbal_lock,
+        0.0,
+        numpy.arctan2(rotation[:, 1, 0], rotation[:, 1, 1])
+    )
+    return numpy.stack((rot_x, rot_y, rot_z), axis=1)
+
+
+def _bake_camera_per_frame(
+    new_cam_n, camera_matrix, frames, old_focal, old_haperture, old_vaperture
+):
+    """Bake camera frame by frame using `nuke.math` when NumPy is missing."""
+    for x in frames:
         math_matrix = nuke.math.Matrix4()
         for y in range(camera_matrix.height()):
             for z in range(camera_matrix.width()):
@@ -202,11 +280,9 @@ def bakeCameraWithAxeses(camera_node, output_range):
         new_cam_n['translate'].setValueAt(
             camera_matrix.getValueAt(x, 11), x, 2)
 
-        if bakeFocal:
+        if old_focal is not None:
             new_cam_n['focal'].setValueAt(old_focal.getValueAt(x), x)
-        if bakeHaperture:
+        if old_haperture is not None:
             new_cam_n['haperture'].setValueAt(old_haperture.getValueAt(x), x)
-        if bakeVaperture:
+        if old_vaperture is not None:
             new_cam_n['vaperture'].setValueAt(old_vaperture.getValueAt(x), x)
-
-    return new_cam_n
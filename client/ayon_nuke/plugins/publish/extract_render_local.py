@@ -1,11 +1,24 @@
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.api
 import clique
 import nuke
 from ayon_nuke import api as napi
-from ayon_core.pipeline import publish
+from ayon_nuke.api.lib import (
+    maintained_selection,
+    node_tempfile,
+    select_nodes,
+)
+from ayon_nuke.api.render_manifest import deferred_render_manifest
+from ayon_nuke.api.sequence import (
+    FrameRanges,
+    PathTemplate,
+    SequenceFiles,
+)
+from ayon_core.pipeline import publish, KnownPublishError
 from ayon_core.lib import collect_frames
 
 
@@ -27,16 +40,13 @@ class NukeRenderLocal(publish.Extractor,
 
     settings_category = "nuke"
 
-    def process(self, instance):
-        child_nodes = (
-            instance.data.get("transientData", {}).get("childNodes")
-            or instance
-        )
+    # render frame ranges in background nuke processes
+    parallel_rendering = False
+    workers = 4
+    chunk_size = 10
 
-        node = None
-        for x in child_nodes:
-            if x.Class() == "Write":
-                node = x
+    def process(self, instance):
+        node = napi.get_instance_group_index(instance).write_node
 
         self.log.debug("instance collected: {}".format(instance.data))
 
@@ -45,23 +55,11 @@ class NukeRenderLocal(publish.Extractor,
         first_frame = instance.data.get("frameStartHandle", None)
         last_frame = instance.data.get("frameEndHandle", None)
 
-        filenames = []
-        node_file = node["file"]
-        # Collect expected filepaths for each frame
-        # - for cases that output is still image is first created set of
-        #   paths which is then sorted and converted to list
-        expected_paths = list(sorted({
-            node_file.evaluate(frame)
-            for frame in range(first_frame, last_frame + 1)
-        }))
-        # Extract only filenames for representation
-        filenames.extend([
-            os.path.basename(filepath)
-            for filepath in expected_paths
-        ])
+        filenames = self._get_expected_filenames(
+            node, first_frame, last_frame)
 
         # Ensure output directory exists.
-        out_dir = os.path.dirname(expected_paths[0])
+        out_dir = os.path.dirname(node["file"].evaluate(first_frame))
         if not os.path.exists(out_dir):
             os.makedirs(out_dir)
 
@@ -74,18 +72,29 @@ class NukeRenderLocal(publish.Extractor,
             self._copy_last_published(anatomy, instance, out_dir,
                                       filenames)
 
-        for render_first_frame, render_last_frame in frames_to_render:
+        # manifest is written once after all frames are rendered
+        with deferred_render_manifest():
+            if instance.data.get("localRendered"):
+                self.log.info(
+                    "Frames were already rendered by 'Render Local Batch'")
+            elif self.parallel_rendering and self.workers > 1:
+                self._render_parallel(str(node_product_name), frames_to_render)
+            else:
+                for render_first_frame, render_last_frame in frames_to_render:
 
-            self.log.info("Starting render")
-            self.log.info("Start frame: {}".format(render_first_frame))
-            self.log.info("End frame: {}".format(render_last_frame))
+                    self.log.info("Starting render")
+                    self.log.info("Start frame: {}".format(render_first_frame))
+                    self.log.info("End frame: {}".format(render_last_frame))
 
-            # Render frames
-            nuke.execute(
-                str(node_product_name),
-                int(render_first_frame),
-                int(render_last_frame)
-            )
+                    # Render frames
+                    nuke.execute(
+                        str(node_product_name),
+                        int(render_first_frame),
+                        int(render_last_frame)
+                    )
+
+        # following publishes can use frames without listing directory
+        napi.write_render_manifest(node)
 
         ext = node["file_type"].value()
         colorspace = napi.get_colorspace_from_node(node)
@@ -151,7 +160,15 @@ class NukeRenderLocal(publish.Extractor,
             anatomy_data["product"]["type"] = "image"
         instance.data["families"] = families
 
-        collections, remainder = clique.assemble(filenames)
+        if isinstance(filenames, SequenceFiles):
+            collections = [clique.Collection(
+                filenames.head,
+                filenames.tail,
+                filenames.padding,
+                indexes=set(filenames.frames)
+            )]
+        else:
+            collections, remainder = clique.assemble(filenames)
         self.log.debug('collections: {}'.format(str(collections)))
 
         if collections:
@@ -162,6 +179,148 @@ class NukeRenderLocal(publish.Extractor,
 
         self.log.debug("_ instance.data: {}".format(instance.data))
 
+    def _get_expected_filenames(self, node, first_frame, last_frame):
+        """Get expected filenames of rendered frames.
+
+        Sequences are returned as lazy `SequenceFiles` so long frame
+        ranges do not need to be evaluated frame by frame.
+
+        Args:
+            node (nuke.Node): write node
+            first_frame (int): first frame
+            last_frame (int): last frame
+
+        Returns:
+            Union[list[str], SequenceFiles]: expected filenames
+        """
+        template = PathTemplate.parse(nuke.filename(node))
+        if template is not None and last_frame > first_frame:
+            return SequenceFiles.from_template(
+                template, FrameRanges([(first_frame, last_frame)]))
+
+        node_file = node["file"]
+        # Collect expected filepaths for each frame
+        # - for cases that output is still image is first created set of
+        #   paths which is then sorted and converted to list
+        expected_paths = sorted({
+            node_file.evaluate(frame)
+            for frame in range(first_frame, last_frame + 1)
+        })
+        # Extract only filenames for representation
+        return [
+            os.path.basename(filepath)
+            for filepath in expected_paths
+        ]
+
+    def _render_parallel(self, node_name, frames_to_render):
+        """Render frame ranges in chunks with background nuke processes.
+
+        Each process is rendering one chunk from a temporary copy of the
+        current script, at most `workers` processes are running at once.
+
+        Args:
+            node_name (str): name of node to be executed
+            frames_to_render (list[tuple[int, int]]): frame ranges
+        """
+        chunks = self._split_frame_ranges(frames_to_render, self.chunk_size)
+        self.log.info(
+            "Starting parallel render of {} chunks in {} workers".format(
+                len(chunks), self.workers)
+        )
+
+        with node_tempfile() as script_path:
+            self._save_script_copy(script_path)
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(
+                    lambda chunk: self._render_chunk(
+                        script_path, node_name, *chunk),
+                    chunks
+                ))
+
+        failed_chunks = [
+            chunk for chunk, success in zip(chunks, results)
+            if not success
+        ]
+        if failed_chunks:
+            raise KnownPublishError(
+                "Rendering of frames {} failed.".format(", ".join(
+                    "{}-{}".format(*chunk) for chunk in failed_chunks
+                ))
+            )
+
+    def _save_script_copy(self, script_path):
+        """Write copy of current script without saving the script.
+
+        Real save would change name and modified state of the current
+        script and trigger save callbacks.
+
+        Args:
+            script_path (str): Path to copy of the script.
+        """
+        save_to_temp = getattr(nuke, "scriptSaveToTemp", None)
+        if save_to_temp is not None:
+            save_to_temp(script_path)
+            return
+
+        # copy all nodes after root settings
+        with maintained_selection():
+            select_nodes(nuke.allNodes())
+            nuke.nodeCopy(script_path)
+
+        root_knobs = nuke.root().writeKnobs(
+            nuke.WRITE_NON_DEFAULT_ONLY | nuke.TO_SCRIPT | nuke.TO_VALUE
+        )
+        with open(script_path, "r") as stream:
+            nodes_content = stream.read()
+        with open(script_path, "w") as stream:
+            stream.write("Root {\n" + root_knobs + "\n}\n")
+            stream.write(nodes_content)
+
+    def _render_chunk(self, script_path, node_name, first_frame, last_frame):
+        args = [
+            nuke.EXE_PATH,
+            "-x",
+            "-X", node_name,
+            "-F", "{}-{}".format(first_frame, last_frame),
+        ]
+        if nuke.env.get("nukex"):
+            args.append("--nukex")
+        args.append(script_path)
+
+        self.log.debug("Rendering frames {}-{}".format(
+            first_frame, last_frame))
+        process = subprocess.run(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True
+        )
+        if process.returncode != 0:
+            self.log.error("Render of frames {}-{} failed:\n{}".format(
+                first_frame, last_frame, process.stdout))
+            return False
+        return True
+
+    def _split_frame_ranges(self, frame_ranges, chunk_size):
+        """Split frame ranges into chunks of maximum `chunk_size` frames.
+
+        Args:
+            frame_ranges (list[tuple[int, int]]): frame ranges
+            chunk_size (int): maximum number of frames in chunk
+
+        Returns:
+            (list): [(1001, 1010), (1011, 1020), (1021, 1025)]
+        """
+        chunk_size = max(int(chunk_size), 1)
+        chunks = []
+        for first_frame, last_frame in frame_ranges:
+            first_frame, last_frame = int(first_frame), int(last_frame)
+            for chunk_first in range(first_frame, last_frame + 1, chunk_size):
+                chunk_last = min(chunk_first + chunk_size - 1, last_frame)
+                chunks.append((chunk_first, chunk_last))
+        return chunks
+
     def _copy_last_published(self, anatomy, instance, out_dir,
                              expected_filenames):
         """Copies last published files to temporary out_dir.
@@ -200,19 +359,4 @@ class NukeRenderLocal(publish.Extractor,
         Returns:
             (list): [(1005, 1005), (1009-1010)]
         """
-        frames_to_render = []
-
-        for frame_range in frames_to_fix.split(","):
-            if frame_range.isdigit():
-                render_first_frame = frame_range
-                render_last_frame = frame_range
-            elif '-' in frame_range:
-                frames = frame_range.split('-')
-                render_first_frame = int(frames[0])
-                render_last_frame = int(frames[1])
-            else:
-                raise ValueError("Wrong format of frames to fix {}"
-                                 .format(frames_to_fix))
-            frames_to_render.append((render_first_frame,
-                                     render_last_frame))
-        return frames_to_render
+        return FrameRanges.parse(frames_to_fix).ranges
@@ -0,0 +1,93 @@
+import os
+from collections import defaultdict
+
+import nuke
+import pyblish.api
+
+
+class NukeRenderLocalBatch(pyblish.api.ContextPlugin):
+    """Render local write instances sharing frame range at once.
+
+    All write instances with the same frame range are rendered with one
+    `nuke.executeMultiple` call, so upstream node tree shared by them
+    is computed only once per frame. Rendered instances are marked with
+    `localRendered` so `NukeRenderLocal` only creates representations.
+
+    Instances re-rendering only specific frames (`frames_to_fix`) are
+    left to `NukeRenderLocal`.
+    """
+
+    order = pyblish.api.ExtractorOrder - 0.01
+    label = "Render Local Batch"
+    hosts = ["nuke"]
+
+    settings_category = "nuke"
+
+    enabled = False
+
+    local_families = {"render.local", "prerender.local", "image.local"}
+
+    def process(self, context):
+        instances_by_range = defaultdict(list)
+        for instance in self._get_local_instances(context):
+            frame_range = (
+                int(instance.data["frameStartHandle"]),
+                int(instance.data["frameEndHandle"])
+            )
+            instances_by_range[frame_range].append(instance)
+
+        for (first_frame, last_frame), instances in (
+            instances_by_range.items()
+        ):
+            # single instance is rendered by `NukeRenderLocal`
+            if len(instances) < 2:
+                continue
+
+            instances.sort(key=self._get_render_order)
+            write_nodes = []
+            for instance in instances:
+                out_dir = os.path.dirname(instance.data["path"])
+                if not os.path.exists(out_dir):
+                    os.makedirs(out_dir)
+                write_nodes.append(
+                    instance.data["transientData"]["writeNode"])
+
+            self.log.info("Rendering {} in frames {}-{}".format(
+                ", ".join(instance.name for instance in instances),
+                first_frame,
+                last_frame
+            ))
+            nuke.executeMultiple(
+                write_nodes, ((first_frame, last_frame, 1),)
+            )
+
+            for instance in instances:
+                instance.data["localRendered"] = True
+
+    def _get_local_instances(self, context):
+        for instance in context:
+            if not instance.data.get("publish", True):
+                continue
+
+            if not self.local_families & set(instance.data["families"]):
+                continue
+
+            if (
+                instance.data.get("last_version_published_files")
+                and instance.data.get("frames_to_fix")
+            ):
+                continue
+
+            if not instance.data["transientData"].get("writeNode"):
+                continue
+
+            yield instance
+
+    def _get_render_order(self, instance):
+        """Sort key following order of instances in publisher."""
+        node = instance.data["transientData"]["node"]
+        render_order = 0
+        render_order_knob = node.knob("render_order")
+        if render_order_knob is not None:
+            render_order = int(render_order_knob.value())
+        return render_order, instance.data["productName"]
@@ -43,7 +43,10 @@ class ExtractReviewDataLut(publish.Extractor):
             exporter = plugin.ExporterReviewLut(
                 self, instance
                 )
-            data = exporter.generate_lut()
+            try:
+                data = exporter.generate_lut()
+            finally:
+                exporter.delete_all_temp_nodes()
 
             # assign to representations
             instance.data["lutPath"] = os.path.join(
@@ -121,9 +121,12 @@ class ExtractReviewIntermediates(publish.Extractor):
                     if "review" in instance.data["families"]:
                         instance.data["families"].remove("review")
 
-                    data = exporter.generate_mov(
-                        farm=True, delete=delete, **o_data
-                    )
+                    try:
+                        data = exporter.generate_mov(
+                            farm=True, delete=delete, **o_data
+                        )
+                    finally:
+                        exporter.delete_all_temp_nodes()
 
                     self.log.debug(
                         "_ data: {}".format(data))
@@ -137,7 +140,10 @@ class ExtractReviewIntermediates(publish.Extractor):
                         "bakeWriteNodeName": data.get("bakeWriteNodeName")
                     })
                 else:
-                    data = exporter.generate_mov(delete=delete, **o_data)
+                    try:
+                        data = exporter.generate_mov(delete=delete, **o_data)
+                    finally:
+                        exporter.delete_all_temp_nodes()
 
                 # add representation generated by exporter
                 generated_repres.extend(data["representations"])
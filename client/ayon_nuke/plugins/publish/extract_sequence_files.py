@@ -0,0 +1,29 @@
+import pyblish.api
+
+from ayon_nuke.api.sequence import expand_sequence_files
+
+
+class ExpandSequenceFiles(pyblish.api.InstancePlugin):
+    """Convert lazy sequence files of representations to plain lists.
+
+    Collectors and extractors of Nuke keep long sequences in
+    representations as compact `SequenceFiles`. Following extractors
+    and integrator expect `files` to be a list.
+    """
+
+    order = pyblish.api.ExtractorOrder + 0.0105
+    label = "Expand Sequence Files"
+    hosts = ["nuke"]
+    families = ["*"]
+
+    settings_category = "nuke"
+
+    def process(self, instance):
+        for repre in instance.data.get("representations", []):
+            files = repre.get("files")
+            expanded_files = expand_sequence_files(files)
+            if expanded_files is not files:
+                self.log.debug(
+                    "Expanding files of representation '{}'".format(
+                        repre["name"]))
+                repre["files"] = expanded_files
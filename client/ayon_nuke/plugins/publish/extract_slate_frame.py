@@ -12,6 +12,7 @@ from ayon_nuke.api import (
     duplicate_node,
     get_view_process_node
 )
+from ayon_nuke.api.sequence import PathTemplate
 
 
 class ExtractSlateFrame(publish.Extractor):
@@ -91,19 +92,16 @@ class ExtractSlateFrame(publish.Extractor):
         first = instance.data["frameStartHandle"]
         last = instance.data["frameEndHandle"]
 
-        padding = fpath.count('#')
+        template = PathTemplate.parse(fpath)
+        if template is None:
+            return os.path.exists(fpath) or None
 
-        test_path_template = fpath
-        if padding:
-            repl_string = "#" * padding
-            test_path_template = fpath.replace(
-                repl_string, "%0{}d".format(padding))
-
-        for frame in range(first, last + 1):
-            test_file = test_path_template % frame
-            if not os.path.exists(test_file):
-                self.log.debug("__ test_file: `{}`".format(test_file))
-                return None
+        # single directory scan instead of checking each frame file
+        existing_frames = template.scan_frames()
+        if not existing_frames.contains_range(first, last):
+            self.log.debug("__ missing frames: `{}`".format(
+                existing_frames.missing(first, last)))
+            return None
 
         return True
 
@@ -0,0 +1,22 @@
+import pyblish.api
+
+from ayon_nuke import api as napi
+
+
+class ReleasePublishCache(pyblish.api.ContextPlugin):
+    """Release values cached by publish plugins
+
+    Nodes cached for instances are not kept in memory after publish.
+    Runs only when publish succeeds, pyblish does not reach integrator
+    order after failed validation or extraction. Cache of failed publish
+    stays in its context data until the context is discarded, temporary
+    nodes are deleted by extractors themselves.
+    """
+    label = "Release Publish Cache"
+    order = pyblish.api.IntegratorOrder + 0.5
+    hosts = ["nuke"]
+
+    settings_category = "nuke"
+
+    def process(self, context):
+        napi.release_publish_cache(context)
@@ -1,6 +1,7 @@
 import pyblish.api
 
 from ayon_core.pipeline.publish import get_errored_instances_from_context
+from ayon_nuke.api import get_instance_group_index
 from ayon_nuke.api.lib import link_knobs
 from ayon_core.pipeline.publish import (
     OptionalPyblishPluginMixin,
@@ -17,17 +18,9 @@ class RepairExposedKnobs(pyblish.api.Action):
         instances = get_errored_instances_from_context(context)
 
         for instance in instances:
-            child_nodes = (
-                instance.data.get("transientData", {}).get("childNodes")
-                or instance
-            )
-
             write_group_node = instance.data["transientData"]["node"]
             # get write node from inside of group
-            write_node = None
-            for x in child_nodes:
-                if x.Class() == "Write":
-                    write_node = x
+            write_node = get_instance_group_index(instance).write_node
 
             product_type = instance.data["productType"]
             plugin_name = plugin.product_types_mapping[product_type]
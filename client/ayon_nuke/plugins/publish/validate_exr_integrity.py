@@ -0,0 +1,106 @@
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import pyblish.api
+
+from ayon_core.lib import collect_frames
+from ayon_core.pipeline import (
+    PublishValidationError,
+    OptionalPyblishPluginMixin
+)
+from ayon_nuke.api.exr_header import ExrHeaderError, read_exr_header
+from ayon_nuke.api.sequence import FrameRanges
+
+
+def get_corrupted_frames(frame_paths, check_offsets=False, workers=8):
+    """Validate EXR headers of frames in parallel.
+
+    Args:
+        frame_paths (dict[int, str]): Paths to EXR files by frame.
+        check_offsets (bool): Validate also offset tables.
+        workers (int): Number of threads reading headers.
+
+    Returns:
+        dict[int, str]: Reason of failure by corrupted frame.
+    """
+    def _validate(frame_path):
+        frame, path = frame_path
+        try:
+            read_exr_header(path, check_offsets)
+        except (ExrHeaderError, OSError, struct.error) as exc:
+            return frame, str(exc) or exc.__class__.__name__
+        return frame, None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = executor.map(_validate, frame_paths.items())
+        return {
+            frame: reason
+            for frame, reason in results
+            if reason is not None
+        }
+
+
+class ValidateExrIntegrity(
+    OptionalPyblishPluginMixin,
+    pyblish.api.InstancePlugin
+):
+    """Validates headers of rendered EXR frames.
+
+    Truncated or zero-byte frames left by killed renders are reported
+    as frames to fix which can be re-rendered locally.
+    """
+
+    order = pyblish.api.ValidatorOrder + 0.15
+    optional = True
+    families = ["render", "prerender", "image"]
+    label = "Validate EXR Integrity"
+    hosts = ["nuke"]
+
+    settings_category = "nuke"
+
+    check_offset_table = False
+    workers = 8
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        frame_paths = {}
+        for repre in instance.data.get("representations", []):
+            if repre["ext"] != "exr":
+                continue
+            files = repre["files"]
+            if isinstance(files, str):
+                files = [files]
+            staging_dir = repre["stagingDir"]
+            for filename, frame in collect_frames(files).items():
+                if frame is None:
+                    continue
+                frame_paths[int(frame)] = os.path.join(staging_dir, filename)
+
+        if not frame_paths:
+            return
+
+        corrupted_frames = get_corrupted_frames(
+            frame_paths, self.check_offset_table, self.workers)
+        if not corrupted_frames:
+            return
+
+        for frame in sorted(corrupted_frames):
+            self.log.error("Frame {} is corrupted: {}".format(
+                frame, corrupted_frames[frame]))
+
+        frames_to_fix = str(FrameRanges.from_frames(corrupted_frames))
+        raise PublishValidationError(
+            "Corrupted frames: {}".format(frames_to_fix),
+            title="Corrupted EXR frames",
+            description=(
+                "## Corrupted EXR frames\n\n"
+                "Headers of some rendered frames are not valid, the frames"
+                " were probably not written completely.\n\n"
+                "### How to repair?\n\n"
+                "Re-render frames `{}` using 'Frames to fix' of the"
+                " instance or render all frames again."
+            ).format(frames_to_fix)
+        )
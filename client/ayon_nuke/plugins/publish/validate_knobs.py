@@ -1,6 +1,5 @@
 import json
 
-import nuke
 import six
 import pyblish.api
 
@@ -8,6 +7,7 @@ from ayon_core.pipeline.publish import (
     RepairContextAction,
     PublishXmlValidationError,
 )
+from ayon_nuke.api.knob_rules import KnobRuleSet, iter_audited_nodes
 
 
 class ValidateKnobs(pyblish.api.ContextPlugin):
@@ -64,58 +64,12 @@ class ValidateKnobs(pyblish.api.ContextPlugin):
 
     @classmethod
     def get_invalid_knobs(cls, context):
-        invalid_knobs = []
-
-        for instance in context:
-            # Load fresh knobs data for each instance
-            settings_knobs = json.loads(cls.knobs)
-
-            # Filter families.
-            families = [instance.data["productType"]]
-            families += instance.data.get("families", [])
-
-            # Get all knobs to validate.
-            knobs = {}
-            for family in families:
-                # check if dot in family
-                if "." in family:
-                    family = family.split(".")[0]
-
-                # avoid families not in settings
-                if family not in settings_knobs:
-                    continue
-
-                # get presets of knobs
-                for preset in settings_knobs[family]:
-                    knobs[preset] = settings_knobs[family][preset]
-
-            # Get invalid knobs.
-            nodes = []
-
-            for node in nuke.allNodes():
-                nodes.append(node)
-                if node.Class() == "Group":
-                    node.begin()
-                    nodes.extend(iter(nuke.allNodes()))
-                    node.end()
-
-            for node in nodes:
-                for knob in node.knobs():
-                    if knob not in knobs.keys():
-                        continue
-
-                    expected = knobs[knob]
-                    if node[knob].value() != expected:
-                        invalid_knobs.append(
-                            {
-                                "node_name": node.name(),
-                                "knob": node[knob],
-                                "name": node[knob].name(),
-                                "label": node[knob].label(),
-                                "expected": expected,
-                                "current": node[knob].value()
-                            }
-                        )
+        # Compile knob rules of all instances at once
+        rule_set = KnobRuleSet.from_family_settings(
+            json.loads(cls.knobs), context)
+
+        # Get invalid knobs in single pass over nodes.
+        invalid_knobs = rule_set.audit_nodes(iter_audited_nodes())
 
         context.data["invalid_knobs"] = invalid_knobs
         return invalid_knobs
@@ -42,18 +42,7 @@ class ValidateOutputResolution(
 
     @classmethod
     def get_reformat(cls, instance):
-        child_nodes = (
-            instance.data.get("transientData", {}).get("childNodes")
-            or instance
-        )
-
-        reformat = None
-        for inode in child_nodes:
-            if inode.Class() != "Reformat":
-                continue
-            reformat = inode
-
-        return reformat
+        return napi.get_instance_group_index(instance).get_node("Reformat")
 
     @classmethod
     def get_invalid(cls, instance):
@@ -81,11 +70,6 @@ class ValidateOutputResolution(
 
     @classmethod
     def repair(cls, instance):
-        child_nodes = (
-            instance.data.get("transientData", {}).get("childNodes")
-            or instance
-        )
-
         invalid = cls.get_invalid(instance)
         grp_node = instance.data["transientData"]["node"]
 
@@ -93,11 +77,7 @@ class ValidateOutputResolution(
             # make sure we are inside of the group node
             with grp_node:
                 # find input node and select it
-                _input = None
-                for inode in child_nodes:
-                    if inode.Class() != "Input":
-                        continue
-                    _input = inode
+                _input = napi.get_instance_group_index(instance).input_node
 
                 # add reformat node under it
                 with napi.maintained_selection():
@@ -108,6 +88,9 @@ class ValidateOutputResolution(
 
                 cls.log.info("Adding reformat node")
 
+            # group content changed
+            napi.invalidate_instance_group_index(instance)
+
         if cls.resolution_msg == invalid:
             reformat = cls.get_reformat(instance)
             reformat["format"].setValue(nuke.root()["format"].value())
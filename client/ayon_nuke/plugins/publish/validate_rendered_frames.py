@@ -77,6 +77,12 @@ class ValidateRenderedFrames(pyblish.api.InstancePlugin):
             if isinstance(repre["files"], str):
                 return
 
+            frame_scan = instance.data.get("frameScan")
+            if frame_scan is not None:
+                self._validate_frame_scan(
+                    instance, repre["files"], frame_scan, f_data)
+                return
+
             collections, remainder = clique.assemble(repre["files"])
             self.log.debug("collections: {}".format(str(collections)))
             self.log.debug("remainder: {}".format(str(remainder)))
@@ -137,3 +143,64 @@ class ValidateRenderedFrames(pyblish.api.InstancePlugin):
             instance.data["collection"] = collection
 
             return
+
+    def _validate_frame_scan(self, instance, files, frame_scan, f_data):
+        """Validate frames from scan made by `CollectNukeWrites`.
+
+        Files are not assembled again, existing frames are known
+        from the frame bitmap.
+
+        Args:
+            instance (pyblish.api.Instance): pyblish instance
+            files (list[str]): representation files
+            frame_scan (dict): scanned frames data
+            f_data (dict): formatting data for error message
+        """
+        frame_start = frame_scan["frameStart"]
+        indexes = {
+            frame_start + idx
+            for idx, exists in enumerate(frame_scan["bitmap"])
+            if exists
+        }
+        if not indexes:
+            msg = "No frames were found in the folder"
+            self.log.error(msg)
+            raise PublishXmlValidationError(
+                self, msg, formatting_data=f_data)
+
+        coll_start = min(indexes)
+        coll_end = max(indexes)
+        # gaps in between collected frames
+        inner_gaps = [
+            frame_range
+            for frame_range in frame_scan["missingRanges"]
+            if coll_start < frame_range[0] and frame_range[1] < coll_end
+        ]
+        self.log.debug("Missing frame ranges: {}".format(
+            frame_scan["missingRanges"]))
+
+        f_start_h = instance.data["frameStartHandle"]
+        f_end_h = instance.data["frameEndHandle"]
+        frame_length = int(f_end_h - f_start_h + 1)
+
+        if frame_length != 1 and inner_gaps:
+            msg = "Some frames appear to be missing: {}".format(
+                ",".join(
+                    "{}-{}".format(*frame_range)
+                    for frame_range in inner_gaps
+                )
+            )
+            self.log.error(msg)
+            raise PublishXmlValidationError(
+                self, msg, formatting_data=f_data)
+
+        # slate frame added to files by collector
+        if len(files) > len(indexes):
+            indexes.add(frame_start - 1)
+
+        instance.data["collection"] = clique.Collection(
+            frame_scan["head"],
+            frame_scan["tail"],
+            frame_scan["padding"],
+            indexes=indexes
+        )
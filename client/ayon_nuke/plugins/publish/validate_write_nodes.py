@@ -1,11 +1,13 @@
-from collections import defaultdict
-
 import pyblish.api
 from ayon_core.pipeline.publish import get_errored_instances_from_context
+from ayon_nuke.api import (
+    get_instance_group_index,
+    invalidate_instance_group_index
+)
+from ayon_nuke.api.knob_rules import KnobRuleSet
 from ayon_nuke.api.lib import (
     get_write_node_template_attr,
     set_node_knobs_from_settings,
-    color_gui_to_int
 )
 
 from ayon_core.pipeline.publish import (
@@ -23,21 +25,14 @@ class RepairNukeWriteNodeAction(pyblish.api.Action):
         instances = get_errored_instances_from_context(context)
 
         for instance in instances:
-            child_nodes = (
-                instance.data.get("transientData", {}).get("childNodes")
-                or instance
-            )
-
             write_group_node = instance.data["transientData"]["node"]
             # get write node from inside of group
-            write_node = None
-            for x in child_nodes:
-                if x.Class() == "Write":
-                    write_node = x
+            write_node = get_instance_group_index(instance).write_node
 
             correct_data = get_write_node_template_attr(write_group_node)
 
             set_node_knobs_from_settings(write_node, correct_data["knobs"])
+            invalidate_instance_group_index(instance)
 
             self.log.debug("Node attributes were fixed")
 
@@ -65,40 +60,18 @@ class ValidateNukeWriteNode(
         if not self.is_active(instance.data):
             return
 
-        child_nodes = (
-            instance.data.get("transientData", {}).get("childNodes")
-            or instance
-        )
-
         write_group_node = instance.data["transientData"]["node"]
 
         # get write node from inside of group
-        write_node = None
-        for x in child_nodes:
-            if x.Class() == "Write":
-                write_node = x
+        write_node = get_instance_group_index(instance).write_node
 
         if write_node is None:
             return
 
         correct_data = get_write_node_template_attr(write_group_node)
 
-        check = []
-
-        # Collect key values of same type in a list.
-        values_by_name = defaultdict(list)
         for knob_data in correct_data["knobs"]:
-            knob_type = knob_data["type"]
-            knob_value = knob_data[knob_type]
-
-            values_by_name[knob_data["name"]].append(knob_value)
-
-        for knob_data in correct_data["knobs"]:
-            knob_type = knob_data["type"]
-
-            if (
-                knob_type == "__legacy__"
-            ):
+            if knob_data["type"] == "__legacy__":
                 raise PublishXmlValidationError(
                     self, (
                         "Please update data in settings 'project_settings"
@@ -107,34 +80,13 @@ class ValidateNukeWriteNode(
                     key="legacy"
                 )
 
-            key = knob_data["name"]
-            values = values_by_name[key]
-            node_value = write_node[key].value()
-
-            # fix type differences
-            fixed_values = []
-            for value in values:
-                if type(node_value) in (int, float):
-                    try:
-                        if isinstance(value, list):
-                            value = color_gui_to_int(value)
-                        else:
-                            value = float(value)
-                            node_value = float(node_value)
-                    except ValueError:
-                        value = str(value)
-                else:
-                    value = str(value)
-                    node_value = str(node_value)
-
-                fixed_values.append(value)
-
-            if (
-                node_value not in fixed_values
-                and key != "file"
-                and key != "tile_color"
-            ):
-                check.append([key, fixed_values, write_node[key].value()])
+        rule_set = KnobRuleSet.from_imageio_knobs(
+            correct_data["knobs"], ignored_knob_names=("file", "tile_color")
+        )
+        check = [
+            [violation["name"], violation["expected"], violation["current"]]
+            for violation in rule_set.audit_node(write_node)
+        ]
 
         if check:
             self._make_error(check)
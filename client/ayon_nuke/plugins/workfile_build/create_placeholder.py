@@ -34,16 +34,13 @@ class NukePlaceholderCreatePlugin(
             NukePlaceholderCreatePlugin, self
         )._parse_placeholder_node_data(node)
 
-        node_knobs = node.knobs()
-        nb_children = 0
-        if "nb_children" in node_knobs:
-            nb_children = int(node_knobs["nb_children"].getValue())
-        placeholder_data["nb_children"] = nb_children
-
-        siblings = []
-        if "siblings" in node_knobs:
-            siblings = node_knobs["siblings"].values()
-        placeholder_data["siblings"] = siblings
+        knob_values = self._get_placeholder_knob_values(node)
+        placeholder_data["nb_children"] = int(
+            knob_values.get("nb_children", 0)
+        )
+        placeholder_data["siblings"] = list(
+            knob_values.get("siblings", [])
+        )
 
         node_full_name = node.fullName()
         placeholder_data["group_name"] = node_full_name.rpartition(".")[0]
@@ -52,17 +49,14 @@ class NukePlaceholderCreatePlugin(
         return placeholder_data
 
     def _before_instance_create(self, placeholder):
-        placeholder.data["nodes_init"] = nuke.allNodes()
+        self._start_node_journal(placeholder)
 
     def collect_placeholders(self):
         output = []
         scene_placeholders = self._collect_scene_placeholders()
         for node_name, node in scene_placeholders.items():
-            plugin_identifier_knob = node.knob("plugin_identifier")
-            if (
-                plugin_identifier_knob is None
-                or plugin_identifier_knob.getValue() != self.identifier
-            ):
+            knob_values = self._get_placeholder_knob_values(node)
+            if knob_values.get("plugin_identifier") != self.identifier:
                 continue
 
             placeholder_data = self._parse_placeholder_node_data(node)
@@ -74,10 +68,16 @@ class NukePlaceholderCreatePlugin(
         return output
 
     def populate_placeholder(self, placeholder):
-        self.populate_create_placeholder(placeholder)
+        try:
+            self.populate_create_placeholder(placeholder)
+        finally:
+            self._stop_node_journal(placeholder)
 
     def repopulate_placeholder(self, placeholder):
-        self.populate_create_placeholder(placeholder)
+        try:
+            self.populate_create_placeholder(placeholder)
+        finally:
+            self._stop_node_journal(placeholder)
 
     def get_placeholder_options(self, options=None):
         return self.get_create_plugin_options(options)
@@ -94,8 +94,7 @@ class NukePlaceholderCreatePlugin(
         placeholder_node = nuke.toNode(placeholder.scene_identifier)
 
         # getting the latest nodes added
-        nodes_init = placeholder.data["nodes_init"]
-        nodes_created = list(set(nuke.allNodes()) - set(nodes_init))
+        nodes_created = self._pop_journal_nodes(placeholder)
         self.log.debug("Created nodes: {}".format(nodes_created))
         if not nodes_created:
             return
@@ -307,6 +306,10 @@ class NukePlaceholderCreatePlugin(
         if diff_y <= 0 and diff_x <= 0:
             return
 
+        # backdrops containing all the contained nodes are resized
+        enclosing_backdrops = self._get_enclosing_backdrop_names(
+            contained_nodes, placeholder.data["group_name"])
+
         for node in nodes:
             refresh_node(node)
 
@@ -318,10 +321,7 @@ class NukePlaceholderCreatePlugin(
 
             if (
                 not isinstance(node, nuke.BackdropNode)
-                or (
-                    isinstance(node, nuke.BackdropNode)
-                    and not set(contained_nodes) <= set(node.getNodes())
-                )
+                or node.name() not in enclosing_backdrops
             ):
                 if offset_y is None and node.xpos() >= min_x:
                     node.setXpos(node.xpos() + diff_x)
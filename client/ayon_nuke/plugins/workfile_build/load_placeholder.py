@@ -32,16 +32,13 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
             NukePlaceholderLoadPlugin, self
         )._parse_placeholder_node_data(node)
 
-        node_knobs = node.knobs()
-        nb_children = 0
-        if "nb_children" in node_knobs:
-            nb_children = int(node_knobs["nb_children"].getValue())
-        placeholder_data["nb_children"] = nb_children
-
-        siblings = []
-        if "siblings" in node_knobs:
-            siblings = node_knobs["siblings"].values()
-        placeholder_data["siblings"] = siblings
+        knob_values = self._get_placeholder_knob_values(node)
+        placeholder_data["nb_children"] = int(
+            knob_values.get("nb_children", 0)
+        )
+        placeholder_data["siblings"] = list(
+            knob_values.get("siblings", [])
+        )
 
         node_full_name = node.fullName()
         placeholder_data["group_name"] = node_full_name.rpartition(".")[0]
@@ -66,8 +63,20 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
             )
         return loaded_representation_ids
 
+    # overrides private method of ayon-core, prefetch is skipped by
+    #   builder when ayon-core does not provide it
+    def _get_representations(self, placeholder):
+        representations = self.builder.get_prefetched_representations(
+            placeholder
+        )
+        if representations is None:
+            representations = super(
+                NukePlaceholderLoadPlugin, self
+            )._get_representations(placeholder)
+        return representations
+
     def _before_placeholder_load(self, placeholder):
-        placeholder.data["nodes_init"] = nuke.allNodes()
+        self._start_node_journal(placeholder)
 
     def _before_repre_load(self, placeholder, representation):
         placeholder.data["last_repre_id"] = representation["id"]
@@ -76,11 +85,8 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
         output = []
         scene_placeholders = self._collect_scene_placeholders()
         for node_name, node in scene_placeholders.items():
-            plugin_identifier_knob = node.knob("plugin_identifier")
-            if (
-                plugin_identifier_knob is None
-                or plugin_identifier_knob.getValue() != self.identifier
-            ):
+            knob_values = self._get_placeholder_knob_values(node)
+            if knob_values.get("plugin_identifier") != self.identifier:
                 continue
 
             placeholder_data = self._parse_placeholder_node_data(node)
@@ -92,11 +98,17 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
         return output
 
     def populate_placeholder(self, placeholder):
-        self.populate_load_placeholder(placeholder)
+        try:
+            self.populate_load_placeholder(placeholder)
+        finally:
+            self._stop_node_journal(placeholder)
 
     def repopulate_placeholder(self, placeholder):
         repre_ids = self._get_loaded_repre_ids()
-        self.populate_load_placeholder(placeholder, repre_ids)
+        try:
+            self.populate_load_placeholder(placeholder, repre_ids)
+        finally:
+            self._stop_node_journal(placeholder)
 
     def get_placeholder_options(self, options=None):
         return self.get_load_plugin_options(options)
@@ -113,9 +125,7 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
         placeholder_node = nuke.toNode(placeholder.scene_identifier)
 
         # getting the latest nodes added
-        # TODO get from shared populate data!
-        nodes_init = placeholder.data["nodes_init"]
-        nodes_loaded = list(set(nuke.allNodes()) - set(nodes_init))
+        nodes_loaded = self._pop_journal_nodes(placeholder)
         self.log.debug("Loaded nodes: {}".format(nodes_loaded))
         if not nodes_loaded:
             return
@@ -334,6 +344,10 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
         if diff_y <= 0 and diff_x <= 0:
             return
 
+        # backdrops containing all the contained nodes are resized
+        enclosing_backdrops = self._get_enclosing_backdrop_names(
+            contained_nodes, placeholder.data["group_name"])
+
         for node in nodes:
             refresh_node(node)
 
@@ -345,10 +359,7 @@ class NukePlaceholderLoadPlugin(NukePlaceholderPlugin, PlaceholderLoadMixin):
 
             if (
                 not isinstance(node, nuke.BackdropNode)
-                or (
-                    isinstance(node, nuke.BackdropNode)
-                    and not set(contained_nodes) <= set(node.getNodes())
-                )
+                or node.name() not in enclosing_backdrops
             ):
                 if offset_y is None and node.xpos() >= min_x:
                     node.setXpos(node.xpos() + diff_x)
@@ -1,8 +1,7 @@
-import re
 import os
-import glob
 import nuke
 from ayon_core.lib import Logger
+from ayon_nuke.api.sequence import PathTemplate
 log = Logger.get_logger(__name__)
 
 SINGLE_FILE_FORMATS = ['avi', 'mp4', 'mxf', 'mov', 'mpg', 'mpeg', 'wmv', 'm4v',
@@ -18,13 +17,12 @@ def evaluate_filepath_new(
         combined_relative_path = os.path.abspath(
             os.path.join(project_dir, k_eval))
         combined_relative_path = combined_relative_path.replace('\\', '/')
-        filetype = combined_relative_path.split('.')[-1]
-        frame_number = re.findall(r'\d+', combined_relative_path)[-1]
-        basename = combined_relative_path[: combined_relative_path.rfind(
-            frame_number)]
-        filepath_glob = basename + '*' + filetype
-        glob_search_results = glob.glob(filepath_glob)
-        if len(glob_search_results) <= 0:
+        relative_template = PathTemplate.from_frame_path(
+            combined_relative_path)
+        if (
+            relative_template is None
+            or not relative_template.scan_frames()
+        ):
             combined_relative_path = None
 
     try:
@@ -46,9 +44,12 @@ def evaluate_filepath_new(
 
     filepath = filepath.replace('\\', '/')
     # assumes last number is a sequence counter
-    current_frame = re.findall(r'\d+', filepath)[-1]
-    padding = len(current_frame)
-    basename = filepath[: filepath.rfind(current_frame)]
+    template = PathTemplate.from_frame_path(filepath)
+    if template is None:
+        log.error(
+            "Cannot create Read node. No frame number found in filename "
+            "of `{}`".format(filepath))
+        return None
     filetype = filepath.split('.')[-1]
 
     # sequence or not?
@@ -57,7 +58,7 @@ def evaluate_filepath_new(
     else:
         # Image sequence needs hashes
         # to do still with no number not handled
-        filepath = basename + '#' * padding + '.' + filetype
+        filepath = template.hash_path
 
     # relative path? make it relative again
     if allow_relative:
@@ -65,17 +66,14 @@ def evaluate_filepath_new(
             filepath = filepath.replace(project_dir, '.')
 
     # get first and last frame from disk
-    frames = []
-    firstframe = 0
-    lastframe = 0
-    filepath_glob = basename + '*' + filetype
-    glob_search_results = glob.glob(filepath_glob)
-    for f in glob_search_results:
-        frame = re.findall(r'\d+', f)[-1]
-        frames.append(frame)
-    frames = sorted(frames)
-    firstframe = frames[0]
-    lastframe = frames[len(frames) - 1]
+    frames = template.scan_frames()
+    if not frames:
+        log.error(
+            "Cannot create Read node. No rendered frames found for "
+            "`{}`".format(filepath))
+        return None
+    firstframe = frames.first
+    lastframe = frames.last
 
     if int(lastframe) < 0:
         lastframe = firstframe
@@ -121,15 +119,16 @@ def write_to_read(gn,
             n = group_writes[0]
 
             if n.knob('file') is not None:
-                myfile, firstFrame, lastFrame = evaluate_filepath_new(
+                evaluated = evaluate_filepath_new(
                     n.knob('file').getValue(),
                     n.knob('file').evaluate(),
                     project_dir,
                     comp_start,
                     allow_relative
                 )
-                if not myfile:
+                if not evaluated:
                     return
+                myfile, firstFrame, lastFrame = evaluated
 
                 # get node data
                 ndata = {
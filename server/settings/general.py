@@ -28,9 +28,19 @@ class GeneralSettings(BaseSettingsModel):
         default_factory=MenuShortcut,
         title="Menu Shortcuts",
     )
+    async_inventory_check: bool = SettingsField(
+        False,
+        title="Check Loaded Versions in Background",
+        description=(
+            "Versions of loaded containers are checked in a background"
+            " thread on script open and save, so the UI is not blocked"
+            " while waiting for the server."
+        ),
+    )
 
 
 DEFAULT_GENERAL_SETTINGS = {
+    "async_inventory_check": False,
     "menu": {
         "create": "ctrl+alt+c",
         "publish": "ctrl+alt+p",
@@ -91,6 +91,50 @@ class ValidateKnobsModel(BaseSettingsModel):
         return validate_json_dict(value)
 
 
+class ValidateExrIntegrityModel(BaseSettingsModel):
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    check_offset_table: bool = SettingsField(
+        title="Check Offset Table",
+        description=(
+            "Validate also offset table and completeness of last"
+            " chunk of pixel data in each frame."
+        )
+    )
+    workers: int = SettingsField(
+        8,
+        title="Workers",
+        ge=1,
+        description="Number of threads reading frame headers."
+    )
+
+
+class NukeRenderLocalModel(BaseSettingsModel):
+    parallel_rendering: bool = SettingsField(
+        False,
+        title="Parallel rendering",
+        description=(
+            "Render frame range in chunks with background Nuke processes"
+        )
+    )
+    workers: int = SettingsField(
+        4,
+        title="Number of workers",
+        ge=1
+    )
+    chunk_size: int = SettingsField(
+        10,
+        title="Frames per chunk",
+        ge=1
+    )
+
+
+class NukeRenderLocalBatchModel(BaseSettingsModel):
+    """Render local write instances with same frame range at once."""
+    enabled: bool = SettingsField(title="Enabled")
+
+
 class ExtractReviewDataModel(BaseSettingsModel):
     enabled: bool = SettingsField(title="Enabled")
 
@@ -263,6 +307,18 @@ class PublishPluginsModel(BaseSettingsModel):
         title="Validate workfile attributes",
         default_factory=OptionalPluginModel
     )
+    ValidateExrIntegrity: ValidateExrIntegrityModel = SettingsField(
+        title="Validate EXR Integrity",
+        default_factory=ValidateExrIntegrityModel
+    )
+    NukeRenderLocal: NukeRenderLocalModel = SettingsField(
+        title="Render Local",
+        default_factory=NukeRenderLocalModel
+    )
+    NukeRenderLocalBatch: NukeRenderLocalBatchModel = SettingsField(
+        title="Render Local Batch",
+        default_factory=NukeRenderLocalBatchModel
+    )
     ExtractReviewData: ExtractReviewDataModel = SettingsField(
         title="Extract Review Data",
         default_factory=ExtractReviewDataModel
@@ -338,6 +394,21 @@ DEFAULT_PUBLISH_PLUGIN_SETTINGS = {
         "optional": True,
         "active": True
     },
+    "ValidateExrIntegrity": {
+        "enabled": False,
+        "optional": True,
+        "active": True,
+        "check_offset_table": False,
+        "workers": 8
+    },
+    "NukeRenderLocal": {
+        "parallel_rendering": False,
+        "workers": 4,
+        "chunk_size": 10
+    },
+    "NukeRenderLocalBatch": {
+        "enabled": False
+    },
     "ExtractReviewData": {
         "enabled": False
     },
@@ -0,0 +1,126 @@
+"""Tests of pure Python EXR header reader on synthetic files."""
+import importlib.util
+import os
+import struct
+
+import pytest
+
+EXR_HEADER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client", "ayon_nuke", "api", "exr_header.py"
+)
+
+
+def _load_exr_header():
+    # load module directly, package init requires running Nuke
+    spec = importlib.util.spec_from_file_location(
+        "exr_header", EXR_HEADER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+exr_header = _load_exr_header()
+
+WIDTH = 4
+HEIGHT = 4
+# one half channel
+PIXEL_DATA_SIZE = WIDTH * 2
+
+
+def _attribute(name, attr_type, value):
+    return (
+        name.encode() + b"\0"
+        + attr_type.encode() + b"\0"
+        + struct.pack("<i", len(value))
+        + value
+    )
+
+
+def _build_exr():
+    channels = (
+        b"R\0" + struct.pack("<iB3xii", 1, 0, 1, 1)
+        + b"\0"
+    )
+    header = (
+        struct.pack("<ii", exr_header.EXR_MAGIC, 2)
+        + _attribute("channels", "chlist", channels)
+        + _attribute("compression", "compression", b"\0")
+        + _attribute(
+            "dataWindow", "box2i",
+            struct.pack("<4i", 0, 0, WIDTH - 1, HEIGHT - 1))
+        + b"\0"
+    )
+    # scanline chunks without compression, one line per chunk
+    chunk_size = 8 + PIXEL_DATA_SIZE
+    table_end = len(header) + HEIGHT * 8
+    offsets = [table_end + line * chunk_size for line in range(HEIGHT)]
+    chunks = b"".join(
+        struct.pack("<ii", line, PIXEL_DATA_SIZE) + b"\0" * PIXEL_DATA_SIZE
+        for line in range(HEIGHT)
+    )
+    return (
+        header
+        + struct.pack("<{}Q".format(HEIGHT), *offsets)
+        + chunks
+    )
+
+
+@pytest.fixture
+def write_exr(tmp_path):
+    def _write(content, name="frame.1001.exr"):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return str(path)
+    return _write
+
+
+def test_valid_file(write_exr):
+    path = write_exr(_build_exr())
+    attributes = exr_header.read_exr_header(path, check_offsets=True)
+    assert attributes["channels"] == ["R"]
+    assert attributes["dataWindow"] == (0, 0, WIDTH - 1, HEIGHT - 1)
+    assert attributes["compression"] == 0
+
+
+def test_zero_byte_file(write_exr):
+    path = write_exr(b"")
+    with pytest.raises(exr_header.ExrHeaderError):
+        exr_header.read_exr_header(path)
+
+
+def test_invalid_magic(write_exr):
+    path = write_exr(b"\0" * 64)
+    with pytest.raises(exr_header.ExrHeaderError):
+        exr_header.read_exr_header(path)
+
+
+def test_truncated_header(write_exr):
+    path = write_exr(_build_exr()[:40])
+    with pytest.raises(exr_header.ExrHeaderError):
+        exr_header.read_exr_header(path)
+
+
+def test_truncated_pixel_data(write_exr):
+    content = _build_exr()
+    path = write_exr(content[:-4])
+    # header alone is valid
+    exr_header.read_exr_header(path)
+    with pytest.raises(exr_header.ExrHeaderError, match="Truncated"):
+        exr_header.read_exr_header(path, check_offsets=True)
+
+
+def test_incomplete_offset_table(write_exr):
+    content = _build_exr()
+    # cut the file in the middle of pixel chunks
+    path = write_exr(content[:-(8 + PIXEL_DATA_SIZE) * 2])
+    with pytest.raises(exr_header.ExrHeaderError, match="offset table"):
+        exr_header.read_exr_header(path, check_offsets=True)
+
+
+def test_truncated_offset_table(write_exr):
+    content = _build_exr()
+    header_size = len(content) - HEIGHT * (8 + 8 + PIXEL_DATA_SIZE)
+    path = write_exr(content[:header_size + 12])
+    with pytest.raises(exr_header.ExrHeaderError):
+        exr_header.read_exr_header(path, check_offsets=True)
@@ -0,0 +1,221 @@
+"""Benchmark of effect nodes creation in Nuke.
+
+Compares the previous creation of effect nodes, which created each node
+with `nuke.createNode()` and set its knobs one by one, with current
+`create_effect_nodes` of `ayon_nuke.api.lib`, which pastes all nodes of
+the effect description from single nuke script.
+
+Effects are generated with animated knobs the same way as published
+effect JSON files. Current functions are compiled from source of
+`lib.py`, because the module itself requires AYON.
+
+Usage:
+    nuke -t tools/benchmark_create_effect_nodes.py [--nodes 300]
+"""
+import argparse
+import ast
+import contextlib
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+try:
+    import nuke
+except ImportError:
+    sys.exit("Benchmark has to run in Nuke, e.g. 'nuke -t {}'".format(
+        " ".join(sys.argv)))
+
+LIB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client", "ayon_nuke", "api", "lib.py"
+)
+LIB_NAMES = {
+    "_EffectKnobNamesCache",
+    "get_animation_curves_script",
+    "set_knob_animation",
+    "get_knob_script_value",
+    "get_node_class_knob_names",
+    "create_effect_nodes",
+    "reset_selection",
+    "node_tempfile",
+}
+IGNORE_KNOBS = ["name", "xpos", "ypos"]
+
+# node class with knob values generators
+EFFECT_KNOBS = {
+    "Grade": {
+        "white": lambda: [round(random.uniform(0.8, 1.2), 4)] * 3 + [1.0],
+        "gamma": lambda: round(random.uniform(0.8, 1.2), 4),
+        "black_clamp": lambda: False,
+    },
+    "ColorCorrect": {
+        "saturation": lambda: round(random.uniform(0.5, 1.5), 4),
+        "contrast": lambda: round(random.uniform(0.8, 1.2), 4),
+        "label": lambda: "shot look",
+    },
+    "Transform": {
+        "translate": lambda: [
+            round(random.uniform(-10, 10), 4) for _ in range(2)],
+        "rotate": lambda: round(random.uniform(-5, 5), 4),
+        "center": lambda: [1024.0, 778.0],
+    },
+    "Saturation": {
+        "saturation": lambda: round(random.uniform(0.5, 1.5), 4),
+    },
+}
+ANIMATED_KNOBS = {
+    "Grade": "gamma",
+    "ColorCorrect": "saturation",
+    "Transform": "rotate",
+    "Saturation": "saturation",
+}
+
+
+def load_current_functions():
+    """Compile current functions from `lib.py` source."""
+    with open(LIB_PATH, "r") as stream:
+        tree = ast.parse(stream.read(), LIB_PATH)
+
+    body = [
+        item
+        for item in tree.body
+        if (
+            isinstance(item, (ast.FunctionDef, ast.ClassDef))
+            and item.name in LIB_NAMES
+        )
+    ]
+    module = ast.Module(body=body, type_ignores=[])
+    namespace = {
+        "nuke": nuke,
+        "os": os,
+        "tempfile": tempfile,
+        "contextlib": contextlib,
+        "defaultdict": defaultdict,
+        "log": logging.getLogger("benchmark"),
+    }
+    exec(compile(module, LIB_PATH, "exec"), namespace)
+    return namespace
+
+
+def generate_effects(count, frames, animated_ratio):
+    """Effects in the shape of published effect JSON."""
+    classes = sorted(EFFECT_KNOBS)
+    effects = []
+    for idx in range(count):
+        node_class = classes[idx % len(classes)]
+        knob_values = {
+            knob_name: generator()
+            for knob_name, generator in EFFECT_KNOBS[node_class].items()
+        }
+        knob_values["name"] = "{}{}".format(node_class, idx)
+        if random.random() < animated_ratio:
+            knob_name = ANIMATED_KNOBS[node_class]
+            knob_values[knob_name] = [
+                round(random.uniform(0.5, 1.5), 4) for _ in range(frames)
+            ]
+        effects.append({"class": node_class, "node": knob_values})
+    return effects
+
+
+def create_effect_nodes_previous(
+    effects, first_frame, ignore_knobs, set_knob_animation
+):
+    """Creation of each node with `nuke.createNode()`."""
+    pre_node = nuke.createNode("Input")
+    pre_node["name"].setValue("rgb")
+
+    for effect in effects:
+        node = nuke.createNode(effect["class"])
+        for k, v in effect["node"].items():
+            if k in ignore_knobs:
+                continue
+
+            try:
+                node[k].value()
+            except NameError:
+                continue
+
+            if isinstance(v, list) and len(v) > 4:
+                set_knob_animation(node[k], [
+                    (first_frame + i, value)
+                    for i, value in enumerate(v)
+                ])
+            else:
+                node[k].setValue(v)
+        node.setInput(0, pre_node)
+        pre_node = node
+
+    output = nuke.createNode("Output")
+    output.setInput(0, pre_node)
+
+
+def measure(func, repeat):
+    """Minimal time of creating effects in new group node."""
+    times = []
+    for _ in range(repeat):
+        group = nuke.nodes.Group()
+        try:
+            with group:
+                start = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - start)
+                node_count = len(nuke.allNodes())
+        finally:
+            nuke.delete(group)
+    return min(times), node_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nodes", type=int, default=300)
+    parser.add_argument(
+        "--frames", type=int, default=100,
+        help="Frames of animated knobs."
+    )
+    parser.add_argument(
+        "--animated", type=float, default=0.2,
+        help="Ratio of nodes with animated knob."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    first_frame = 1001
+    effects = generate_effects(args.nodes, args.frames, args.animated)
+    current = load_current_functions()
+
+    # knob names are cached per session, warm the cache as in second load
+    for node_class in EFFECT_KNOBS:
+        current["get_node_class_knob_names"](node_class)
+
+    previous_time, previous_count = measure(
+        lambda: create_effect_nodes_previous(
+            effects, first_frame, IGNORE_KNOBS,
+            current["set_knob_animation"]
+        ),
+        args.repeat
+    )
+    current_time, current_count = measure(
+        lambda: current["create_effect_nodes"](
+            effects, first_frame, IGNORE_KNOBS),
+        args.repeat
+    )
+    if previous_count != current_count:
+        raise AssertionError(
+            "Different node count {} != {}".format(
+                previous_count, current_count)
+        )
+
+    print("Effects: {}, frames of animated knobs: {}".format(
+        len(effects), args.frames))
+    print("Previous creation: {:.2f} ms".format(previous_time * 1000))
+    print("Current creation:  {:.2f} ms".format(current_time * 1000))
+    print("Speedup:           {:.1f}x".format(previous_time / current_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Micro-benchmark of avalon knob data readers against a stub `nuke`.
+
+Compares the previous reader, which serialized user knobs to TCL and
+asked for type of each knob through `nuke.knob()`, with the current
+`has_avalon_data` and `read_avalon_data` of `ayon_nuke.api.lib` on
+a script of stub nodes, in the same way `ls()` reads top level nodes.
+
+Current functions are compiled from source of `lib.py`, because the
+module itself requires running Nuke and AYON.
+
+Usage:
+    python tools/benchmark_read_avalon_data.py [--nodes 10000]
+"""
+import argparse
+import ast
+import os
+import re
+import sys
+import timeit
+import types
+
+LIB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client", "ayon_nuke", "api", "lib.py"
+)
+LIB_NAMES = {
+    "EXCLUDED_KNOB_TYPE_ON_READ",
+    "EXCLUDED_KNOB_CLASS_ON_READ",
+    "AVALON_KNOB_PREFIXES",
+    "AVALON_DATA_GROUP_SUFFIX",
+    "has_avalon_data",
+    "read_avalon_data",
+}
+
+WRITE_USER_KNOB_DEFS = 4
+KNOB_TYPES = {
+    "String_Knob": 1,
+    "Int_Knob": 3,
+    "Boolean_Knob": 6,
+    "Tab_Knob": 20,
+    "Text_Knob": 26,
+}
+
+
+class Knob(object):
+    def __init__(self, node, name, knob_class, value=None, user=False):
+        self._node = node
+        self._name = name
+        self._class = knob_class
+        self._value = value
+        self.user = user
+
+    def name(self):
+        return self._name
+
+    def Class(self):
+        return self._class
+
+    def value(self):
+        return self._value
+
+    def fullyQualifiedName(self):
+        return "{}.{}".format(self._node.name(), self._name)
+
+
+class Node(object):
+    def __init__(self, name, container=False):
+        self._name = name
+        self._knobs = [
+            Knob(self, "builtin_{}".format(idx), "Double_Knob", 0.0)
+            for idx in range(30)
+        ]
+        if container:
+            self._add_container_knobs()
+        self._knobs_by_name = {knob.name(): knob for knob in self._knobs}
+
+    def _add_container_knobs(self):
+        user_knobs = [
+            Knob(self, "User", "Tab_Knob", user=True),
+            Knob(self, "AyonDataGroup", "Tab_Knob", user=True),
+            Knob(self, "avalon:id", "String_Knob",
+                 "ayon.load.container", True),
+            Knob(self, "avalon:name", "String_Knob", self._name, True),
+            Knob(self, "avalon:namespace", "String_Knob", "sh010", True),
+            Knob(self, "avalon:loader", "String_Knob", "LoadClip", True),
+            Knob(self, "avalon:representation", "String_Knob",
+                 "0123456789abcdef", True),
+            Knob(self, "avalon:version", "Int_Knob", 3, True),
+            Knob(self, "avalon:divider", "Text_Knob", "", True),
+            Knob(self, "avalon:note", "Text_Knob", "read only", True),
+        ]
+        self._knobs.extend(user_knobs)
+
+    def name(self):
+        return self._name
+
+    def allKnobs(self):
+        return list(self._knobs)
+
+    def knob(self, name):
+        return self._knobs_by_name.get(name)
+
+    def writeKnobs(self, flags):
+        return "\n".join(
+            "addUserKnob {{{} {}}}".format(
+                KNOB_TYPES[knob.Class()], knob.name())
+            for knob in self._knobs
+            if knob.user
+        )
+
+
+def create_stub_nuke(nodes):
+    nuke = types.ModuleType("nuke")
+    nuke.WRITE_USER_KNOB_DEFS = WRITE_USER_KNOB_DEFS
+    nodes_by_name = {node.name(): node for node in nodes}
+
+    def knob(fqn, type=False):
+        node_name, knob_name = fqn.split(".", 1)
+        stub_knob = nodes_by_name[node_name].knob(knob_name)
+        return KNOB_TYPES.get(stub_knob.Class(), 0)
+
+    nuke.knob = knob
+    return nuke
+
+
+def load_current_reader(nuke):
+    """Compile current reader functions from `lib.py` source."""
+    with open(LIB_PATH, "r") as stream:
+        tree = ast.parse(stream.read(), LIB_PATH)
+
+    body = []
+    for item in tree.body:
+        if isinstance(item, ast.FunctionDef) and item.name in LIB_NAMES:
+            body.append(item)
+        elif isinstance(item, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id in LIB_NAMES
+            for target in item.targets
+        ):
+            body.append(item)
+
+    module = ast.Module(body=body, type_ignores=[])
+    namespace = {"nuke": nuke, "re": re}
+    exec(compile(module, LIB_PATH, "exec"), namespace)
+    return namespace
+
+
+def create_previous_reader(nuke, excluded_knob_types):
+    """Reader using TCL serialization of user knobs."""
+    def read_avalon_data(node):
+        def compat_prefixed(knob_name):
+            if knob_name.startswith("avalon:"):
+                return knob_name[len("avalon:"):]
+            elif knob_name.startswith("ak:"):
+                return knob_name[len("ak:"):]
+
+        data = dict()
+
+        pattern = ("(?<=addUserKnob {)"
+                   "([0-9]*) (\\S*)"  # Matching knob type and knob name
+                   "(?=[ |}])")
+        tcl_script = node.writeKnobs(nuke.WRITE_USER_KNOB_DEFS)
+        result = re.search(pattern, tcl_script)
+
+        if result:
+            first_user_knob = result.group(2)
+            # Collect user knobs from the end of the knob list
+            for knob in reversed(node.allKnobs()):
+                knob_name = knob.name()
+                if not knob_name:
+                    # Ignore unnamed knob
+                    continue
+
+                knob_type = nuke.knob(knob.fullyQualifiedName(), type=True)
+                value = knob.value()
+
+                if (
+                    knob_type not in excluded_knob_types or
+                    # For compating read-only string data that imprinted
+                    # by `nuke.Text_Knob`.
+                    (knob_type == 26 and value)
+                ):
+                    key = compat_prefixed(knob_name)
+                    if key is not None:
+                        data[key] = value
+
+                if knob_name == first_user_knob:
+                    break
+
+        return data
+    return read_avalon_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument(
+        "--containers", type=float, default=0.05,
+        help="Ratio of container nodes."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    container_step = max(1, int(round(1 / max(args.containers, 1e-6))))
+    nodes = [
+        Node("Node{}".format(idx), container=idx % container_step == 0)
+        for idx in range(args.nodes)
+    ]
+    nuke = create_stub_nuke(nodes)
+    sys.modules["nuke"] = nuke
+
+    current = load_current_reader(nuke)
+    has_avalon_data = current["has_avalon_data"]
+    read_avalon_data = current["read_avalon_data"]
+    previous_read_avalon_data = create_previous_reader(
+        nuke, current["EXCLUDED_KNOB_TYPE_ON_READ"])
+
+    def previous_ls():
+        return [
+            data
+            for data in (previous_read_avalon_data(node) for node in nodes)
+            if data.get("id")
+        ]
+
+    def current_ls():
+        return [
+            read_avalon_data(node)
+            for node in nodes
+            if has_avalon_data(node)
+        ]
+
+    previous_result = previous_ls()
+    current_result = current_ls()
+    if previous_result != current_result:
+        raise AssertionError("Readers returned different data")
+
+    previous_time = min(timeit.repeat(
+        previous_ls, number=1, repeat=args.repeat))
+    current_time = min(timeit.repeat(
+        current_ls, number=1, repeat=args.repeat))
+    print("Nodes: {}, containers: {}".format(
+        len(nodes), len(current_result)))
+    print("Previous reader: {:.2f} ms".format(previous_time * 1000))
+    print("Current reader:  {:.2f} ms".format(current_time * 1000))
+    print("Speedup:         {:.1f}x".format(previous_time / current_time))
+
+
+if __name__ == "__main__":
+    main()